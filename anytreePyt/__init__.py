@@ -8,16 +8,35 @@ __author_email__ = "c0fec0de@gmail.com"
 __description__ = """Powerful and Lightweight Python Tree Data Structure.."""
 __url__ = "https://github.com/c0fec0de/anytreePyt"
 
+import sys
+
+from .predicate import And  # noqa
+from .predicate import AttrEq  # noqa
+from .predicate import AttrIn  # noqa
+from .predicate import AttrRange  # noqa
+from .predicate import Not  # noqa
+from .predicate import Or  # noqa
+from .predicate import Predicate  # noqa
 from .search import CountError  # noqa
+from .search import MemoSearch  # noqa
 from .search import find  # noqa
 from .search import find_by_attr  # noqa
+from .search import find_many_by_attr  # noqa
 from .search import findall  # noqa
 from .search import findall_by_attr  # noqa
+from .search import findall_multi  # noqa
+from .search import iterfind  # noqa
+from .iterators import BestFirstIter  # noqa
+from .iterators import Cursor  # noqa
+from .iterators import CursorError  # noqa
 from .iterators import LevelOrderGroupIter  # noqa
 from .iterators import LevelOrderIter  # noqa
 from .iterators import PostOrderIter  # noqa
 from .iterators import PreOrderIter  # noqa
 from .iterators import ZigZagGroupIter  # noqa
+if sys.version_info >= (3, 6):
+    from .iterators import AsyncLevelOrderIter  # noqa
+    from .iterators import AsyncPreOrderIter  # noqa
 from .node import AnyNode  # noqa
 from .node import LoopError  # noqa
 from .node import Node  # noqa
@@ -32,8 +51,10 @@ from .render import RenderTree  # noqa
 from .resolver import ChildResolverError  # noqa
 from .resolver import Resolver  # noqa
 from .resolver import ResolverError  # noqa
+from .resolver import TreePath  # noqa
 from .walker import WalkError  # noqa
 from .walker import Walker  # noqa
+from . import index  # noqa
 from . import util  # noqa
 
 
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+Tree Indexes.
+
+Indexes trade memory for faster queries on mostly static trees.
+An index covers the subtree of the node it is created for. It is rebuilt
+lazily on the first query after a structural change of the tree.
+
+* :any:`EulerTourIndex`: nested-interval index for ancestor and subtree queries.
+* :any:`AttrIndex`: hash index from attribute values to nodes.
+* :any:`ChildIndex`: hash maps from attribute values to the children of every parent.
+* :any:`RangeIndex`: sorted index on numeric attribute values.
+* :any:`TrieIndex`: prefix tree on string attribute values for prefix and fuzzy search.
+* :any:`LCAIndex`: lowest common ancestor queries in constant time.
+
+Registered indexes (see :any:`AbstractIndex.register`) are used automatically by other tree functions.
+"""
+
+from .abstractindex import AbstractIndex  # noqa
+from .attrindex import AttrIndex  # noqa
+from .childindex import ChildIndex  # noqa
+from .eulertourindex import EulerTourIndex  # noqa
+from .lcaindex import LCAIndex  # noqa
+from .rangeindex import RangeIndex  # noqa
+from .trieindex import TrieIndex  # noqa
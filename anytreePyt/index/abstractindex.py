@@ -0,0 +1,113 @@
+from anytreePyt.node.nodemixin import _unwatch
+from anytreePyt.node.nodemixin import _watch
+
+_MAINTAINED = object()
+# index class -> number of registered indexes of this class and its subclasses
+_REGISTERED = {}
+
+
+class AbstractIndex(object):
+
+    def __init__(self, node):
+        """
+        Base class for all indexes.
+
+        Index the subtree starting at `node`.
+        The index is (re-)built on the first query after any structural change of the tree.
+        Registered incremental indexes are updated on every change instead.
+        Assignments of attributes are only watched while the index is registered,
+        so an unregistered index on an attribute is rebuilt on every query.
+        Assignments are watched via `NodeMixin.__setattr__`. Assignments bypassing it
+        (i.e. a `__setattr__` of another base class, which does not call `super`) are not seen.
+        """
+        self.node = node
+        self.__stamp = None
+
+    _incremental = False
+
+    # names of the indexed attributes
+    _watched = ()
+
+    def register(self):
+        """
+        Register index at `node`.
+
+        Registered indexes are used automatically by searches below `node`.
+        Return the index itself.
+        """
+        if self.node._register_index(self):
+            for cls in _indexclasses(self):
+                _REGISTERED[cls] = _REGISTERED.get(cls, 0) + 1
+            for name in self._watched:
+                _watch(name)
+        return self
+
+    def unregister(self):
+        """Remove index registration at `node` and stop watching attributes."""
+        if self.node._unregister_index(self):
+            for cls in _indexclasses(self):
+                _REGISTERED[cls] -= 1
+            for name in self._watched:
+                _unwatch(name)
+            if self.__stamp is _MAINTAINED:
+                self.__stamp = None
+
+    def __del__(self):
+        # an index registered at a dropped tree
+        self.unregister()
+
+    @property
+    def _registered(self):
+        """Index is registered at `node`. Copies of a registered index are not."""
+        return any(index is self for index in self.node._indexes)
+
+    @property
+    def _maintained(self):
+        """Index is built and kept up to date by change notifications."""
+        return self.__stamp is _MAINTAINED
+
+    def _update(self):
+        """Rebuild index if the tree changed since the last build."""
+        if self._incremental and self._registered:
+            stamp = _MAINTAINED
+        else:
+            stamp = self._stamp()
+        if stamp != self.__stamp:
+            self._build(self.node)
+            self.__stamp = stamp
+
+    def _stamp(self):
+        """Return value, which changes whenever the index content may change."""
+        return self.node._version
+
+    def _build(self, node):
+        raise NotImplementedError()  # pragma: no cover
+
+    def _attached(self, node):
+        """Notification: `node` has been attached within the indexed subtree."""
+        pass
+
+    def _detached(self, node):
+        """Notification: `node` has been detached from the indexed subtree."""
+        pass
+
+    def _assigned(self, node, name):
+        """Notification: watched attribute `name` of `node` within the indexed subtree has been assigned."""
+        pass
+
+    @classmethod
+    def _lookup(cls, node, match=None):
+        """Return the nearest index of type `cls` registered at `node` or any of its ancestors."""
+        if not _REGISTERED.get(cls):
+            return None
+        while node is not None:
+            for index in node._indexes:
+                if isinstance(index, cls) and (match is None or match(index)):
+                    return index
+            node = node.parent
+        return None
+
+
+def _indexclasses(index):
+    """Return the index classes `index` is an instance of."""
+    return [cls for cls in type(index).__mro__ if issubclass(cls, AbstractIndex)]
@@ -0,0 +1,139 @@
+from anytreePyt.iterators import PreOrderIter
+from anytreePyt.node.nodemixin import _watched_version
+
+from .abstractindex import AbstractIndex
+from .eulertourindex import EulerTourIndex
+
+_MISSING = object()
+
+
+class AttrIndex(AbstractIndex):
+
+    def __init__(self, node, name="name"):
+        """
+        Hash index on attribute `name` of all nodes in the subtree of `node`.
+
+        Map attribute values to nodes.
+        A registered index is kept up to date on attach, detach and on assignments of `name`.
+        :any:`find_by_attr`, :any:`findall_by_attr` and searches with :any:`AttrEq` use
+        registered indexes automatically.
+
+        >>> from anytreePyt import Node, find_by_attr
+        >>> from anytreePyt.index import AttrIndex
+        >>> f = Node("f")
+        >>> b = Node("b", parent=f, uid=1)
+        >>> a = Node("a", parent=b, uid=2)
+        >>> d = Node("d", parent=b, uid=3)
+        >>> index = AttrIndex(f, "uid").register()
+        >>> index.lookup(2)
+        (Node('/f/b/a', uid=2),)
+        >>> find_by_attr(f, 3, name="uid")
+        Node('/f/b/d', uid=3)
+        >>> d.uid = 4
+        >>> find_by_attr(f, 3, name="uid")
+        >>> find_by_attr(f, 4, name="uid")
+        Node('/f/b/d', uid=4)
+        """
+        super(AttrIndex, self).__init__(node)
+        self.name = name
+        self.__order = EulerTourIndex(node)
+
+    _incremental = True
+
+    @property
+    def _watched(self):
+        return (self.name,)
+
+    def _stamp(self):
+        return self.node._version, _watched_version(self.name)
+
+    def _build(self, node):
+        self._nodes = {}
+        self._values = {}
+        self._unhashable = {}
+        for descendant in PreOrderIter(node):
+            self.__add(descendant)
+
+    def __add(self, node):
+        value = getattr(node, self.name, _MISSING)
+        if value is not _MISSING:
+            key = id(node)
+            try:
+                self._nodes.setdefault(value, {})[key] = node
+            except TypeError:
+                self._unhashable[key] = node
+            else:
+                self._values[key] = value
+
+    def __remove(self, node):
+        key = id(node)
+        try:
+            value = self._values.pop(key)
+        except KeyError:
+            self._unhashable.pop(key, None)
+        else:
+            nodes = self._nodes[value]
+            del nodes[key]
+            if not nodes:
+                del self._nodes[value]
+
+    def _attached(self, node):
+        if self._maintained:
+            for descendant in PreOrderIter(node):
+                self.__add(descendant)
+
+    def _detached(self, node):
+        if self._maintained:
+            for descendant in PreOrderIter(node):
+                self.__remove(descendant)
+
+    def _assigned(self, node, name):
+        if self._maintained and name == self.name:
+            self.__remove(node)
+            self.__add(node)
+
+    def lookup(self, value):
+        """
+        Return nodes with attribute `name` equal to `value` in pre-order.
+
+        Raises:
+            TypeError: if `value` is not hashable.
+        """
+        self._update()
+        hash(value)
+        return tuple(self._find(self.node, value))
+
+    def _covers(self, value):
+        """Return `True` if the index can answer queries for `value`."""
+        self._update()
+        if self._unhashable:
+            return False
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return True
+
+    def _find(self, node, value, maxlevel=None):
+        """Return nodes below `node` up to `maxlevel` with attribute `name` equal to `value` in pre-order."""
+        self._update()
+        candidates = list(self._nodes.get(value, {}).values())
+        if node is not self.node or maxlevel is not None:
+            candidates = [candidate for candidate in candidates if _within(candidate, node, maxlevel)]
+        if len(candidates) > 1:
+            candidates = self.__order.sort(candidates)
+        return candidates
+
+    def __repr__(self):
+        return "AttrIndex(%r, %r)" % (self.node, self.name)
+
+
+def _within(node, top, maxlevel):
+    """Return `True` if `node` is `top` or one of its descendants up to `maxlevel`."""
+    level = 1
+    while node is not None:
+        if node is top:
+            return maxlevel is None or level <= maxlevel
+        node = node.parent
+        level += 1
+    return False
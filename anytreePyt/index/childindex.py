@@ -0,0 +1,44 @@
+from .abstractindex import AbstractIndex
+
+
+class ChildIndex(AbstractIndex):
+
+    def __init__(self, node, name="name"):
+        """
+        Hash maps from attribute `name` to the children of the parents in the subtree of `node`.
+
+        While the index is registered, parents with many children keep a map from `name` to their children,
+        which is built on the first lookup and maintained on attach, detach and on assignments of `name`.
+        A :any:`Resolver` with `pathattr` `name` uses a registered index for all lookups below `node`,
+        which take O(1) per path element instead of a scan over all children.
+        An unregistered index scans the children on every lookup.
+
+        >>> from anytreePyt import Node, Resolver
+        >>> from anytreePyt.index import ChildIndex
+        >>> top = Node("top")
+        >>> sub0 = Node("sub0", parent=top)
+        >>> sub1 = Node("sub1", parent=top)
+        >>> index = ChildIndex(top).register()
+        >>> index.lookup(top, "sub1")
+        (Node('/top/sub1'),)
+        >>> sub1.name = "renamed"
+        >>> Resolver().get(top, "renamed")
+        Node('/top/renamed')
+        """
+        super(ChildIndex, self).__init__(node)
+        self.name = name
+
+    @property
+    def _watched(self):
+        return (self.name,)
+
+    def _build(self, node):
+        # the maps are kept at the parents
+        pass
+
+    def lookup(self, parent, value):
+        """Return the children of `parent` with attribute `name` equal to `value` in children order."""
+        return parent._children_by(self.name, value)
+
+    def __repr__(self):
+        return "ChildIndex(%r, %r)" % (self.node, self.name)
@@ -0,0 +1,140 @@
+from anytreePyt.node import TreeError
+from anytreePyt.predicate import _compile
+
+from .abstractindex import AbstractIndex
+
+
+class EulerTourIndex(AbstractIndex):
+
+    """
+    Nested-interval index.
+
+    Every node is numbered in pre-order on enter. The exit number is the enter number
+    of the next node outside the subtree. A node is an ancestor of another node if its
+    interval encloses the interval of the other node.
+    Built within one pass over the tree.
+
+    >>> from anytreePyt import Node
+    >>> from anytreePyt.index import EulerTourIndex
+    >>> f = Node("f")
+    >>> b = Node("b", parent=f)
+    >>> a = Node("a", parent=b)
+    >>> d = Node("d", parent=b)
+    >>> c = Node("c", parent=d)
+    >>> e = Node("e", parent=d)
+    >>> g = Node("g", parent=f)
+    >>> index = EulerTourIndex(f)
+    >>> index.interval(d)
+    (3, 6)
+    >>> index.is_ancestor(b, e)
+    True
+    >>> index.is_ancestor(g, e)
+    False
+    >>> index.subtree_size(b)
+    5
+    >>> index.subtree_slice(d)
+    (Node('/f/b/d'), Node('/f/b/d/c'), Node('/f/b/d/e'))
+
+    The index follows tree modifications:
+
+    >>> d.parent = g
+    >>> index.is_ancestor(b, e)
+    False
+    >>> index.subtree_size(b)
+    2
+    """
+
+    def _build(self, node):
+        nodes = []
+        positions = {}
+        parents = []
+        depths = []
+        stack = [(node, -1, 0)]
+        while stack:
+            node, parent, depth = stack.pop()
+            position = len(nodes)
+            positions[id(node)] = position
+            nodes.append(node)
+            parents.append(parent)
+            depths.append(depth)
+            depth += 1
+            stack.extend([(child, position, depth) for child in reversed(node.children)])
+        exits = [1] * len(nodes)
+        for position in range(len(nodes) - 1, 0, -1):
+            exits[parents[position]] += exits[position]
+        for position, size in enumerate(exits):
+            exits[position] = position + size
+        self._nodes = nodes
+        self._positions = positions
+        self._parents = parents
+        self._depths = depths
+        self._exits = exits
+
+    def __len__(self):
+        self._update()
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        self._update()
+        return id(node) in self._positions
+
+    def _position(self, node):
+        try:
+            return self._positions[id(node)]
+        except KeyError:
+            raise TreeError("%r is not part of the index." % (node,))
+
+    def interval(self, node):
+        """Return enter and exit number of `node`."""
+        self._update()
+        position = self._position(node)
+        return position, self._exits[position]
+
+    def is_ancestor(self, ancestor, node):
+        """Return `True` if `ancestor` is an ancestor of `node`. A node is not an ancestor of itself."""
+        self._update()
+        positions = self._positions
+        try:
+            outer = positions[id(ancestor)]
+            inner = positions[id(node)]
+        except KeyError:
+            return False
+        return outer < inner < self._exits[outer]
+
+    def subtree_size(self, node):
+        """Return number of nodes in the subtree of `node`, including `node`."""
+        self._update()
+        position = self._position(node)
+        return self._exits[position] - position
+
+    def subtree_slice(self, node):
+        """Return all nodes of the subtree of `node` in pre-order, starting with `node`."""
+        self._update()
+        position = self._position(node)
+        return tuple(self._nodes[position:self._exits[position]])
+
+    def sort(self, nodes):
+        """Return `nodes` sorted in pre-order."""
+        self._update()
+        positions = self._positions
+        return sorted(nodes, key=lambda node: positions[id(node)])
+
+    def depth(self, node):
+        """Return depth of `node` relative to the indexed node."""
+        self._update()
+        return self._depths[self._position(node)]
+
+    def _iter(self, node, filter_=None, maxlevel=None):
+        """Iterate over the subtree of `node` in pre-order like :any:`PreOrderIter` without `stop`."""
+        self._update()
+        start = self._position(node)
+        positions = range(start, self._exits[start])
+        nodes = self._nodes
+        if maxlevel is not None:
+            depths = self._depths
+            limit = depths[start] + maxlevel
+            positions = (position for position in positions if depths[position] < limit)
+        filter_ = _compile(filter_)
+        if filter_ is not None:
+            return (nodes[position] for position in positions if filter_(nodes[position]))
+        return (nodes[position] for position in positions)
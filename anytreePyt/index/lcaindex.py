@@ -0,0 +1,73 @@
+from .eulertourindex import EulerTourIndex
+
+
+class LCAIndex(EulerTourIndex):
+
+    """
+    Lowest common ancestor index.
+
+    Extends the :any:`EulerTourIndex` by a sparse table over the node depths in pre-order.
+    The lowest common ancestor of two nodes is the parent of the least deep node
+    between them in pre-order, which is found with two table lookups.
+    Built in O(n log n), queries take O(1).
+
+    A registered index is used by :any:`Walker` and :any:`commonancestors`.
+
+    >>> from anytreePyt import Node
+    >>> from anytreePyt.index import LCAIndex
+    >>> f = Node("f")
+    >>> b = Node("b", parent=f)
+    >>> a = Node("a", parent=b)
+    >>> d = Node("d", parent=b)
+    >>> c = Node("c", parent=d)
+    >>> e = Node("e", parent=d)
+    >>> g = Node("g", parent=f)
+    >>> index = LCAIndex(f)
+    >>> index.lca(c, e)
+    Node('/f/b/d')
+    >>> index.lca(a, c, e)
+    Node('/f/b')
+    >>> index.lca(b, e)
+    Node('/f/b')
+    >>> index.lca(e, g)
+    Node('/f')
+    """
+
+    def _build(self, node):
+        super(LCAIndex, self)._build(node)
+        # level k holds the minimum of depth * size + position over 2 ** k positions
+        size = len(self._nodes)
+        level = [depth * size + position for position, depth in enumerate(self._depths)]
+        table = [level]
+        width = 1
+        while 2 * width <= size:
+            level = list(map(min, level, level[width:]))
+            table.append(level)
+            width *= 2
+        self._table = table
+
+    def lca(self, *nodes):
+        """
+        Return the lowest common ancestor of `nodes`.
+
+        A node is the lowest common ancestor of itself and its descendants.
+        """
+        self._update()
+        nodes = iter(nodes)
+        first = self._position(next(nodes))
+        for node in nodes:
+            first = self._lca(first, self._position(node))
+        return self._nodes[first]
+
+    def _lca(self, first, second):
+        """Return position of the lowest common ancestor of the nodes at the positions `first` and `second`."""
+        if first == second:
+            return first
+        if first > second:
+            first, second = second, first
+        # least deep node within (first, second]
+        first += 1
+        level = (second - first + 1).bit_length() - 1
+        row = self._table[level]
+        key = min(row[first], row[second - (1 << level) + 1])
+        return self._parents[key % len(self._nodes)]
@@ -0,0 +1,192 @@
+import numbers
+from bisect import bisect_left
+from bisect import bisect_right
+from heapq import nlargest
+from heapq import nsmallest
+
+from anytreePyt.node.nodemixin import _watched_version
+
+from .abstractindex import AbstractIndex
+from .eulertourindex import EulerTourIndex
+
+_MISSING = object()
+_INF = float("inf")
+
+
+class RangeIndex(AbstractIndex):
+
+    def __init__(self, node, name):
+        """
+        Sorted index on the numeric attribute `name` of all nodes in the subtree of `node`.
+
+        Supports range queries, counts and top-k, optionally restricted to the subtree of a node.
+        Nodes without a numeric `name` attribute are not indexed.
+        A registered index is rebuilt on the first query after a structural change or an assignment of `name`.
+        Searches with :any:`AttrRange` use registered indexes automatically,
+        as long as all `name` attributes in the subtree are numbers or `None`.
+
+        >>> from anytreePyt import Node
+        >>> from anytreePyt.index import RangeIndex
+        >>> f = Node("f", score=5)
+        >>> b = Node("b", parent=f, score=2)
+        >>> a = Node("a", parent=b, score=9)
+        >>> d = Node("d", parent=b, score=4)
+        >>> g = Node("g", parent=f, score=7)
+        >>> index = RangeIndex(f, "score").register()
+        >>> [node.name for node in index.range(3, 7)]
+        ['d', 'f', 'g']
+        >>> [node.name for node in index.range(3, 7, node=b)]
+        ['d']
+        >>> index.count(lower=5)
+        3
+        >>> [node.name for node in index.top(2)]
+        ['a', 'g']
+        >>> [node.name for node in index.bottom(2, node=b)]
+        ['b', 'd']
+        """
+        super(RangeIndex, self).__init__(node)
+        self.name = name
+        self.__order = EulerTourIndex(node)
+
+    @property
+    def _watched(self):
+        return (self.name,)
+
+    def _stamp(self):
+        return self.node._version, _watched_version(self.name)
+
+    def _build(self, node):
+        order = self.__order
+        order._update()
+        name = self.name
+        values = []
+        entries = []
+        unindexed = 0
+        for position, descendant in enumerate(order._nodes):
+            value = getattr(descendant, name, _MISSING)
+            if isinstance(value, numbers.Real):
+                if value == value:
+                    values.append(value)
+                    entries.append((value, position))
+                    continue
+            elif value is not _MISSING and value is not None:
+                # not indexed, but maybe within range for `AttrRange`, like `Decimal`
+                unindexed += 1
+            values.append(_MISSING)
+        self._unindexed = unindexed
+        entries.sort()
+        self._values = values
+        self._keys = [value for value, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def __interval(self, node):
+        if node is None or node is self.node:
+            return 0, len(self._values)
+        return self.__order.interval(node)
+
+    def __bounds(self, lower, upper):
+        keys = self._keys
+        start = 0 if lower is None else bisect_left(keys, lower)
+        end = len(keys) if upper is None else bisect_right(keys, upper)
+        return start, max(start, end)
+
+    def __select(self, lower, upper, node):
+        """Return (value, position) of all matches in the subtree of `node` in arbitrary order."""
+        first, last = self.__interval(node)
+        start, end = self.__bounds(lower, upper)
+        if end - start <= last - first:
+            # less candidates in value range than nodes in the subtree
+            keys, positions = self._keys, self._positions
+            return [(keys[idx], positions[idx]) for idx in range(start, end) if first <= positions[idx] < last]
+        values = self._values
+        lower = -_INF if lower is None else lower
+        upper = _INF if upper is None else upper
+        return [(values[position], position) for position in range(first, last)
+                if values[position] is not _MISSING and lower <= values[position] <= upper]
+
+    def range(self, lower=None, upper=None, node=None):
+        """
+        Return nodes with `lower` <= value <= `upper`, sorted by value.
+
+        Keyword Args:
+            lower: lower bound (inclusive). `None` is unlimited.
+            upper: upper bound (inclusive). `None` is unlimited.
+            node: restrict to the subtree of `node`.
+        """
+        self._update()
+        nodes = self.__order._nodes
+        return tuple(nodes[position] for _, position in sorted(self.__select(lower, upper, node)))
+
+    def count(self, lower=None, upper=None, node=None):
+        """Return number of nodes with `lower` <= value <= `upper`, optionally within subtree of `node`."""
+        self._update()
+        first, last = self.__interval(node)
+        start, end = self.__bounds(lower, upper)
+        if first == 0 and last == len(self._values):
+            return end - start
+        return len(self.__select(lower, upper, node))
+
+    def top(self, k, node=None):
+        """Return the `k` nodes with the largest values in descending order, optionally within subtree of `node`."""
+        return self.__extreme(k, node, True)
+
+    def bottom(self, k, node=None):
+        """Return the `k` nodes with the smallest values in ascending order, optionally within subtree of `node`."""
+        return self.__extreme(k, node, False)
+
+    def __extreme(self, k, node, largest):
+        self._update()
+        keys, positions, nodes = self._keys, self._positions, self.__order._nodes
+        first, last = self.__interval(node)
+        size = last - first
+        count = len(keys)
+        if size * size <= k * count:
+            # small subtree: select from subtree
+            values = self._values
+            entries = [(values[position], -position if largest else position) for position in range(first, last)
+                       if values[position] is not _MISSING]
+            select = nlargest if largest else nsmallest
+            return tuple(nodes[abs(position)] for _, position in select(k, entries))
+        # large subtree: walk sorted values from the requested end
+        result = []
+        # keep pre-order for equal values
+        indexes = _stable_reversed(keys) if largest else range(count)
+        for idx in indexes:
+            if len(result) >= k:
+                break
+            if first <= positions[idx] < last:
+                result.append(nodes[positions[idx]])
+        return tuple(result)
+
+    def _covers(self, lower, upper):
+        """Return `True` if the index can answer range queries for `lower` and `upper` like :any:`AttrRange`."""
+        bounds = [bound for bound in (lower, upper) if bound is not None]
+        if not bounds or not all(isinstance(bound, numbers.Real) for bound in bounds):
+            return False
+        self._update()
+        return not self._unindexed
+
+    def _find(self, node, lower, upper, maxlevel=None):
+        """Return nodes below `node` up to `maxlevel` in value range in pre-order."""
+        self._update()
+        order = self.__order
+        positions = sorted(position for _, position in self.__select(lower, upper, node))
+        if maxlevel is not None:
+            depths = order._depths
+            limit = order.depth(node) + maxlevel
+            positions = [position for position in positions if depths[position] < limit]
+        nodes = order._nodes
+        return [nodes[position] for position in positions]
+
+    def __repr__(self):
+        return "RangeIndex(%r, %r)" % (self.node, self.name)
+
+
+def _stable_reversed(keys):
+    """Return indexes of the sorted `keys` in descending order, keeping the original order of equal keys."""
+    end = len(keys)
+    while end > 0:
+        start = bisect_left(keys, keys[end - 1], 0, end)
+        for idx in range(start, end):
+            yield idx
+        end = start
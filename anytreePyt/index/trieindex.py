@@ -0,0 +1,171 @@
+import six
+
+from anytreePyt.iterators import PreOrderIter
+from anytreePyt.node.nodemixin import _watched_version
+
+from .abstractindex import AbstractIndex
+
+_MISSING = object()
+
+
+class _Trie(object):
+
+    __slots__ = ("children", "nodes")
+
+    def __init__(self):
+        self.children = {}
+        self.nodes = {}
+
+
+class TrieIndex(AbstractIndex):
+
+    def __init__(self, node, name="name"):
+        """
+        Prefix tree on the string attribute `name` of all nodes in the subtree of `node`.
+
+        Supports prefix, longest-prefix and bounded edit-distance lookups.
+        The lookup costs depend on the length of the search string and the number of results,
+        not on the size of the tree.
+        Nodes without a string `name` attribute are not indexed.
+        A registered index is kept up to date on attach, detach and on assignments of `name`.
+
+        >>> from anytreePyt import Node
+        >>> from anytreePyt.index import TrieIndex
+        >>> root = Node("root")
+        >>> s0 = Node("sub", parent=root)
+        >>> s1 = Node("subway", parent=root)
+        >>> s2 = Node("submarine", parent=s0)
+        >>> s3 = Node("bus", parent=s0)
+        >>> index = TrieIndex(root).register()
+        >>> [node.name for node in index.prefix("sub")]
+        ['sub', 'submarine', 'subway']
+        >>> [node.name for node in index.longest_prefix("subwayline")]
+        ['subway']
+        >>> [node.name for node in index.fuzzy("sbway", 1)]
+        ['subway']
+        """
+        super(TrieIndex, self).__init__(node)
+        self.name = name
+
+    _incremental = True
+
+    @property
+    def _watched(self):
+        return (self.name,)
+
+    def _stamp(self):
+        return self.node._version, _watched_version(self.name)
+
+    def _build(self, node):
+        self._trie = _Trie()
+        self._keys = {}
+        for descendant in PreOrderIter(node):
+            self.__add(descendant)
+
+    def __add(self, node):
+        key = getattr(node, self.name, _MISSING)
+        if isinstance(key, six.string_types):
+            trie = self._trie
+            for char in key:
+                try:
+                    trie = trie.children[char]
+                except KeyError:
+                    trie.children[char] = trie = _Trie()
+            trie.nodes[id(node)] = node
+            self._keys[id(node)] = key
+
+    def __remove(self, node):
+        key = self._keys.pop(id(node), None)
+        if key is not None:
+            path = [self._trie]
+            for char in key:
+                path.append(path[-1].children[char])
+            del path[-1].nodes[id(node)]
+            # drop empty branches
+            for idx in range(len(key), 0, -1):
+                trie = path[idx]
+                if trie.nodes or trie.children:
+                    break
+                del path[idx - 1].children[key[idx - 1]]
+
+    def _attached(self, node):
+        if self._maintained:
+            for descendant in PreOrderIter(node):
+                self.__add(descendant)
+
+    def _detached(self, node):
+        if self._maintained:
+            for descendant in PreOrderIter(node):
+                self.__remove(descendant)
+
+    def _assigned(self, node, name):
+        if self._maintained and name == self.name:
+            self.__remove(node)
+            self.__add(node)
+
+    def __find(self, key):
+        trie = self._trie
+        for char in key:
+            trie = trie.children.get(char)
+            if trie is None:
+                break
+        return trie
+
+    def prefix(self, prefix, limit=None):
+        """
+        Return nodes with `name` starting with `prefix`, sorted by `name`.
+
+        Keyword Args:
+            limit (int): maximum number of nodes.
+        """
+        self._update()
+        result = []
+        trie = self.__find(prefix)
+        if trie is not None:
+            stack = [trie]
+            while stack and (limit is None or len(result) < limit):
+                trie = stack.pop()
+                result.extend(trie.nodes.values())
+                stack.extend(trie.children[char] for char in sorted(trie.children, reverse=True))
+        return tuple(result[:limit])
+
+    def longest_prefix(self, string):
+        """Return nodes with the longest `name`, which is a prefix of `string`."""
+        self._update()
+        trie = self._trie
+        result = trie.nodes
+        for char in string:
+            trie = trie.children.get(char)
+            if trie is None:
+                break
+            if trie.nodes:
+                result = trie.nodes
+        return tuple(result.values())
+
+    def fuzzy(self, string, maxdist):
+        """
+        Return nodes with `name` within the edit distance `maxdist` to `string`.
+
+        The edit distance counts inserted, deleted and replaced characters.
+        Nodes are sorted by distance and `name`.
+        """
+        self._update()
+        matches = []
+        firstrow = list(range(len(string) + 1))
+        if firstrow[-1] <= maxdist:
+            matches.extend((firstrow[-1], "", node) for node in self._trie.nodes.values())
+        stack = [(self._trie.children[char], char, char, firstrow) for char in sorted(self._trie.children)]
+        while stack:
+            trie, char, key, prevrow = stack.pop()
+            row = [prevrow[0] + 1]
+            for idx, strchar in enumerate(string, 1):
+                row.append(min(row[idx - 1] + 1, prevrow[idx] + 1, prevrow[idx - 1] + (strchar != char)))
+            if row[-1] <= maxdist:
+                matches.extend((row[-1], key, node) for node in trie.nodes.values())
+            if min(row) <= maxdist:
+                stack.extend((trie.children[nextchar], nextchar, key + nextchar, row) for nextchar in trie.children)
+        matches.sort(key=lambda match: match[:2])
+        return tuple(node for _, _, node in matches)
+
+    def __repr__(self):
+        return "TrieIndex(%r, %r)" % (self.node, self.name)
@@ -7,11 +7,27 @@ Tree Iteration.
 * :any:`LevelOrderIter`: iterate over tree using level-order strategy
 * :any:`LevelOrderGroupIter`: iterate over tree using level-order strategy returning group for every level
 * :any:`ZigZagGroupIter`: iterate over tree using level-order strategy returning group for every level
+* :any:`BestFirstIter`: iterate over tree in descending score order, skipping subtrees by score bound
+
+On Python 3.6 and newer, :any:`AsyncPreOrderIter` and :any:`AsyncLevelOrderIter`
+iterate over trees with asynchronously fetched children.
+
+Depth-first iterations (:any:`PreOrderIter`, :any:`PostOrderIter`) can be checkpointed
+via their :any:`Cursor` and continued later on.
 """
 
+import sys
+
 from .abstractiter import AbstractIter  # noqa
+from .bestfirstiter import BestFirstIter  # noqa
+from .cursor import Cursor  # noqa
+from .cursor import CursorError  # noqa
 from .levelordergroupiter import LevelOrderGroupIter  # noqa
 from .levelorderiter import LevelOrderIter  # noqa
 from .postorderiter import PostOrderIter  # noqa
 from .preorderiter import PreOrderIter  # noqa
 from .zigzaggroupiter import ZigZagGroupIter  # noqa
+
+if sys.version_info >= (3, 6):
+    from .asynclevelorderiter import AsyncLevelOrderIter  # noqa
+    from .asyncpreorderiter import AsyncPreOrderIter  # noqa
@@ -1,5 +1,12 @@
+from itertools import islice
+
 import six
 
+from anytreePyt.predicate import _compile
+
+from .cursor import Cursor
+from .cursor import CursorError
+
 
 class AbstractIter(six.Iterator):
 
@@ -13,21 +20,107 @@ class AbstractIter(six.Iterator):
             filter_: function called with every `node` as argument, `node` is returned if `True`.
             stop: stop iteration at `node` if `stop` function returns `True` for `node`.
             maxlevel (int): maximum decending in the node hierarchy.
+
+        `filter_` and `stop` may also be a :any:`Predicate`, which is compiled once per iteration.
         """
         self.node = node
         self.filter_ = filter_
         self.stop = stop
         self.maxlevel = maxlevel
         self.__iter = None
+        self.__start = None
+        self._trail = None
+        self._done = False
+
+    @classmethod
+    def resume(cls, node, cursor, filter_=None, stop=None, maxlevel=None):
+        """
+        Continue iteration from `node` behind the position of `cursor`.
+
+        `node`, `filter_`, `stop` and `maxlevel` have to be identical to the ones
+        of the iteration, which created `cursor`.
+
+        Raises:
+            CursorError: if `cursor` was created by another strategy or does not fit to the tree.
+        """
+        if not cls._resumable:
+            raise CursorError("%s does not support cursors." % cls.__name__)
+        if cursor.strategy != cls.__name__:
+            raise CursorError("Cannot resume %s from %r." % (cls.__name__, cursor))
+        iter_ = cls(node, filter_=filter_, stop=stop, maxlevel=maxlevel)
+        iter_.__start = cursor
+        return iter_
+
+    @property
+    def cursor(self):
+        """
+        :any:`Cursor` behind the last visited node.
+
+        Nodes rejected by `filter_` are visited too.
+        Only depth-first strategies support cursors.
+
+        Raises:
+            CursorError: if the iterator does not support cursors.
+        """
+        if not self._resumable:
+            raise CursorError("%s does not support cursors." % self.__class__.__name__)
+        strategy = self.__class__.__name__
+        if self._done:
+            return Cursor(strategy, done=True)
+        if self._trail is None:
+            start = self.__start
+            return Cursor(strategy, start.path, start.done) if start else Cursor(strategy)
+        return Cursor(strategy, tuple(self._trail))
+
+    _resumable = False
 
     def __init(self):
         node = self.node
         maxlevel = self.maxlevel
-        filter_ = self.filter_ or AbstractIter.__default_filter
-        stop = self.stop or AbstractIter.__default_stop
+        filter_ = _compile(self.filter_) or AbstractIter.__default_filter
+        stop = _compile(self.stop) or AbstractIter.__default_stop
+        if self._resumable:
+            self._trail = None
+            self._done = False
+            start = self.__start
+            if start is None:
+                return self._iter_path(node, None, filter_, stop, maxlevel)
+            elif start.done:
+                return iter([])
+            return self._iter_path(node, start.path, filter_, stop, maxlevel)
         children = [] if AbstractIter._abort_at_level(1, maxlevel) else AbstractIter._get_children([node], stop)
         return self._iter(children, filter_, stop, maxlevel)
 
+    def iter_chunks(self, size):
+        """
+        Iterate in chunks.
+
+        Return lists of up to `size` nodes (or groups for grouping strategies) instead of single ones.
+        Batch consumers avoid the per-node overhead of the iteration protocol.
+
+        >>> from anytreePyt import Node, PreOrderIter
+        >>> f = Node("f")
+        >>> b = Node("b", parent=f)
+        >>> a = Node("a", parent=b)
+        >>> d = Node("d", parent=b)
+        >>> g = Node("g", parent=f)
+        >>> [[node.name for node in chunk] for chunk in PreOrderIter(f).iter_chunks(2)]
+        [['f', 'b'], ['a', 'd'], ['g']]
+
+        The :any:`cursor` is located behind the last node of the most recent chunk.
+        """
+        if size < 1:
+            raise ValueError("Chunk size must be at least 1, not %r." % (size,))
+        return AbstractIter.__chunks(self.__init(), size)
+
+    @staticmethod
+    def __chunks(iter_, size):
+        while True:
+            chunk = list(islice(iter_, size))
+            if not chunk:
+                break
+            yield chunk
+
     @staticmethod
     def __default_filter(node):
         return True
@@ -48,6 +141,23 @@ class AbstractIter(six.Iterator):
     def _iter(children, filter_, stop, maxlevel):
         raise NotImplementedError()  # pragma: no cover
 
+    def _iter_path(self, node, path, filter_, stop, maxlevel):
+        raise NotImplementedError()  # pragma: no cover
+
+    @staticmethod
+    def _descend(node, path):
+        """Return nodes and sibling tuples along the child indices `path` starting at `node`."""
+        nodes = [node]
+        siblings = []
+        for index in path:
+            children = node.children
+            if not 0 <= index < len(children):
+                raise CursorError("Cursor path %r does not fit to tree at %r." % (path, node))
+            node = children[index]
+            nodes.append(node)
+            siblings.append(children)
+        return nodes, siblings
+
     @staticmethod
     def _abort_at_level(level, maxlevel):
         return maxlevel is not None and level > maxlevel
@@ -0,0 +1,110 @@
+import asyncio
+from collections import deque
+
+from anytreePyt.predicate import _compile
+
+
+class AsyncAbstractIter(object):
+
+    def __init__(self, node, children=None, filter_=None, stop=None, maxlevel=None, concurrency=8):
+        """
+        Base class for all asynchronous iterators.
+
+        Iterate over tree starting at `node` via `async for`.
+        Children are fetched via the coroutine function `children`.
+        Children of already known nodes are prefetched concurrently.
+        At most `concurrency` fetches run at a time, all further fetches wait in a queue.
+
+        Keyword Args:
+            children: coroutine function called with a `node` as argument returning its children.
+                      By default the `children` attribute is used.
+            filter_: function called with every `node` as argument, `node` is returned if `True`.
+            stop: stop iteration at `node` if `stop` function returns `True` for `node`.
+            maxlevel (int): maximum decending in the node hierarchy.
+            concurrency (int): maximum number of concurrent `children` calls.
+        """
+        self.node = node
+        self.children = children or AsyncAbstractIter.__default_children
+        self.filter_ = filter_
+        self.stop = stop
+        self.maxlevel = maxlevel
+        self.concurrency = concurrency
+
+    @staticmethod
+    async def __default_children(node):
+        return node.children
+
+    @staticmethod
+    def __default_filter(node):
+        return True
+
+    @staticmethod
+    def __default_stop(node):
+        return False
+
+    def __aiter__(self):
+        filter_ = _compile(self.filter_) or AsyncAbstractIter.__default_filter
+        stop = _compile(self.stop) or AsyncAbstractIter.__default_stop
+        return self._iter(self.node, filter_, stop, self.maxlevel)
+
+    def _fetcher(self):
+        """Return fetcher for the children. Must be called within the running event loop."""
+        return _Fetcher(self.children, self.concurrency)
+
+    async def _iter(self, node, filter_, stop, maxlevel):
+        raise NotImplementedError()  # pragma: no cover
+        yield  # pragma: no cover
+
+    @staticmethod
+    def _abort_at_level(level, maxlevel):
+        return maxlevel is not None and level > maxlevel
+
+
+class _Fetcher(object):
+
+    def __init__(self, children, concurrency):
+        self.children = children
+        self.concurrency = concurrency
+        self.tasks = set()
+        # (node, future) of the fetches waiting for a free slot
+        self.pending = deque()
+
+    def schedule(self, node):
+        """Fetch the children of `node`, as soon as less than `concurrency` fetches run, and return the future."""
+        future = asyncio.get_event_loop().create_future()
+        self.pending.append((node, future))
+        self.__start()
+        return future
+
+    def __start(self):
+        while self.pending and len(self.tasks) < self.concurrency:
+            node, future = self.pending.popleft()
+            if not future.cancelled():
+                task = asyncio.ensure_future(self.__fetch(node, future))
+                self.tasks.add(task)
+                task.add_done_callback(self.__done)
+
+    def __done(self, task):
+        self.tasks.discard(task)
+        self.__start()
+
+    async def __fetch(self, node, future):
+        try:
+            children = tuple(await self.children(node))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(children)
+
+    def cancel(self):
+        """Cancel all running and pending fetches."""
+        for _, future in self.pending:
+            future.cancel()
+        self.pending.clear()
+        for task in tuple(self.tasks):
+            task.cancel()
@@ -0,0 +1,45 @@
+from .asyncabstractiter import AsyncAbstractIter
+
+
+class AsyncLevelOrderIter(AsyncAbstractIter):
+
+    """
+    Asynchronously iterate over tree applying level-order strategy starting at `node`.
+
+    The children of all nodes of one level are fetched concurrently.
+
+    >>> import asyncio
+    >>> from anytreePyt import Node
+    >>> f = Node("f")
+    >>> b = Node("b", parent=f)
+    >>> a = Node("a", parent=b)
+    >>> d = Node("d", parent=b)
+    >>> g = Node("g", parent=f)
+    >>> async def children(node):
+    ...     await asyncio.sleep(0.01)  # i.e. remote call
+    ...     return node.children
+    >>> async def names():
+    ...     return [node.name async for node in AsyncLevelOrderIter(f, children)]
+    >>> asyncio.run(names())
+    ['f', 'b', 'g', 'a', 'd']
+    """
+
+    async def _iter(self, node, filter_, stop, maxlevel):
+        abort = AsyncAbstractIter._abort_at_level
+        if abort(1, maxlevel) or stop(node):
+            return
+        fetcher = self._fetcher()
+        try:
+            level = 1
+            nodes = [node]
+            while nodes:
+                tasks = [] if abort(level + 1, maxlevel) else [fetcher.schedule(node) for node in nodes]
+                for node in nodes:
+                    if filter_(node):
+                        yield node
+                nodes = []
+                for task in tasks:
+                    nodes += [child for child in await task if not stop(child)]
+                level += 1
+        finally:
+            fetcher.cancel()
@@ -0,0 +1,53 @@
+from collections import deque
+
+from .asyncabstractiter import AsyncAbstractIter
+
+
+class AsyncPreOrderIter(AsyncAbstractIter):
+
+    """
+    Asynchronously iterate over tree applying pre-order strategy starting at `node`.
+
+    The children of all siblings are fetched concurrently, while the subtree of the first sibling is visited.
+
+    >>> import asyncio
+    >>> from anytreePyt import Node
+    >>> f = Node("f")
+    >>> b = Node("b", parent=f)
+    >>> a = Node("a", parent=b)
+    >>> d = Node("d", parent=b)
+    >>> g = Node("g", parent=f)
+    >>> async def children(node):
+    ...     await asyncio.sleep(0.01)  # i.e. remote call
+    ...     return node.children
+    >>> async def names():
+    ...     return [node.name async for node in AsyncPreOrderIter(f, children)]
+    >>> asyncio.run(names())
+    ['f', 'b', 'a', 'd', 'g']
+    """
+
+    async def _iter(self, node, filter_, stop, maxlevel):
+        abort = AsyncAbstractIter._abort_at_level
+        if abort(1, maxlevel) or stop(node):
+            return
+        fetcher = self._fetcher()
+        try:
+            task = None if abort(2, maxlevel) else fetcher.schedule(node)
+            stack = [deque([(node, task)])]
+            while stack:
+                items = stack[-1]
+                if not items:
+                    stack.pop()
+                    continue
+                node, task = items.popleft()
+                if filter_(node):
+                    yield node
+                if task is not None:
+                    level = len(stack) + 2
+                    children = [child for child in await task if not stop(child)]
+                    if children:
+                        prefetch = not abort(level, maxlevel)
+                        stack.append(deque([(child, fetcher.schedule(child) if prefetch else None)
+                                            for child in children]))
+        finally:
+            fetcher.cancel()
@@ -0,0 +1,80 @@
+from heapq import heappop
+from heapq import heappush
+from itertools import count
+
+from .abstractiter import AbstractIter
+
+_INF = float("inf")
+_RESULT = 0
+_SUBTREE = 1
+
+
+class BestFirstIter(AbstractIter):
+
+    def __init__(self, node, score, bound=None, k=None, filter_=None, stop=None, maxlevel=None):
+        """
+        Iterate over tree in descending `score` order starting at `node`.
+
+        Nodes are visited best-first via a heap. `bound` returns an upper bound of `score`
+        for a whole subtree (the node and all its descendants). A subtree is only visited
+        if its bound can beat the nodes returned so far. With `k` the iteration ends after `k` nodes,
+        so all subtrees with a bound below the `k`-th result are skipped.
+        Without `bound`, every node is scored before the first node is returned.
+
+        Args:
+            node: top node.
+            score: function called with every `node` returning a number, or `None` to skip the node.
+
+        Keyword Args:
+            bound: function called with a `node` returning the maximum score within its subtree.
+            k (int): maximum number of nodes.
+            filter_: function called with every `node` as argument, `node` is returned if `True`.
+            stop: stop iteration at `node` if `stop` function returns `True` for `node`.
+            maxlevel (int): maximum decending in the node hierarchy.
+
+        >>> from anytreePyt import Node
+        >>> f = Node("f", score=1, best=9)
+        >>> b = Node("b", parent=f, score=4, best=4)
+        >>> a = Node("a", parent=b, score=2, best=2)
+        >>> g = Node("g", parent=f, score=3, best=9)
+        >>> i = Node("i", parent=g, score=9, best=9)
+        >>> [node.name for node in BestFirstIter(f, lambda n: n.score, lambda n: n.best, k=2)]
+        ['i', 'b']
+        >>> [node.name for node in BestFirstIter(f, lambda n: n.score)]
+        ['i', 'b', 'g', 'a', 'f']
+        """
+        super(BestFirstIter, self).__init__(node, filter_=filter_, stop=stop, maxlevel=maxlevel)
+        self.score = score
+        self.bound = bound
+        self.k = k
+
+    def _iter(self, children, filter_, stop, maxlevel):
+        score = self.score
+        bound = self.bound or BestFirstIter.__default_bound
+        k = self.k
+        if k is not None and k <= 0:
+            return
+        order = count()
+        heap = []
+        for child in children:
+            heappush(heap, (-bound(child), _SUBTREE, next(order), child, 1))
+        yielded = 0
+        while heap:
+            _, kind, _, node, level = heappop(heap)
+            if kind == _RESULT:
+                yield node
+                yielded += 1
+                if k is not None and yielded >= k:
+                    break
+                continue
+            if filter_(node):
+                value = score(node)
+                if value is not None:
+                    heappush(heap, (-value, _RESULT, next(order), node, level))
+            if not AbstractIter._abort_at_level(level + 1, maxlevel):
+                for child in AbstractIter._get_children(node.children, stop):
+                    heappush(heap, (-bound(child), _SUBTREE, next(order), child, level + 1))
+
+    @staticmethod
+    def __default_bound(node):
+        return _INF
@@ -0,0 +1,41 @@
+class Cursor(object):
+
+    def __init__(self, strategy, path=None, done=False):
+        """
+        Serializable position of a tree iteration.
+
+        Args:
+            strategy (str): name of the iterator class, i.e. `'PreOrderIter'`.
+
+        Keyword Args:
+            path (tuple): child indices from the start node to the last visited node.
+                          `None` if the iteration has not been started yet.
+            done (bool): iteration is exhausted.
+
+        A cursor does not reference any node and can be pickled.
+        It is only meaningful together with the start node and an unmodified tree.
+        """
+        self.strategy = strategy
+        self.path = path
+        self.done = done
+
+    def __eq__(self, other):
+        if not isinstance(other, Cursor):
+            return NotImplemented
+        return (self.strategy, self.path, self.done) == (other.strategy, other.path, other.done)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.strategy, self.path, self.done))
+
+    def __repr__(self):
+        return "Cursor(%r, path=%r, done=%r)" % (self.strategy, self.path, self.done)
+
+
+class CursorError(RuntimeError):
+
+    """Cursor does not fit to iterator or tree."""
+
+    pass
@@ -34,18 +34,66 @@ class PostOrderIter(AbstractIter):
     ['a', 'c', 'd', 'b', 'h', 'i', 'f']
     >>> [node.name for node in PostOrderIter(f, stop=lambda n: n.name == 'd')]
     ['a', 'b', 'h', 'i', 'g', 'f']
+
+    The iteration can be interrupted and continued later on via a :any:`Cursor`:
+
+    >>> it = PostOrderIter(f)
+    >>> [next(it).name for _ in range(4)]
+    ['a', 'c', 'e', 'd']
+    >>> it.cursor
+    Cursor('PostOrderIter', path=(0, 1), done=False)
+    >>> [node.name for node in PostOrderIter.resume(f, it.cursor)]
+    ['b', 'h', 'i', 'g', 'f']
     """
 
-    @staticmethod
-    def _iter(children, filter_, stop, maxlevel):
-        return PostOrderIter.__next(children, 1, filter_, stop, maxlevel)
+    _resumable = True
+
+    def _iter_path(self, node, path, filter_, stop, maxlevel):
+        trail = []
+        self._trail = trail
+        if path is None:
+            if AbstractIter._abort_at_level(1, maxlevel) or stop(node):
+                self._done = True
+                return
+            nodes, siblings = [node], []
+            node = PostOrderIter.__first(node, nodes, siblings, trail, stop, maxlevel)
+            if filter_(node):
+                yield node
+        else:
+            nodes, siblings = AbstractIter._descend(node, path)
+            trail.extend(path)
+        while trail:
+            children = siblings[-1]
+            count = len(children)
+            index = trail[-1] + 1
+            while index < count and stop(children[index]):
+                index += 1
+            if index < count:
+                node = children[index]
+                trail[-1] = index
+                nodes[-1] = node
+                node = PostOrderIter.__first(node, nodes, siblings, trail, stop, maxlevel)
+            else:
+                siblings.pop()
+                trail.pop()
+                nodes.pop()
+                node = nodes[-1]
+            if filter_(node):
+                yield node
+        self._done = True
 
     @staticmethod
-    def __next(children, level, filter_, stop, maxlevel):
-        if not AbstractIter._abort_at_level(level, maxlevel):
-            for child in children:
-                grandchildren = AbstractIter._get_children(child.children, stop)
-                for grandchild in PostOrderIter.__next(grandchildren, level + 1, filter_, stop, maxlevel):
-                    yield grandchild
-                if filter_(child):
-                    yield child
+    def __first(node, nodes, siblings, trail, stop, maxlevel):
+        """Descend to the first node in post-order below `node`."""
+        while True:
+            children = () if AbstractIter._abort_at_level(len(trail) + 2, maxlevel) else node.children
+            count = len(children)
+            index = 0
+            while index < count and stop(children[index]):
+                index += 1
+            if index == count:
+                return node
+            node = children[index]
+            nodes.append(node)
+            siblings.append(children)
+            trail.append(index)
@@ -37,20 +37,51 @@ class PreOrderIter(AbstractIter):
     ['f', 'b', 'a', 'd', 'c', 'i', 'h']
     >>> [node.name for node in PreOrderIter(f, stop=lambda n: n.name == 'd')]
     ['f', 'b', 'a', 'g', 'i', 'h']
+
+    The iteration can be interrupted and continued later on via a :any:`Cursor`:
+
+    >>> it = PreOrderIter(f)
+    >>> [next(it).name for _ in range(4)]
+    ['f', 'b', 'a', 'd']
+    >>> it.cursor
+    Cursor('PreOrderIter', path=(0, 1), done=False)
+    >>> [node.name for node in PreOrderIter.resume(f, it.cursor)]
+    ['c', 'e', 'g', 'i', 'h']
     """
 
-    @staticmethod
-    def _iter(children, filter_, stop, maxlevel):
-        stack = [children]
-        while stack:
-            children = stack[-1]
-            if children:
-                child = children.pop(0)
+    _resumable = True
+
+    def _iter_path(self, node, path, filter_, stop, maxlevel):
+        trail = []
+        self._trail = trail
+        if path is None:
+            if AbstractIter._abort_at_level(1, maxlevel) or stop(node):
+                self._done = True
+                return
+            siblings = []
+            if filter_(node):
+                yield node
+        else:
+            nodes, siblings = AbstractIter._descend(node, path)
+            trail.extend(path)
+            node = nodes[-1]
+        children = () if AbstractIter._abort_at_level(len(trail) + 2, maxlevel) else node.children
+        index = 0
+        while True:
+            count = len(children)
+            while index < count and stop(children[index]):
+                index += 1
+            if index < count:
+                child = children[index]
+                siblings.append(children)
+                trail.append(index)
                 if filter_(child):
                     yield child
-                if not AbstractIter._abort_at_level(len(stack) + 1, maxlevel):
-                    grandchildren = AbstractIter._get_children(child.children, stop)
-                    if grandchildren:
-                        stack.append(grandchildren)
+                children = () if AbstractIter._abort_at_level(len(trail) + 2, maxlevel) else child.children
+                index = 0
+            elif siblings:
+                children = siblings.pop()
+                index = trail.pop() + 1
             else:
-                stack.pop()
+                break
+        self._done = True
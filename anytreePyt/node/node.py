@@ -38,5 +38,5 @@ class Node(NodeMixin, object):
         self.network = None
 
     def __repr__(self):
-        args = ["%r" % self.separator.join([""] + [str(node.name) for node in self.path])]
+        args = ["%r" % self.path_string]
         return _repr(self, args=args, nameblacklist=["name"])
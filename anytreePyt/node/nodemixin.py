@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import itertools
 import warnings
 
+try:
+    from copyreg import _slotnames
+except ImportError:  # pragma: no cover
+    from copy_reg import _slotnames
+
 from anytreePyt.iterators import PreOrderIter
 
 from .exceptions import LoopError
@@ -9,11 +15,179 @@ from .exceptions import TreeError
 
 import torch
 
+_VERSIONS = itertools.count(1)
+# attribute name -> version, changed on every assignment of a watched attribute
+_WATCHED = {}
+# attribute name -> number of watches
+_WATCHES = {}
+# attribute name -> version at the start of the current watch
+_EPOCHS = {}
+# number of registered indexes and memoized filters, which need change notifications and subtree versions
+_REGISTERED = 0
+
+
+def _watch(name):
+    """Track assignments of attribute `name` on all nodes, until the watch is released by :any:`_unwatch`."""
+    count = _WATCHES.get(name, 0)
+    if not count:
+        _WATCHED[name] = _EPOCHS[name] = next(_VERSIONS)
+        _hook()
+    _WATCHES[name] = count + 1
+
+
+def _unwatch(name):
+    """Release one watch of attribute `name`."""
+    count = _WATCHES.pop(name) - 1
+    if count:
+        _WATCHES[name] = count
+    else:
+        del _WATCHED[name]
+        del _EPOCHS[name]
+        _hook()
+
+
+def _register():
+    """Notify indexes and maintain subtree versions on changes, until :any:`_unregister`."""
+    global _REGISTERED
+    _REGISTERED += 1
+
+
+def _unregister():
+    """Release one :any:`_register`."""
+    global _REGISTERED
+    _REGISTERED -= 1
+
+
+def _watched_version(name):
+    """Version of attribute `name`, changed on every assignment on any node. Unwatched attributes change always."""
+    try:
+        return _WATCHED[name]
+    except KeyError:
+        return next(_VERSIONS)
+
+
+def _hook():
+    """Route attribute assignments of all nodes through :any:`NodeMixin` as long as any attribute is watched."""
+    hooked = "__setattr__" in vars(NodeMixin)
+    if _WATCHED and not hooked:
+        NodeMixin.__setattr__ = vars(NodeMixin)["_NodeMixin__setattr"]
+        NodeMixin.__delattr__ = vars(NodeMixin)["_NodeMixin__delattr"]
+    elif not _WATCHED and hooked:
+        del NodeMixin.__setattr__
+        del NodeMixin.__delattr__
+
+
+def _current(jumps):
+    """Jump pointers `jumps` of a node are up to date, see :any:`NodeMixin.ancestor`."""
+    root = jumps[4]
+    return root.parent is None and getattr(root, "_NodeMixin__detach_version", 0) == jumps[5]
+
+
+def _warm(node):
+    """`node` has current jump pointers, see :any:`NodeMixin.ancestor`."""
+    jumps = getattr(node, "_NodeMixin__jumps", None)
+    return jumps is not None and _current(jumps)
+
+
+# minimum number of children for a child map
+_CHILDMAP_MIN = 16
+# slots holding the tree relation, all other slots of NodeMixin are caches
+_TREESLOTS = ("_NodeMixin__parent", "_NodeMixin__children")
+
+
+def _flatten(root):
+    """
+    Return the tree of `root` as list of (class, attributes, parent position) in pre-order.
+
+    The attributes are the state of :any:`NodeMixin.__getstate__` without the tree relation,
+    so pickling the list does not recurse along the tree. See :any:`_unflatten`.
+    """
+    entries = []
+    positions = {}
+    for node in PreOrderIter(root):
+        attrs, slots = NodeMixin.__getstate__(node)
+        slots = dict((name, value) for name, value in slots.items() if name not in _TREESLOTS)
+        parent = node.parent
+        positions[id(node)] = len(entries)
+        entries.append((node.__class__, (attrs, slots), None if parent is None else positions[id(parent)]))
+    return entries
+
+
+def _unflatten(entries):
+    """Return the nodes of a tree flattened by :any:`_flatten` in pre-order, without calling any attach hooks."""
+    nodes = []
+    for cls, (attrs, slots), parent in entries:
+        node = cls.__new__(cls)
+        if attrs:
+            node.__dict__.update(attrs)
+        for name, value in slots.items():
+            object.__setattr__(node, name, value)
+        parent = None if parent is None else nodes[parent]
+        object.__setattr__(node, "_NodeMixin__parent", parent)
+        object.__setattr__(node, "_NodeMixin__children", [])
+        if parent is not None:
+            parent._NodeMixin__children.append(node)
+        nodes.append(node)
+    return nodes
+
+
+class _ChildMap(object):
+
+    """
+    Children of one parent by the value of attribute `name`, see :any:`NodeMixin._children_by`.
+
+    Assignments of `name` are only seen while `name` is watched,
+    so the map is only valid as long as the watch active on creation (`epoch`) is not released.
+    """
+
+    __slots__ = ("name", "epoch", "values", "keys", "unhashable")
+
+    def __init__(self, name, children):
+        self.name = name
+        self.epoch = _EPOCHS.get(name)
+        # value -> children with this value in children order
+        self.values = {}
+        # id(child) -> value, children with this value
+        self.keys = {}
+        self.unhashable = []
+        for child in children:
+            self.add(child)
+
+    def add(self, child, children=None):
+        """Add `child`, `children` are the siblings in order, if `child` is not the last one."""
+        value = getattr(child, self.name, None)
+        try:
+            found = self.values.setdefault(value, [])
+        except TypeError:
+            found = self.unhashable
+        found.append(child)
+        if children is not None and len(found) > 1:
+            positions = dict((id(sibling), idx) for idx, sibling in enumerate(children))
+            found.sort(key=lambda sibling: positions[id(sibling)])
+        self.keys[id(child)] = value, found
+
+    def remove(self, child):
+        value, found = self.keys.pop(id(child))
+        for idx, sibling in enumerate(found):
+            if sibling is child:
+                del found[idx]
+                break
+        if not found and found is not self.unhashable:
+            del self.values[value]
+
+    def find(self, value):
+        try:
+            found = self.values.get(value, ())
+        except TypeError:
+            found = ()
+        unhashable = [child for child in self.unhashable if getattr(child, self.name, None) == value]
+        return tuple(found) + tuple(unhashable) if unhashable else tuple(found)
 
 
 class NodeMixin(object):
 
-    __slots__ = ("__parent", "__children")
+    __slots__ = ("__parent", "__children", "__version", "__subtree_version", "__indexes",
+                 "__childmaps", "__jumps", "__detach_version", "__assign_version")
 
     separator = "/"
 
@@ -140,18 +314,25 @@ class NodeMixin(object):
         except AttributeError:
             parent = None
         if parent is not value:
-            self.__check_loop(value)
+            root = self.__check_loop(value)
             self.__detach(parent)
-            self.__attach(value)
+            self.__attach(value, root)
 
     def __check_loop(self, node):
+        """Raise :any:`LoopError` if `node` is `self` or one of its descendants. Return the root of `node`."""
         if node is not None:
             if node is self:
                 msg = "Cannot set parent. %r cannot be parent of itself."
                 raise LoopError(msg % self)
-            if self in node.path:
-                msg = "Cannot set parent. %r is parent of %r."
-                raise LoopError(msg % (self, node))
+            root = node
+            parent = node.parent
+            while parent is not None:
+                if parent is self:
+                    msg = "Cannot set parent. %r is parent of %r."
+                    raise LoopError(msg % (self, node))
+                root = parent
+                parent = parent.parent
+            return root
 
     def __detach(self, parent):
         if parent is not None:
@@ -162,9 +343,21 @@ class NodeMixin(object):
             parentchildren.remove(self)
             self.__parent = None
             # ATOMIC END
+            self.__jumps = None
+            childmaps = getattr(parent, "_NodeMixin__childmaps", None)
+            if childmaps and len(parentchildren) < _CHILDMAP_MIN:
+                # drop the child maps and their watches
+                parent.__childmaps = None
+            elif childmaps:
+                for childmap in childmaps.values():
+                    childmap.remove(self)
+            root = parent.__touch("_detached", self)
+            self.__version = next(_VERSIONS)
+            # the ancestors of the nodes below `self` changed
+            root.__detach_version = self.__detach_version = self.__version
             self._post_detach(parent)
 
-    def __attach(self, parent):
+    def __attach(self, parent, root):
         if parent is not None:
             self._pre_attach(parent)
             parentchildren = parent.__children_
@@ -173,8 +366,185 @@ class NodeMixin(object):
             parentchildren.append(self)
             self.__parent = parent
             # ATOMIC END
+            for childmap in (getattr(parent, "_NodeMixin__childmaps", None) or {}).values():
+                childmap.add(self)
+            parent.__touch("_attached", self, root)
             self._post_attach(parent)
 
+    def __touch(self, method, node, root=None):
+        """
+        Change tree version and notify indexes at `self` and its ancestors about `node` change.
+
+        The root of `self` is returned. If known, it can be passed as `root`.
+        The ancestors are only visited while any index or memoized filter is registered.
+        """
+        version = next(_VERSIONS)
+        if _REGISTERED:
+            ancestor = self
+            while True:
+                for index in getattr(ancestor, "_NodeMixin__indexes", ()):
+                    getattr(index, method)(node)
+                ancestor.__subtree_version = version
+                parent = ancestor.parent
+                if parent is None:
+                    break
+                ancestor = parent
+            root = ancestor
+        elif root is None:
+            root = self
+            parent = root.parent
+            while parent is not None:
+                root = parent
+                parent = root.parent
+        root.__version = version
+        return root
+
+    # __setattr__ and __delattr__, installed by _hook() while any attribute is watched
+    def __setattr(self, name, value):
+        super(NodeMixin, self).__setattr__(name, value)
+        if name in _WATCHED:
+            self.__assigned(name)
+
+    def __delattr(self, name):
+        super(NodeMixin, self).__delattr__(name)
+        if name in _WATCHED:
+            self.__assigned(name)
+
+    def __assigned(self, name):
+        _WATCHED[name] = version = next(_VERSIONS)
+        root = self
+        if _REGISTERED:
+            while True:
+                for index in getattr(root, "_NodeMixin__indexes", ()):
+                    index._assigned(self, name)
+                root.__subtree_version = version
+                parent = root.parent
+                if parent is None:
+                    break
+                root = parent
+        else:
+            parent = root.parent
+            while parent is not None:
+                root = parent
+                parent = root.parent
+        root.__assign_version = version
+        parent = self.parent
+        if parent is not None:
+            childmap = (getattr(parent, "_NodeMixin__childmaps", None) or {}).get(name)
+            if childmap is not None:
+                childmap.remove(self)
+                childmap.add(self, parent.__children_)
+
+    def __getstate__(self):
+        """Copy and pickle the attributes and the tree relation, but none of the caches."""
+        slots = {}
+        for name in _slotnames(self.__class__):
+            if name in _TREESLOTS or not name.startswith("_NodeMixin__"):
+                try:
+                    slots[name] = getattr(self, name)
+                except AttributeError:
+                    pass
+        return getattr(self, "__dict__", None), slots
+
+    @property
+    def _version(self):
+        """
+        Structure version of the tree.
+
+        Every attach and detach within the tree changes the version.
+        Equal versions of the same tree guarantee an unchanged tree structure.
+        """
+        node = self
+        parent = node.parent
+        while parent is not None:
+            node = parent
+            parent = node.parent
+        try:
+            return node.__version
+        except AttributeError:
+            return 0
+
+    @property
+    def _tree_version(self):
+        """
+        Version of the tree, including assignments.
+
+        Every attach and detach within the tree and every assignment of a watched attribute
+        on any node of the tree changes the version.
+        """
+        node = self
+        parent = node.parent
+        while parent is not None:
+            node = parent
+            parent = node.parent
+        return getattr(node, "_NodeMixin__version", 0), getattr(node, "_NodeMixin__assign_version", 0)
+
+    @property
+    def _subtree_version(self):
+        """
+        Version of the subtree starting at this node.
+
+        Every attach and detach below this node and every assignment of a watched
+        attribute on this node or its descendants changes the version,
+        as long as any index or memoized filter is registered (see :any:`_register`).
+        """
+        try:
+            return self.__subtree_version
+        except AttributeError:
+            return 0
+
+    def _children_by(self, name, value):
+        """
+        Return children with attribute `name` equal to `value`.
+
+        While `name` is watched (i.e. by a registered :any:`ChildIndex`), nodes with many children
+        keep a hash map per attribute `name`, which is maintained on attach, detach and assignments of `name`.
+        A map is rebuilt, if the watch has been released meanwhile or if a found child has another value
+        by now (i.e. assigned bypassing :any:`NodeMixin`).
+        The maps are dropped, when the number of children falls below the minimum again.
+        """
+        children = self.__children_
+        epoch = _EPOCHS.get(name)
+        if epoch is None or len(children) < _CHILDMAP_MIN:
+            return tuple([child for child in children if getattr(child, name, None) == value])
+        childmaps = getattr(self, "_NodeMixin__childmaps", None)
+        childmap = childmaps.get(name) if childmaps else None
+        if childmap is not None and childmap.epoch == epoch:
+            found = childmap.find(value)
+            if all(getattr(child, name, None) == value for child in found):
+                return found
+        if childmaps is None:
+            childmaps = self.__childmaps = {}
+        childmap = childmaps[name] = _ChildMap(name, children)
+        return childmap.find(value)
+
+    @property
+    def _indexes(self):
+        """Indexes registered at this node, see :any:`AbstractIndex`."""
+        return tuple(getattr(self, "_NodeMixin__indexes", ()))
+
+    def _register_index(self, index):
+        """Register `index` at this node. Return `True` if it was not registered yet."""
+        try:
+            indexes = self.__indexes
+        except AttributeError:
+            indexes = self.__indexes = []
+        if any(registered is index for registered in indexes):
+            return False
+        indexes.append(index)
+        _register()
+        return True
+
+    def _unregister_index(self, index):
+        """Remove registration of `index` at this node. Return `True` if it was registered."""
+        indexes = getattr(self, "_NodeMixin__indexes", ())
+        for idx, registered in enumerate(indexes):
+            if registered is index:
+                del indexes[idx]
+                _unregister()
+                return True
+        return False
+
     @property
     def __children_(self):
         try:
@@ -319,6 +689,160 @@ class NodeMixin(object):
             node = node.parent
         return tuple(path)
 
+    @property
+    def path_string(self):
+        """
+        Path of this `Node` as string of all `name` attributes joined by `separator`.
+
+        >>> from anytreePyt import Node
+        >>> udo = Node("Udo")
+        >>> marc = Node("Marc", parent=udo)
+        >>> lian = Node("Lian", parent=marc)
+        >>> lian.path_string
+        '/Udo/Marc/Lian'
+        >>> marc.name = "Max"
+        >>> lian.path_string
+        '/Udo/Max/Lian'
+        """
+        return self.separator.join([""] + [str(node.name) for node in self.path])
+
+    def __jumps_(self):
+        """
+        Return the jump pointers of this node.
+
+        The tuple holds the parent, the jump pointers of the parent, the depth, the ancestors
+        1, 2, 4, ... levels up (the jump pointers), the tree root and its detach version.
+        Attaching nodes does not change any ancestors, so jump pointers are current as long as
+        the root is a root and no node has been detached from its tree.
+        Outdated jump pointers are rebuilt below the first ancestor with current jump pointers.
+        """
+        cache = getattr(self, "_NodeMixin__jumps", None)
+        if cache is not None and _current(cache):
+            return cache
+        path = []
+        node = self
+        while node is not None:
+            path.append(node)
+            node = node.parent
+            cache = getattr(node, "_NodeMixin__jumps", None)
+            if cache is not None and _current(cache):
+                break
+        if node is None:
+            root = path[-1]
+            version = getattr(root, "_NodeMixin__detach_version", 0)
+            parentjumps = None
+        else:
+            root, version = cache[4:]
+            parentjumps = cache[3]
+        parent = node
+        for node in reversed(path):
+            cache = getattr(node, "_NodeMixin__jumps", None)
+            if cache is not None and cache[0] is parent and cache[1] is parentjumps:
+                cache = cache[:4] + (root, version)
+            elif parent is None:
+                cache = None, None, 0, (), root, version
+            else:
+                jumps = [parent]
+                level = 0
+                while True:
+                    upper = jumps[level].__jumps[3]
+                    if len(upper) <= level:
+                        break
+                    jumps.append(upper[level])
+                    level += 1
+                cache = parent, parentjumps, parent.__jumps[2] + 1, tuple(jumps), root, version
+            node.__jumps = cache
+            parent = node
+            parentjumps = cache[3]
+        return cache
+
+    def ancestor(self, k):
+        """
+        Ancestor `k` levels up. `ancestor(0)` is the node itself.
+
+        Jump pointers are cached per node. The lookup takes O(log depth),
+        as long as no node has been detached from the tree since the last lookup.
+        `None` is returned if the node has less than `k` ancestors.
+
+        >>> from anytreePyt import Node
+        >>> udo = Node("Udo")
+        >>> marc = Node("Marc", parent=udo)
+        >>> lian = Node("Lian", parent=marc)
+        >>> lian.ancestor(1)
+        Node('/Udo/Marc')
+        >>> lian.ancestor(2)
+        Node('/Udo')
+        >>> lian.ancestor(3)
+        """
+        if k < 0:
+            raise ValueError("Level %r must not be negative." % (k,))
+        cache = self.__jumps_()
+        if k > cache[2]:
+            return None
+        node = self
+        level = 0
+        while k:
+            if k & 1:
+                node = cache[3][level]
+                cache = node.__jumps
+            k >>= 1
+            level += 1
+        return node
+
+    def ancestor_at(self, depth):
+        """
+        Ancestor at `depth`, like `path[depth]` without creating the path.
+
+        `None` is returned if `depth` is larger than the node depth.
+
+        >>> from anytreePyt import Node
+        >>> udo = Node("Udo")
+        >>> marc = Node("Marc", parent=udo)
+        >>> lian = Node("Lian", parent=marc)
+        >>> lian.ancestor_at(0)
+        Node('/Udo')
+        >>> lian.ancestor_at(2)
+        Node('/Udo/Marc/Lian')
+        """
+        if depth < 0:
+            raise ValueError("Depth %r must not be negative." % (depth,))
+        mydepth = self.__jumps_()[2]
+        if depth > mydepth:
+            return None
+        return self.ancestor(mydepth - depth)
+
+    def _lca(self, other):
+        """
+        Return the lowest common ancestor of this node and `other` or `None` if they are from different trees.
+
+        Jump pointers are only used if both nodes already have current ones,
+        as building them costs more than comparing the paths on shallow trees.
+        """
+        if not (_warm(self) and _warm(other)):
+            common = None
+            for node, othernode in zip(self.path, other.path):
+                if node is not othernode:
+                    break
+                common = node
+            return common
+        first = self.__jumps_()
+        second = other.__jumps_()
+        if first[2] < second[2]:
+            self, other = other, self
+            first, second = second, first
+        node = self.ancestor(first[2] - second[2])
+        if node is other:
+            return node
+        first = node.__jumps
+        for level in range(len(first[3]) - 1, -1, -1):
+            # first and second have the same depth and the same number of jump pointers
+            if len(first[3]) > level and first[3][level] is not second[3][level]:
+                node = first[3][level]
+                other = second[3][level]
+                first = node.__jumps
+                second = other.__jumps
+        return first[0] if first[0] is second[0] else None
+
     @property
     def ancestors(self):
         """
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Declarative Node Predicates.
+
+Predicates describe a node filter as data instead of an opaque function.
+They can be used anywhere a `filter_` or `stop` function is accepted.
+
+* :any:`AttrEq`: attribute equals a value.
+* :any:`AttrRange`: attribute is within a range.
+* :any:`AttrIn`: attribute is one of the given values.
+* :any:`And`, :any:`Or`, :any:`Not`: boolean combinators.
+
+Predicates can be combined with `&`, `|` and `~`:
+
+>>> from anytreePyt import Node, PreOrderIter, AttrEq, AttrRange
+>>> f = Node("f", size=3)
+>>> b = Node("b", parent=f, size=1)
+>>> a = Node("a", parent=b, size=7)
+>>> d = Node("d", parent=b)
+>>> [node.name for node in PreOrderIter(f, filter_=AttrRange("size", 2, 8))]
+['f', 'a']
+>>> [node.name for node in PreOrderIter(f, filter_=AttrRange("size", 2, 8) & ~AttrEq("name", "a"))]
+['f']
+
+Nodes without the attribute never match.
+"""
+
+_MISSING = object()
+
+
+class Predicate(object):
+
+    """
+    Base class for all predicates.
+
+    A predicate is callable with a node and returns `True` on match.
+    Traversals call :any:`compile` once and use the returned plain function
+    for every node, which avoids the per-node method dispatch.
+    """
+
+    def __call__(self, node):
+        return self.compile()(node)
+
+    def compile(self):
+        """Return a plain function evaluating the predicate for a node."""
+        raise NotImplementedError()  # pragma: no cover
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+
+class AttrEq(Predicate):
+
+    def __init__(self, name, value):
+        """
+        Match nodes with attribute `name` equal to `value`.
+
+        >>> from anytreePyt import Node
+        >>> AttrEq("name", "f")(Node("f"))
+        True
+        >>> AttrEq("foo", 4)(Node("f"))
+        False
+        """
+        self.name = name
+        self.value = value
+
+    def compile(self):
+        name, value, missing = self.name, self.value, _MISSING
+
+        def eq(node):
+            attr = getattr(node, name, missing)
+            return attr is not missing and attr == value
+        return eq
+
+    def __repr__(self):
+        return "AttrEq(%r, %r)" % (self.name, self.value)
+
+
+class AttrRange(Predicate):
+
+    def __init__(self, name, lower=None, upper=None):
+        """
+        Match nodes with attribute `name` within `lower` and `upper` (both inclusive).
+
+        A bound of `None` is unlimited. Values which cannot be compared to the
+        bounds do not match.
+
+        >>> from anytreePyt import Node
+        >>> AttrRange("size", 2, 4)(Node("f", size=4))
+        True
+        >>> AttrRange("size", lower=5)(Node("f", size=4))
+        False
+        >>> AttrRange("size", upper=5)(Node("f", size="big"))
+        False
+        """
+        self.name = name
+        self.lower = lower
+        self.upper = upper
+
+    def compile(self):
+        name, lower, upper, missing = self.name, self.lower, self.upper, _MISSING
+
+        def inrange(node):
+            attr = getattr(node, name, missing)
+            if attr is missing or attr is None:
+                return False
+            try:
+                return (lower is None or lower <= attr) and (upper is None or attr <= upper)
+            except TypeError:
+                return False
+        return inrange
+
+    def __repr__(self):
+        return "AttrRange(%r, %r, %r)" % (self.name, self.lower, self.upper)
+
+
+class AttrIn(Predicate):
+
+    def __init__(self, name, values):
+        """
+        Match nodes with attribute `name` being one of `values`.
+
+        Hashable values are checked by a set lookup.
+
+        >>> from anytreePyt import Node
+        >>> AttrIn("name", ("a", "f"))(Node("f"))
+        True
+        >>> AttrIn("name", ["a", "b"])(Node("f"))
+        False
+        """
+        self.name = name
+        self.values = tuple(values)
+
+    def compile(self):
+        name, missing = self.name, _MISSING
+        try:
+            values = frozenset(self.values)
+        except TypeError:
+            values = self.values
+
+        def isin(node):
+            attr = getattr(node, name, missing)
+            if attr is missing:
+                return False
+            try:
+                return attr in values
+            except TypeError:
+                return any(attr == value for value in values)
+        return isin
+
+    def __repr__(self):
+        return "AttrIn(%r, %r)" % (self.name, self.values)
+
+
+class And(Predicate):
+
+    def __init__(self, *predicates):
+        """Match nodes matching all `predicates`."""
+        self.predicates = predicates
+
+    def compile(self):
+        funcs = tuple(_compile(predicate) for predicate in self.predicates)
+
+        def and_(node):
+            for func in funcs:
+                if not func(node):
+                    return False
+            return True
+        return and_
+
+    def __repr__(self):
+        return "And(%s)" % ", ".join(repr(predicate) for predicate in self.predicates)
+
+
+class Or(Predicate):
+
+    def __init__(self, *predicates):
+        """Match nodes matching any of `predicates`."""
+        self.predicates = predicates
+
+    def compile(self):
+        funcs = tuple(_compile(predicate) for predicate in self.predicates)
+
+        def or_(node):
+            for func in funcs:
+                if func(node):
+                    return True
+            return False
+        return or_
+
+    def __repr__(self):
+        return "Or(%s)" % ", ".join(repr(predicate) for predicate in self.predicates)
+
+
+class Not(Predicate):
+
+    def __init__(self, predicate):
+        """Match nodes not matching `predicate`."""
+        self.predicate = predicate
+
+    def compile(self):
+        func = _compile(self.predicate)
+
+        def not_(node):
+            return not func(node)
+        return not_
+
+    def __repr__(self):
+        return "Not(%r)" % (self.predicate,)
+
+
+def _compile(func):
+    """Return plain function for predicate `func`. Functions are returned unchanged."""
+    if isinstance(func, Predicate):
+        return func.compile()
+    return func
+
+
+def _attrnames(func):
+    """Return names of the attributes read by predicate `func`. Functions read no known attributes."""
+    if isinstance(func, (And, Or)):
+        names = set()
+        for predicate in func.predicates:
+            names.update(_attrnames(predicate))
+        return names
+    if isinstance(func, Not):
+        return _attrnames(func.predicate)
+    if isinstance(func, Predicate):
+        return set([func.name])
+    return set()
@@ -3,19 +3,151 @@
 
 from __future__ import print_function
 
+import collections
 import re
+import threading
 
-_MAXCACHE = 20
+from anytreePyt.index import ChildIndex
+from anytreePyt.node.nodemixin import _unwatch
+from anytreePyt.node.nodemixin import _watch
+
+# maximum number of child names in error messages
+_MAXPREVIEW = 10
+
+_MISSING = object()
+
+CacheInfo = collections.namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize"))
+
+
+class MatcherCache(object):
+
+    def __init__(self, maxsize=256):
+        """
+        Thread-safe LRU cache of compiled wildcard patterns.
+
+        Keep the matchers of the last `maxsize` patterns.
+        `maxsize` can be changed at any time.
+
+        >>> cache = MatcherCache(maxsize=2)
+        >>> cache.get("sub*")("sub0")
+        True
+        >>> cache.get("s?b")("sub0")
+        False
+        >>> cache.get("sub*")("top")
+        False
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=2, maxsize=2, currsize=2)
+        """
+        self.maxsize = maxsize
+        self.__matchers = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = self.__misses = 0
+
+    def get(self, pat):
+        """Return function returning `True` for names matching wildcard pattern `pat`."""
+        matchers = self.__matchers
+        with self.__lock:
+            matcher = matchers.pop(pat, None)
+            if matcher is not None:
+                matchers[pat] = matcher
+                self.__hits += 1
+                return matcher
+            self.__misses += 1
+        matcher = _matcher(pat)
+        with self.__lock:
+            matchers[pat] = matcher
+            while len(matchers) > self.maxsize:
+                matchers.popitem(last=False)
+        return matcher
+
+    def cache_info(self):
+        """Return hits, misses, maximum and current size."""
+        with self.__lock:
+            return CacheInfo(self.__hits, self.__misses, self.maxsize, len(self.__matchers))
+
+    def cache_clear(self):
+        """Clear cache and statistics."""
+        with self.__lock:
+            self.__matchers.clear()
+            self.__hits = self.__misses = 0
+
+
+def _matcher(pat):
+    """Compile wildcard pattern `pat`. Literals and a single leading or trailing `*` do not need a regex."""
+    body = pat[1:] if pat.startswith("*") else pat[:-1] if pat.endswith("*") else pat
+    if not Resolver.is_wildcard(body):
+        if pat == body:
+            def match(name):
+                return name == pat
+        elif pat.startswith("*"):
+            def match(name):
+                try:
+                    return name.endswith(body)
+                except (AttributeError, TypeError):
+                    return False
+        else:
+            def match(name):
+                try:
+                    return name.startswith(body)
+                except (AttributeError, TypeError):
+                    return False
+        return match
+    re_match = re.compile(_translate(pat)).match
+
+    def match(name):
+        try:
+            return re_match(name) is not None
+        except TypeError:
+            return False
+    return match
+
+
+def _translate(pat):
+    re_pat = ''
+    for char in pat:
+        if char == "*":
+            re_pat += ".*"
+        elif char == "?":
+            re_pat += "."
+        else:
+            re_pat += re.escape(char)
+    return r'(?ms)' + re_pat + r'\Z'
 
 
 class Resolver(object):
 
-    _match_cache = {}
+    match_cache = MatcherCache()
+    """Compiled wildcard patterns of all resolvers, see :any:`MatcherCache`."""
+
+    def __init__(self, pathattr='name', cachesize=0):
+        """
+        Resolve :any:`NodeMixin` paths using attribute `pathattr`.
+
+        Path elements are looked up via a registered :any:`ChildIndex` on `pathattr`, if any.
 
-    def __init__(self, pathattr='name'):
-        """Resolve :any:`NodeMixin` paths using attribute `pathattr`."""
+        With a `cachesize`, :any:`get` remembers the last `cachesize` resolved paths.
+        Cached paths of a tree are resolved again after any structural change of that tree
+        and after any assignment of `pathattr` within that tree.
+        While the cache holds paths, assignments of `pathattr` on any node are tracked,
+        which slows down these assignments slightly until :any:`cache_clear`.
+
+        >>> from anytreePyt import Node
+        >>> top = Node("top", parent=None)
+        >>> sub0 = Node("sub0", parent=top)
+        >>> r = Resolver('name', cachesize=128)
+        >>> r.get(top, "/top/sub0")
+        Node('/top/sub0')
+        >>> r.get(top, "/top/sub0")
+        Node('/top/sub0')
+        >>> r.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+        """
         super(Resolver, self).__init__()
         self.pathattr = pathattr
+        self.__cachesize = cachesize
+        self.__cache = collections.OrderedDict()
+        self.__hits = self.__misses = 0
+        self.__watched = None
 
     def get(self, node, path):
         """
@@ -66,21 +198,218 @@ class Resolver(object):
           ...
         anytree.resolver.ResolverError: unknown root node '/bar'. root is '/top'.
         """
-        node, parts = self.__start(node, path)
-        for part in parts:
+        return self.__cached(node, path, self.__resolve)
+
+    def try_get(self, node, path, default=None):
+        """
+        Return instance at `path` or `default` if there is none.
+
+        Like :any:`get`, but without raising and formatting any :any:`ResolverError`,
+        which makes misses as cheap as hits.
+
+        >>> from anytreePyt import Node
+        >>> top = Node("top", parent=None)
+        >>> sub0 = Node("sub0", parent=top)
+        >>> r = Resolver('name')
+        >>> r.try_get(top, "sub0")
+        Node('/top/sub0')
+        >>> r.try_get(top, "sub1") is None
+        True
+        >>> r.try_get(top, "/bar/sub0", default="missing")
+        'missing'
+        """
+        found = self.__cached(node, path, self.__try_resolve)
+        return default if found is _MISSING else found
+
+    def longest_match(self, node, path):
+        """
+        Return the deepest instance along `path` and the unresolved rest of `path`.
+
+        The path is resolved as far as possible, without raising any :any:`ResolverError`.
+        The rest is the unresolved path elements joined by the separator,
+        without any empty or '.' path elements.
+        For an absolute path with an unknown root node, the instance is `None`.
+
+        >>> from anytreePyt import Node
+        >>> top = Node("top", parent=None)
+        >>> api = Node("api", parent=top)
+        >>> users = Node("users", parent=api)
+        >>> r = Resolver('name')
+        >>> r.longest_match(top, "/top/api/users/42/avatar")
+        (Node('/top/api/users'), '42/avatar')
+        >>> r.longest_match(api, "users")
+        (Node('/top/api/users'), '')
+        >>> r.longest_match(api, "/bar/users")
+        (None, 'users')
+        """
+        node, path = self.__split(node, path)
+        parts = path.parts
+        if node is not None:
+            pathattr = self.pathattr
+            index = self.__index(node)
+            for idx, part in enumerate(parts):
+                if part == "..":
+                    parent = node.parent
+                    if parent is None:
+                        break
+                    node = parent
+                else:
+                    children = _children(node, pathattr, part, index)
+                    if not children:
+                        break
+                    node = children[0]
+            else:
+                idx = len(parts)
+            parts = parts[idx:]
+        return node, path.separator.join(parts)
+
+    def __cached(self, node, path, resolve):
+        if not self.__cachesize:
+            return resolve(node, path)
+        pathattr = self.pathattr
+        if self.__watched is not None and self.__watched != pathattr:
+            self.cache_clear()
+        key = id(node), path
+        stamp = node._tree_version
+        cache = self.__cache
+        entry = cache.pop(key, None)
+        if entry is not None and entry[0] is node and entry[1] == stamp:
+            self.__hits += 1
+            cache[key] = entry
+            return entry[2]
+        self.__misses += 1
+        found = resolve(node, path)
+        if found is not _MISSING:
+            if self.__watched is None:
+                _watch(pathattr)
+                self.__watched = pathattr
+            cache[key] = node, stamp, found
+            if len(cache) > self.__cachesize:
+                cache.popitem(last=False)
+        return found
+
+    def cache_info(self):
+        """Return hits, misses, maximum and current size of the path cache of :any:`get`."""
+        return CacheInfo(self.__hits, self.__misses, self.__cachesize, len(self.__cache))
+
+    def cache_clear(self):
+        """Clear path cache and statistics and stop watching `pathattr` until the next lookup."""
+        self.__cache.clear()
+        self.__hits = self.__misses = 0
+        self.__unwatch()
+
+    def __unwatch(self):
+        if self.__watched is not None:
+            _unwatch(self.__watched)
+            self.__watched = None
+
+    def __del__(self):
+        self.__unwatch()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_Resolver__cache"] = collections.OrderedDict()
+        state["_Resolver__hits"] = state["_Resolver__misses"] = 0
+        state["_Resolver__watched"] = None
+        return state
+
+    def __resolve(self, node, path):
+        node, path = self.__start(node, path)
+        index = self.__index(node)
+        for part in path.parts:
             if part == "..":
                 node = node.parent
-            elif part in ("", "."):
-                pass
             else:
-                node = self.__get(node, part)
+                node = self.__get(node, part, index)
         return node
 
-    def __get(self, node, name):
-        for child in node.children:
-            if _getattr(child, self.pathattr) == name:
-                return child
-        raise ChildResolverError(node, name, self.pathattr)
+    def __try_resolve(self, node, path):
+        node, path = self.__split(node, path)
+        if node is None:
+            return _MISSING
+        pathattr = self.pathattr
+        index = self.__index(node)
+        for part in path.parts:
+            if node is None:
+                return _MISSING
+            elif part == "..":
+                node = node.parent
+            elif part not in ("", "."):
+                children = _children(node, pathattr, part, index)
+                if not children:
+                    return _MISSING
+                node = children[0]
+        return _MISSING if node is None else node
+
+    def __step(self, node, part, index):
+        if part == "..":
+            return node.parent
+        elif part in ("", "."):
+            return node
+        else:
+            return self.__get(node, part, index)
+
+    def get_many(self, node, paths):
+        """
+        Return instances at `paths`.
+
+        Like :any:`get` for every path, but path elements shared by multiple paths are resolved just once.
+        Return a list with the found instance or the :any:`ResolverError` for every path in input order.
+        Path elements below '..' of a root node result in a :any:`ResolverError`.
+
+        >>> from anytreePyt import Node
+        >>> top = Node("top", parent=None)
+        >>> sub0 = Node("sub0", parent=top)
+        >>> sub0sub0 = Node("sub0sub0", parent=sub0)
+        >>> sub0sub1 = Node("sub0sub1", parent=sub0)
+        >>> r = Resolver('name')
+        >>> r.get_many(top, ["/top/sub0/sub0sub1", "sub0/sub0sub0", "/top/sub0/sub2"])  # doctest: +ELLIPSIS
+        [Node('/top/sub0/sub0sub1'), Node('/top/sub0/sub0sub0'), ChildResolverError(...)]
+        """
+        paths = list(paths)
+        results = [None] * len(paths)
+        # start node id -> start node, trie of path elements: [path element -> trie, path indices]
+        starts = collections.OrderedDict()
+        for idx, path in enumerate(paths):
+            try:
+                start, path = self.__start(node, path)
+            except ResolverError as exc:
+                results[idx] = exc
+                continue
+            _, trie = starts.setdefault(id(start), (start, [collections.OrderedDict(), []]))
+            for part in path.parts:
+                trie = trie[0].setdefault(part, [collections.OrderedDict(), []])
+            trie[1].append(idx)
+        for start, trie in starts.values():
+            index = self.__index(start)
+            stack = [(start, trie, None)]
+            while stack:
+                node, (subtries, indices), child = stack.pop()
+                for idx in indices:
+                    results[idx] = node
+                if node is None:
+                    # '..' of the root node `child`
+                    exc = ResolverError(child, "..", "%r has no parent." % (child,))
+                    for subtrie in subtries.values():
+                        _fill(results, subtrie, exc)
+                    continue
+                for part, subtrie in subtries.items():
+                    try:
+                        stack.append((self.__step(node, part, index), subtrie, node))
+                    except ResolverError as exc:
+                        _fill(results, subtrie, exc)
+        return results
+
+    def __get(self, node, name, index):
+        children = _children(node, self.pathattr, name, index)
+        if not children:
+            raise ChildResolverError(node, name, self.pathattr)
+        return children[0]
+
+    def __index(self, node):
+        """Return the registered :any:`ChildIndex` on `pathattr` at `node` or above."""
+        pathattr = self.pathattr
+        return ChildIndex._lookup(node, lambda index: index.name == pathattr)
 
     def glob(self, node, path):
         """
@@ -91,6 +420,7 @@ class Resolver(object):
 
         * `*` matches any characters, except '/'.
         * `?` matches a single character, except '/'.
+        * `**` matches any number of path elements.
 
         An example module tree:
 
@@ -130,6 +460,16 @@ class Resolver(object):
           ...
         anytree.resolver.ChildResolverError: Node('/top') has no child sub2. Children are: 'sub0', 'sub1'.
 
+        Path elements before the first wildcard must exist. Unlike former releases,
+        an existing element without any match for the rest of the path results in an empty list,
+        instead of a :any:`ChildResolverError` for the existing element:
+
+        >>> r.glob(top, "sub1/sub0/*")
+        []
+
+        Below a wildcard, all equally named children are searched. Formerly, a child
+        without the next path element dropped the matches below its equally named siblings.
+
         Absolute paths:
 
         >>> r.glob(sub0sub0, "/top/*")
@@ -142,84 +482,239 @@ class Resolver(object):
         Traceback (most recent call last):
           ...
         anytree.resolver.ResolverError: unknown root node '/bar'. root is '/top'.
+
+        Recursive:
+
+        >>> r.glob(top, "**/sub0")
+        [Node('/top/sub0'), Node('/top/sub0/sub0'), Node('/top/sub1/sub0')]
         """
-        node, parts = self.__start(node, path)
-        return self.__glob(node, parts)
+        return list(self.iglob(node, path))
+
+    def iglob(self, node, path):
+        """
+        Iterate over instances at `path` supporting wildcards.
+
+        Like :any:`glob`, but found nodes are returned one by one, while searching.
+        The pattern is compiled once and evaluated within a single traversal,
+        which skips all subtrees, which cannot match.
+
+        >>> from anytreePyt import Node
+        >>> top = Node("top", parent=None)
+        >>> sub0 = Node("sub0", parent=top)
+        >>> sub0sub0 = Node("sub0", parent=sub0)
+        >>> leaf = Node("leaf0", parent=sub0sub0)
+        >>> sub1 = Node("sub1", parent=top)
+        >>> r = Resolver('name')
+        >>> found = r.iglob(top, "/top/**/sub?/leaf*")
+        >>> next(found)
+        Node('/top/sub0/sub0/leaf0')
+        """
+        node, path = self.__start(node, path)
+        return self.__iglob(node, path._glob)
+
+    def __split(self, node, path):
+        """Return start node and parsed `path`. The start node is `None` on an invalid root node."""
+        path = _treepath(path, node.separator)
+        if path.absolute:
+            root = node.root
+            if not path.root or path.root != _getattr(root, self.pathattr):
+                return None, path
+            node = root
+        return node, path
 
     def __start(self, node, path):
-        sep = node.separator
-        parts = path.split(sep)
-        if path.startswith(sep):
+        start, path = self.__split(node, path)
+        if start is None:
+            sep = node.separator
             node = node.root
             rootpart = _getattr(node, self.pathattr)
-            parts.pop(0)
-            if not parts[0]:
+            if not path.root:
                 msg = "root node missing. root is '%s%s'."
                 raise ResolverError(node, "", msg % (sep, str(rootpart)))
-            elif parts[0] != rootpart:
+            else:
                 msg = "unknown root node '%s%s'. root is '%s%s'."
-                raise ResolverError(node, "", msg % (sep, parts[0], sep, str(rootpart)))
-            parts.pop(0)
-        return node, parts
-
-    def __glob(self, node, parts):
-        nodes = []
-        name = parts[0]
-        remainder = parts[1:]
-        # handle relative
-        if name == "..":
-            nodes += self.__glob(node.parent, remainder)
-        elif name in ("", "."):
-            nodes += self.__glob(node, remainder)
-        else:
-            matches = self.__find(node, name, remainder)
-            if not matches and not Resolver.is_wildcard(name):
-                raise ChildResolverError(node, name, self.pathattr)
-            nodes += matches
-        return nodes
-
-    def __find(self, node, pat, remainder):
-        matches = []
-        for child in node.children:
-            name = _getattr(child, self.pathattr)
-            try:
-                if Resolver.__match(name, pat):
-                    if remainder:
-                        matches += self.__glob(child, remainder)
-                    else:
-                        matches.append(child)
-            except ResolverError as exc:
-                if not Resolver.is_wildcard(pat):
-                    raise exc
-        return matches
+                raise ResolverError(node, "", msg % (sep, path.root, sep, str(rootpart)))
+        return start, path
+
+    def __iglob(self, node, glob):
+        segments, final, pathattr = glob.segments, len(glob.segments), self.pathattr
+        index = self.__index(node)
+        stack = [(node, (0,))]
+        while stack:
+            node, positions = stack.pop()
+            # follow all segments, which do not descend
+            positions = list(positions)
+            scan = []
+            literals = []
+            for position in positions:
+                if position == final:
+                    continue
+                kind, value, strict = segments[position]
+                if kind is _UP:
+                    if node.parent is not None:
+                        stack.append((node.parent, (position + 1,)))
+                elif kind is _ANY:
+                    _append_new(positions, position + 1)
+                    scan.append((position, kind, None))
+                elif kind is _LITERAL and not scan:
+                    literals.append((position, value, strict))
+                else:
+                    scan.append((position, kind, value))
+            if final in positions:
+                yield node
+            # descend
+            states = collections.OrderedDict()
+            if scan:
+                scan += [(position, _LITERAL, value) for position, value, _ in literals]
+                for child in node.children:
+                    name = _getattr(child, pathattr)
+                    for position, kind, value in scan:
+                        if kind is _ANY:
+                            _add_state(states, child, position)
+                        elif kind is _LITERAL and name == value or kind is _MATCH and value(name):
+                            _add_state(states, child, position + 1)
+            else:
+                for position, value, strict in literals:
+                    children = _children(node, pathattr, value, index)
+                    if not children and strict:
+                        raise ChildResolverError(node, value, pathattr)
+                    for child in children:
+                        _add_state(states, child, position + 1)
+            stack.extend(reversed(states.values()))
 
     @staticmethod
     def is_wildcard(path):
         """Return `True` is a wildcard."""
         return "?" in path or "*" in path
 
-    @staticmethod
-    def __match(name, pat):
-        try:
-            re_pat = Resolver._match_cache[pat]
-        except KeyError:
-            res = Resolver.__translate(pat)
-            if len(Resolver._match_cache) >= _MAXCACHE:
-                Resolver._match_cache.clear()
-            Resolver._match_cache[pat] = re_pat = re.compile(res)
-        return re_pat.match(name) is not None
 
-    @staticmethod
-    def __translate(pat):
-        re_pat = ''
-        for char in pat:
-            if char == "*":
-                re_pat += ".*"
-            elif char == "?":
-                re_pat += "."
+_UP, _ANY, _MATCH, _LITERAL = "up", "any", "match", "literal"
+
+
+class _Glob(object):
+
+    def __init__(self, parts):
+        """
+        Glob pattern compiled to a sequence of segment matchers.
+
+        `parts` must not contain any empty or '.' path elements, see :any:`TreePath`.
+
+        Every segment is a tuple of kind, value and whether a miss is an error.
+        Misses are errors until the first wildcard.
+        """
+        segments = []
+        strict = True
+        for part in parts:
+            if part == "..":
+                segments.append((_UP, None, strict))
+            elif part == "**":
+                segments.append((_ANY, None, strict))
+                strict = False
+            elif Resolver.is_wildcard(part):
+                segments.append((_MATCH, Resolver.match_cache.get(part), strict))
+                strict = False
             else:
-                re_pat += re.escape(char)
-        return re_pat + r'\Z(?ms)'
+                segments.append((_LITERAL, part, strict))
+        self.segments = tuple(segments)
+
+
+def _children(node, pathattr, value, index):
+    """Return the children of `node` with attribute `pathattr` equal to `value`, looked up via `index` if any."""
+    if index is not None:
+        return index.lookup(node, value)
+    return [child for child in node.children if _getattr(child, pathattr) == value]
+
+
+def _fill(results, trie, value):
+    """Set `value` for all path indices within `trie`."""
+    stack = [trie]
+    while stack:
+        subtries, indices = stack.pop()
+        for idx in indices:
+            results[idx] = value
+        stack.extend(subtries.values())
+
+
+def _append_new(positions, position):
+    if position not in positions:
+        positions.append(position)
+
+
+def _add_state(states, child, position):
+    try:
+        _, positions = states[id(child)]
+    except KeyError:
+        positions = []
+        states[id(child)] = child, positions
+    _append_new(positions, position)
+
+
+class TreePath(object):
+
+    def __init__(self, path, separator="/"):
+        """
+        Path parsed once for repeated use.
+
+        :any:`Resolver` accepts a :any:`TreePath` anywhere a path string is accepted.
+        Splitting, normalization and compiling wildcards are done just once.
+
+        >>> from anytreePyt import Node
+        >>> top = Node("top", parent=None)
+        >>> sub0 = Node("sub0", parent=top)
+        >>> sub0sub0 = Node("sub0sub0", parent=sub0)
+        >>> path = TreePath("/top/./sub0/sub0*")
+        >>> path
+        TreePath('/top/./sub0/sub0*')
+        >>> path.absolute, path.root, path.parts, path.wildcards
+        (True, 'top', ('sub0', 'sub0*'), (False, True))
+        >>> Resolver().glob(sub0, path)
+        [Node('/top/sub0/sub0sub0')]
+        """
+        self.path = path
+        self.separator = separator
+        parts = path.split(separator)
+        self.absolute = path.startswith(separator)
+        if self.absolute:
+            parts.pop(0)
+            self.root = parts.pop(0)
+        else:
+            self.root = None
+        # path elements without the ones referring to the same node
+        self.parts = tuple(part for part in parts if part not in ("", "."))
+        self.__glob = None
+
+    @property
+    def wildcards(self):
+        """Wildcard flag for every element of `parts`."""
+        return tuple(Resolver.is_wildcard(part) for part in self.parts)
+
+    @property
+    def is_wildcard(self):
+        """Return `True` if any element of `parts` is a wildcard."""
+        return any(self.wildcards)
+
+    @property
+    def _glob(self):
+        if self.__glob is None:
+            self.__glob = _Glob(self.parts)
+        return self.__glob
+
+    def __str__(self):
+        return self.path
+
+    def __repr__(self):
+        if self.separator == "/":
+            return "TreePath(%r)" % (self.path,)
+        return "TreePath(%r, separator=%r)" % (self.path, self.separator)
+
+
+def _treepath(path, separator):
+    """Return `path` as :any:`TreePath` parsed with `separator`."""
+    if isinstance(path, TreePath):
+        if path.separator == separator:
+            return path
+        path = path.path
+    return TreePath(path, separator)
 
 
 class ResolverError(RuntimeError):
@@ -234,10 +729,17 @@ class ResolverError(RuntimeError):
 class ChildResolverError(ResolverError):
 
     def __init__(self, node, child, pathattr):
-        """Child Resolve Error at `node` handling `child`."""
-        names = [repr(_getattr(c, pathattr)) for c in node.children]
+        """
+        Child Resolve Error at `node` handling `child`.
+
+        The message lists the first child names only.
+        """
+        children = node.children
+        names = ", ".join(repr(_getattr(c, pathattr)) for c in children[:_MAXPREVIEW])
+        if len(children) > _MAXPREVIEW:
+            names += ", ... (%d in total)" % len(children)
         msg = "%r has no child %s. Children are: %s."
-        msg = msg % (node, child, ", ".join(names))
+        msg = msg % (node, child, names)
         super(ChildResolverError, self).__init__(node, child, msg)
 
 
@@ -1,9 +1,26 @@
 """Node Searching."""
 
-from anytreePyt.iterators import PreOrderIter
-
+from itertools import islice
 
-def findall(node, filter_=None, stop=None, maxlevel=None, mincount=None, maxcount=None):
+from anytreePyt.index import AttrIndex
+from anytreePyt.index import EulerTourIndex
+from anytreePyt.index import RangeIndex
+from anytreePyt.iterators import PreOrderIter
+from anytreePyt.node.nodemixin import _flatten
+from anytreePyt.node.nodemixin import _register
+from anytreePyt.node.nodemixin import _unflatten
+from anytreePyt.node.nodemixin import _unregister
+from anytreePyt.node.nodemixin import _unwatch
+from anytreePyt.node.nodemixin import _watch
+from anytreePyt.predicate import AttrEq
+from anytreePyt.predicate import AttrRange
+from anytreePyt.predicate import _MISSING
+from anytreePyt.predicate import _attrnames
+from anytreePyt.predicate import _compile
+
+
+def findall(node, filter_=None, stop=None, maxlevel=None, mincount=None, maxcount=None, workers=None,
+            executor="thread"):
     """
     Search nodes matching `filter_` but stop at `maxlevel` or `stop`.
 
@@ -13,11 +30,13 @@ def findall(node, filter_=None, stop=None, maxlevel=None, mincount=None, maxcoun
         node: top node, start searching.
 
     Keyword Args:
-        filter_: function called with every `node` as argument, `node` is returned if `True`.
-        stop: stop iteration at `node` if `stop` function returns `True` for `node`.
+        filter_: function or :any:`Predicate` called with every `node` as argument, `node` is returned if `True`.
+        stop: stop iteration at `node` if `stop` function or :any:`Predicate` returns `True` for `node`.
         maxlevel (int): maximum decending in the node hierarchy.
         mincount (int): minimum number of nodes.
         maxcount (int): maximum number of nodes.
+        workers (int): evaluate `filter_` concurrently with `workers` workers.
+        executor (str): `"thread"` or `"process"` workers.
 
     Example tree:
 
@@ -47,6 +66,12 @@ def findall(node, filter_=None, stop=None, maxlevel=None, mincount=None, maxcoun
     >>> findall(f, filter_=lambda node: d in node.path)
     (Node('/f/b/d'), Node('/f/b/d/c'), Node('/f/b/d/e'))
 
+    Declarative predicates are accepted too:
+
+    >>> from anytreePyt import AttrIn
+    >>> findall(f, filter_=AttrIn("name", ("a", "c", "h")))
+    (Node('/f/b/a'), Node('/f/b/d/c'), Node('/f/g/i/h'))
+
     The number of matches can be limited:
 
     >>> findall(f, filter_=lambda node: d in node.path, mincount=4)  # doctest: +ELLIPSIS
@@ -56,8 +81,24 @@ def findall(node, filter_=None, stop=None, maxlevel=None, mincount=None, maxcoun
     >>> findall(f, filter_=lambda node: d in node.path, maxcount=2)  # doctest: +ELLIPSIS
     Traceback (most recent call last):
       ...
-    anytree.search.CountError: Expecting 2 elements at maximum, but found 3. ... Node('/f/b/d/e'))
+    anytree.search.CountError: Expecting 2 elements at maximum, but found at least 3. ... Node('/f/b/d/e'))
+
+    The search stops as soon as `maxcount` is exceeded.
+
+    Expensive filters can be evaluated concurrently. The tree is split into
+    consecutive pre-order chunks, the result order is unchanged:
+
+    >>> findall(f, filter_=lambda node: node.name in ("a", "b"), workers=4)
+    (Node('/f/b'), Node('/f/b/a'))
+
+    Thread workers only gain speed for filters releasing the GIL (i.e. I/O or native code).
+    Process workers require a picklable `filter_` (i.e. a module-level function or a :any:`Predicate`)
+    and picklable node attributes. Every worker receives a copy of the whole tree once.
     """
+    if workers is not None and workers > 1 and filter_ is not None:
+        result = tuple(_findall_parallel(node, filter_, stop, maxlevel, workers, executor))
+        _check_count(result, mincount, maxcount)
+        return result
     return _findall(node, filter_=filter_, stop=stop,
                     maxlevel=maxlevel, mincount=mincount, maxcount=maxcount)
 
@@ -67,6 +108,7 @@ def findall_by_attr(node, value, name="name", maxlevel=None, mincount=None, maxc
     Search nodes with attribute `name` having `value` but stop at `maxlevel`.
 
     Return tuple with matching nodes.
+    A registered :any:`AttrIndex` on `name` at `node` or above is used instead of a full traversal.
 
     Args:
         node: top node, start searching.
@@ -104,7 +146,7 @@ def findall_by_attr(node, value, name="name", maxlevel=None, mincount=None, maxc
     >>> findall_by_attr(f, "d")
     (Node('/f/b/d'),)
     """
-    return _findall(node, filter_=lambda n: _filter_by_name(n, name, value),
+    return _findall(node, filter_=AttrEq(name, value),
                     maxlevel=maxlevel, mincount=mincount, maxcount=maxcount)
 
 
@@ -118,8 +160,8 @@ def find(node, filter_=None, stop=None, maxlevel=None):
         node: top node, start searching.
 
     Keyword Args:
-        filter_: function called with every `node` as argument, `node` is returned if `True`.
-        stop: stop iteration at `node` if `stop` function returns `True` for `node`.
+        filter_: function or :any:`Predicate` called with every `node` as argument, `node` is returned if `True`.
+        stop: stop iteration at `node` if `stop` function or :any:`Predicate` returns `True` for `node`.
         maxlevel (int): maximum decending in the node hierarchy.
 
     Example tree:
@@ -151,7 +193,9 @@ def find(node, filter_=None, stop=None, maxlevel=None):
     >>> find(f, lambda node: b in node.path)  # doctest: +ELLIPSIS
     Traceback (most recent call last):
         ...
-    anytree.search.CountError: Expecting 1 elements at maximum, but found 5. (Node('/f/b')... Node('/f/b/d/e'))
+    anytree.search.CountError: Expecting 1 elements at maximum, but found at least 2. (Node('/f/b'), Node('/f/b/a'))
+
+    The search stops at the second match.
     """
     return _find(node, filter_=filter_, stop=stop, maxlevel=maxlevel)
 
@@ -161,6 +205,7 @@ def find_by_attr(node, value, name="name", maxlevel=None):
     Search for *single* node with attribute `name` having `value` but stop at `maxlevel`.
 
     Return tuple with matching nodes.
+    A registered :any:`AttrIndex` on `name` at `node` or above is used instead of a full traversal.
 
     Args:
         node: top node, start searching.
@@ -200,38 +245,396 @@ def find_by_attr(node, value, name="name", maxlevel=None):
     Node('/f/b/d/c', foo=4)
     >>> find_by_attr(f, name="foo", value=8)
     """
-    return _find(node, filter_=lambda n: _filter_by_name(n, name, value),
+    return _find(node, filter_=AttrEq(name, value),
                  maxlevel=maxlevel)
 
 
+def find_many_by_attr(node, values, name="name", maxlevel=None):
+    """
+    Search for a *single* node for each of `values` with attribute `name` but stop at `maxlevel`.
+
+    Like calling :any:`find_by_attr` for every value, but within one traversal
+    or with one :any:`AttrIndex` lookup per value.
+
+    Return dictionary with the matching node (or `None`) for every value.
+
+    Args:
+        node: top node, start searching.
+        values: hashable values which need to match.
+
+    Keyword Args:
+        name (str): attribute name need to match
+        maxlevel (int): maximum decending in the node hierarchy.
+
+    >>> from anytreePyt import Node
+    >>> f = Node("f")
+    >>> b = Node("b", parent=f, uid=10)
+    >>> a = Node("a", parent=b, uid=11)
+    >>> g = Node("g", parent=f, uid=12)
+    >>> result = find_many_by_attr(f, [12, 10, 13], name="uid")
+    >>> [result[value] for value in (10, 12, 13)]
+    [Node('/f/b', uid=10), Node('/f/g', uid=12), None]
+    """
+    result = dict((value, None) for value in values)
+    for value, matches in _findall_many_by_attr(node, result, name, maxlevel).items():
+        if matches:
+            if len(matches) > 1:
+                msg = "Expecting 1 elements at maximum for %r, but found %d."
+                raise CountError(msg % (value, len(matches)), matches)
+            result[value] = matches[0]
+    return result
+
+
+def _findall_many_by_attr(node, values, name, maxlevel):
+    index = AttrIndex._lookup(node, lambda index: index.name == name)
+    if index is not None and all(index._covers(value) for value in values):
+        return dict((value, index._find(node, value, maxlevel)) for value in values)
+    matches = dict((value, []) for value in values)
+    for descendant in PreOrderIter(node, maxlevel=maxlevel):
+        attr = getattr(descendant, name, _MISSING)
+        if attr is not _MISSING:
+            try:
+                found = matches.get(attr)
+            except TypeError:
+                # unhashable attribute value
+                for value, found in matches.items():
+                    if attr == value:
+                        found.append(descendant)
+            else:
+                if found is not None:
+                    found.append(descendant)
+    return matches
+
+
+def findall_multi(node, filters, stop=None, maxlevel=None):
+    """
+    Search nodes for multiple filters within one traversal, but stop at `maxlevel` or `stop`.
+
+    Return dictionary with a tuple of matching nodes for every key of `filters`.
+
+    Args:
+        node: top node, start searching.
+        filters (dict): functions or :any:`Predicate` by key.
+
+    Keyword Args:
+        stop: stop iteration at `node` if `stop` function or :any:`Predicate` returns `True` for `node`.
+        maxlevel (int): maximum decending in the node hierarchy.
+
+    >>> from anytreePyt import Node, AttrEq
+    >>> f = Node("f")
+    >>> b = Node("b", parent=f)
+    >>> a = Node("a", parent=b)
+    >>> g = Node("g", parent=f)
+    >>> result = findall_multi(f, {"leafs": lambda node: node.is_leaf, "b": AttrEq("name", "b")})
+    >>> result["leafs"]
+    (Node('/f/b/a'), Node('/f/g'))
+    >>> result["b"]
+    (Node('/f/b'),)
+    """
+    filters = [(key, _compile(filter_)) for key, filter_ in filters.items()]
+    matches = dict((key, []) for key, _ in filters)
+    for descendant in PreOrderIter(node, stop=stop, maxlevel=maxlevel):
+        for key, filter_ in filters:
+            if filter_(descendant):
+                matches[key].append(descendant)
+    return dict((key, tuple(found)) for key, found in matches.items())
+
+
+def iterfind(node, filter_=None, stop=None, maxlevel=None):
+    """
+    Iterate over nodes matching `filter_` but stop at `maxlevel` or `stop`.
+
+    Like :any:`findall`, but matching nodes are returned one by one, while searching.
+    The search ends as soon as the iteration is not continued.
+
+    Args:
+        node: top node, start searching.
+
+    Keyword Args:
+        filter_: function or :any:`Predicate` called with every `node` as argument, `node` is returned if `True`.
+        stop: stop iteration at `node` if `stop` function or :any:`Predicate` returns `True` for `node`.
+        maxlevel (int): maximum decending in the node hierarchy.
+
+    >>> from anytreePyt import Node
+    >>> f = Node("f")
+    >>> b = Node("b", parent=f)
+    >>> a = Node("a", parent=b)
+    >>> d = Node("d", parent=b)
+    >>> g = Node("g", parent=f)
+    >>> matches = iterfind(f, filter_=lambda node: node.name in ("a", "d", "g"))
+    >>> next(matches)
+    Node('/f/b/a')
+    >>> next(matches)
+    Node('/f/b/d')
+    """
+    return iter(_iter(node, filter_, stop, maxlevel))
+
+
+class MemoSearch(object):
+
+    def __init__(self):
+        """
+        Search with memoized results of named filters.
+
+        The matches of every filter are remembered per subtree.
+        A repeated search only re-evaluates the subtrees which changed since the last search:
+        subtrees with attached or detached nodes or with assignments of watched attributes.
+        The attributes used by a :any:`Predicate` are watched automatically,
+        other attributes read by a filter have to be passed via `watch`.
+        Every filter keeps the subtree versions of all trees maintained until it is removed.
+        The results of nodes detached from a searched subtree are dropped on detach.
+        Copies of a memoized search have the same filters, but no memoized results.
+
+        Filters must only depend on the node, its watched attributes and its descendants.
+
+        >>> from anytreePyt import Node, AttrRange
+        >>> f = Node("f", size=3)
+        >>> b = Node("b", parent=f, size=12)
+        >>> a = Node("a", parent=b, size=7)
+        >>> memo = MemoSearch()
+        >>> memo.add("big", AttrRange("size", lower=5))
+        >>> memo.add("leafs", lambda node: node.is_leaf)
+        >>> memo.findall(f, "big")
+        (Node('/f/b', size=12), Node('/f/b/a', size=7))
+        >>> a.size = 2
+        >>> memo.findall(f, "big")
+        (Node('/f/b', size=12),)
+        >>> memo.findall(f, "leafs")
+        (Node('/f/b/a', size=2),)
+        """
+        self.__filters = {}
+        # id -> searched node, at which the listener is registered
+        self.__tops = {}
+        self.__listener = _MemoListener(self.__filters)
+
+    def add(self, key, filter_, watch=()):
+        """
+        Add `filter_` as `key`.
+
+        Args:
+            key: filter name.
+            filter_: function or :any:`Predicate`.
+
+        Keyword Args:
+            watch: names of further attributes read by `filter_`.
+        """
+        names = _attrnames(filter_) | set(watch)
+        for name in names:
+            _watch(name)
+        _register()
+        if key in self.__filters:
+            self.remove(key)
+        self.__filters[key] = (filter_, _compile(filter_), {}, names)
+
+    def remove(self, key):
+        """Remove filter `key` and its memoized results and stop watching its attributes."""
+        _, _, _, names = self.__filters.pop(key)
+        for name in names:
+            _unwatch(name)
+        _unregister()
+        if not self.__filters:
+            self.__release()
+
+    def __del__(self):
+        for key in list(self.__filters):
+            self.remove(key)
+
+    def __getstate__(self):
+        # filters only - every copy watches and registers on its own
+        return {"filters": [(key, filter_, names) for key, (filter_, _, _, names) in self.__filters.items()]}
+
+    def __setstate__(self, state):
+        self.__init__()
+        for key, filter_, names in state["filters"]:
+            self.add(key, filter_, watch=names)
+
+    def clear(self):
+        """Forget all memoized results."""
+        for _, _, entries, _ in self.__filters.values():
+            entries.clear()
+        self.__release()
+
+    def __release(self):
+        for node in self.__tops.values():
+            node._unregister_index(self.__listener)
+        self.__tops.clear()
+
+    def findall(self, node, key, mincount=None, maxcount=None):
+        """
+        Search nodes matching filter `key`.
+
+        Return tuple with matching nodes in pre-order.
+
+        Args:
+            node: top node, start searching.
+            key: filter name.
+
+        Keyword Args:
+            mincount (int): minimum number of nodes.
+            maxcount (int): maximum number of nodes.
+        """
+        _, filter_, entries, _ = self.__filters[key]
+        if node._register_index(self.__listener):
+            self.__tops[id(node)] = node
+        result = _memoized(node, filter_, entries)
+        _check_count(result, mincount, maxcount)
+        return result
+
+
+class _MemoListener(object):
+
+    def __init__(self, filters):
+        """Drop the memoized results of detached nodes of all `filters`, see :any:`MemoSearch`."""
+        self.filters = filters
+
+    def _attached(self, node):
+        pass
+
+    def _detached(self, node):
+        for _, _, entries, _ in self.filters.values():
+            entry = entries.get(id(node))
+            parent = entry[3] if entry is not None and entry[0] is node else None
+            for descendant in PreOrderIter(node):
+                entry = entries.get(id(descendant))
+                if entry is not None and entry[0] is descendant:
+                    del entries[id(descendant)]
+            # the matches of the former ancestors contain the detached nodes
+            while parent is not None:
+                entry = entries.get(id(parent))
+                if entry is None or entry[0] is not parent:
+                    break
+                del entries[id(parent)]
+                parent = entry[3]
+
+    def _assigned(self, node, name):
+        pass
+
+
+def _memoized(top, filter_, entries):
+    """Matches of `filter_` below `top`, reusing and updating `entries` (id -> node, version, matches, parent)."""
+    stack = [(top, False)]
+    while stack:
+        node, ready = stack.pop()
+        entry = entries.get(id(node))
+        if entry is not None and entry[0] is not node:
+            entry = None
+        if not ready:
+            if entry is None or entry[1] != node._subtree_version:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+            elif entry[3] is not node.parent:
+                # attached as root node
+                entries[id(node)] = entry[:3] + (node.parent,)
+        else:
+            matches = [node] if filter_(node) else []
+            for child in node.children:
+                matches.extend(entries[id(child)][2])
+            entries[id(node)] = (node, node._subtree_version, tuple(matches), node.parent)
+    return entries[id(top)][2]
+
+
 def _find(node, filter_, stop=None, maxlevel=None):
     items = _findall(node, filter_, stop=stop, maxlevel=maxlevel, maxcount=1)
     return items[0] if items else None
 
 
 def _findall(node, filter_, stop=None, maxlevel=None, mincount=None, maxcount=None):
-    result = tuple(PreOrderIter(node, filter_, stop, maxlevel))
+    matches = _iter(node, filter_, stop, maxlevel)
+    if maxcount is not None:
+        # one more match is sufficient to detect a violation
+        result = tuple(islice(matches, maxcount + 1))
+    else:
+        result = tuple(matches)
+    _check_count(result, mincount, maxcount)
+    return result
+
+
+def _check_count(result, mincount, maxcount):
     resultlen = len(result)
     if mincount is not None and resultlen < mincount:
         msg = "Expecting at least %d elements, but found %d."
         raise CountError(msg % (mincount, resultlen), result)
     if maxcount is not None and resultlen > maxcount:
-        msg = "Expecting %d elements at maximum, but found %d."
+        msg = "Expecting %d elements at maximum, but found at least %d."
         raise CountError(msg % (maxcount, resultlen), result)
-    return result
 
 
-def _filter_by_name(node, name, value):
-    try:
-        return getattr(node, name) == value
-    except AttributeError:
-        return False
+def _findall_parallel(node, filter_, stop, maxlevel, workers, executor):
+    from concurrent import futures
+    if executor not in ("thread", "process"):
+        raise ValueError("Unknown executor %r. Use 'thread' or 'process'." % (executor,))
+    nodes = list(_iter(node, None, stop, maxlevel))
+    # more chunks than workers for a balanced load
+    size = max(1, -(-len(nodes) // (workers * 4)))
+    chunks = [nodes[idx:idx + size] for idx in range(0, len(nodes), size)]
+    if executor == "process":
+        # pickling a node recurses along its tree - send the flat tree once per worker and positions per chunk
+        root = node.root
+        entries = _flatten(root)
+        positions = dict((id(descendant), position) for position, descendant in enumerate(PreOrderIter(root)))
+        pool = futures.ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(entries,))
+        payloads = [[positions[id(node)] for node in chunk] for chunk in chunks]
+        evaluate = _evaluate_positions
+    else:
+        pool = futures.ThreadPoolExecutor(workers)
+        payloads = chunks
+        evaluate = _evaluate
+    with pool:
+        masks = list(pool.map(evaluate, [filter_] * len(chunks), payloads))
+    for chunk, mask in zip(chunks, masks):
+        for node, match in zip(chunk, mask):
+            if match:
+                yield node
+
+
+def _evaluate(filter_, nodes):
+    filter_ = _compile(filter_)
+    return [bool(filter_(node)) for node in nodes]
+
+
+# nodes of the tree copy of a process worker
+_WORKER_NODES = []
+
+
+def _init_worker(entries):
+    _WORKER_NODES[:] = _unflatten(entries)
+
+
+def _evaluate_positions(filter_, positions):
+    return _evaluate(filter_, [_WORKER_NODES[position] for position in positions])
+
+
+_MAXPREVIEW = 10
+
+
+def _iter(node, filter_, stop, maxlevel):
+    if stop is None:
+        if isinstance(filter_, AttrEq):
+            index = AttrIndex._lookup(node, lambda index: index.name == filter_.name)
+            if index is not None and index._covers(filter_.value):
+                return index._find(node, filter_.value, maxlevel)
+        if isinstance(filter_, AttrRange):
+            index = RangeIndex._lookup(node, lambda index: index.name == filter_.name)
+            if index is not None and index._covers(filter_.lower, filter_.upper):
+                return index._find(node, filter_.lower, filter_.upper, maxlevel)
+        index = EulerTourIndex._lookup(node)
+        if index is not None:
+            return index._iter(node, filter_, maxlevel)
+    return PreOrderIter(node, filter_, stop, maxlevel)
 
 
 class CountError(RuntimeError):
 
     def __init__(self, msg, result):
-        """Error raised on `mincount` or `maxcount` mismatch."""
-        if result:
-            msg += " " + repr(result)
+        """
+        Error raised on `mincount` or `maxcount` mismatch.
+
+        The message and the `preview` attribute contain the first matches only.
+        """
+        preview = tuple(result[:_MAXPREVIEW])
+        if preview:
+            msg += " " + repr(preview)
+            if len(result) > _MAXPREVIEW:
+                msg = msg[:-1] + ", ...)"
         super(CountError, self).__init__(msg)
+        self.preview = preview
@@ -1,4 +1,8 @@
 
+from anytreePyt.index import LCAIndex
+from anytreePyt.node.nodemixin import _warm
+
+
 def commonancestors(*nodes):
     """
     Determine common ancestors of `nodes`.
@@ -20,13 +24,137 @@ def commonancestors(*nodes):
     (Node('/Udo'), Node('/Udo/Dan'))
     >>> commonancestors()
     ()
+
+    A registered :any:`LCAIndex` or current jump pointers (see :any:`NodeMixin.ancestor`) speed up the search.
+    """
+    if not nodes:
+        return ()
+    index = LCAIndex._lookup(nodes[0])
+    if index is not None and all(node in index for node in nodes):
+        common = index.lca(*nodes)
+    elif not all(_warm(node) for node in nodes):
+        ancestors = [node.ancestors for node in nodes]
+        common = []
+        for parentnodes in zip(*ancestors):
+            parentnode = parentnodes[0]
+            if all([parentnode is p for p in parentnodes[1:]]):
+                common.append(parentnode)
+            else:
+                break
+        return tuple(common)
+    else:
+        common = nodes[0]
+        for node in nodes[1:]:
+            common = common._lca(node)
+            if common is None:
+                return ()
+    ancestors = []
+    # a node is not an ancestor of itself
+    ancestor = common.parent if any(node is common for node in nodes) else common
+    while ancestor is not None:
+        ancestors.append(ancestor)
+        ancestor = ancestor.parent
+    return tuple(reversed(ancestors))
+
+
+def batch_lca(pairs):
+    """
+    Determine the lowest common ancestor for every pair of nodes in `pairs`.
+
+    All pairs are answered within one traversal of the involved trees (Tarjan's offline algorithm).
+    A node is the lowest common ancestor of itself and its descendants.
+    Pairs of nodes from different trees result in `None`.
+
+    >>> from anytreePyt import Node
+    >>> udo = Node("Udo")
+    >>> marc = Node("Marc", parent=udo)
+    >>> lian = Node("Lian", parent=marc)
+    >>> dan = Node("Dan", parent=udo)
+    >>> jet = Node("Jet", parent=dan)
+    >>> joe = Node("Joe", parent=dan)
+
+    >>> batch_lca([(jet, joe), (lian, jet), (dan, joe), (marc, Node("Ina"))])
+    (Node('/Udo/Dan'), Node('/Udo'), Node('/Udo/Dan'), None)
     """
-    ancestors = [node.ancestors for node in nodes]
-    common = []
-    for parentnodes in zip(*ancestors):
-        parentnode = parentnodes[0]
-        if all([parentnode is p for p in parentnodes[1:]]):
-            common.append(parentnode)
-        else:
-            break
-    return tuple(common)
+    return _batch(list(pairs))[0]
+
+
+def batch_distance(pairs):
+    """
+    Determine the number of edges between the nodes of every pair in `pairs`.
+
+    See :any:`batch_lca`. Pairs of nodes from different trees result in `None`.
+
+    >>> from anytreePyt import Node
+    >>> udo = Node("Udo")
+    >>> marc = Node("Marc", parent=udo)
+    >>> lian = Node("Lian", parent=marc)
+    >>> dan = Node("Dan", parent=udo)
+    >>> jet = Node("Jet", parent=dan)
+    >>> joe = Node("Joe", parent=dan)
+
+    >>> batch_distance([(jet, joe), (lian, jet), (dan, joe), (joe, joe), (marc, Node("Ina"))])
+    (2, 4, 1, 0, None)
+    """
+    pairs = list(pairs)
+    lcas, depths = _batch(pairs)
+    return tuple([None if lca is None else depths[id(first)] + depths[id(second)] - 2 * depths[id(lca)]
+                  for (first, second), lca in zip(pairs, lcas)])
+
+
+def _batch(pairs):
+    """Return lowest common ancestors of `pairs` and the depths of all visited nodes by `id`."""
+    lcas = [None] * len(pairs)
+    # roots of all queried nodes, memoized along the climbed paths
+    roots = {}
+    for pair in pairs:
+        for node in pair:
+            path = []
+            while node is not None and id(node) not in roots:
+                path.append(node)
+                node = node.parent
+            root = roots[id(node)] if node is not None else path[-1]
+            for node in path:
+                roots[id(node)] = root
+    queries = {}
+    treeroots = {}
+    for idx, (first, second) in enumerate(pairs):
+        root = roots[id(first)]
+        if root is roots[id(second)]:
+            treeroots[id(root)] = root
+            queries.setdefault(id(first), []).append((idx, second))
+            queries.setdefault(id(second), []).append((idx, first))
+    # finished nodes link to their parent, the first unfinished node upwards is the common ancestor
+    links = {}
+    depths = {}
+    for root in treeroots.values():
+        depths[id(root)] = 0
+        stack = [(root, False)]
+        while stack:
+            node, finished = stack.pop()
+            key = id(node)
+            if not finished:
+                stack.append((node, True))
+                depth = depths[key] + 1
+                for child in node.children:
+                    depths[id(child)] = depth
+                    stack.append((child, False))
+                continue
+            for idx, other in queries.get(key, ()):
+                if other is node:
+                    lcas[idx] = node
+                elif id(other) in links:
+                    lcas[idx] = _find(other, links)
+            links[key] = node.parent
+    return tuple(lcas), depths
+
+
+def _find(node, links):
+    """Return the first unfinished node upwards from `node` and shorten the links on the way."""
+    path = []
+    while id(node) in links:
+        path.append(id(node))
+        node = links[id(node)]
+    for key in path:
+        links[key] = node
+    return node
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from anytreePyt.index import LCAIndex
+
 
 class Walker(object):
 
@@ -62,31 +64,28 @@ class Walker(object):
         Traceback (most recent call last):
           ...
         anytree.walker.WalkError: Node('/a') and Node('/b') are not part of the same tree.
+
+        A registered :any:`LCAIndex` or current jump pointers (see :any:`NodeMixin.ancestor`)
+        speed up the search for the common node.
         """
-        s = start.path
-        e = end.path
-        if start.root != end.root:
+        index = LCAIndex._lookup(start)
+        if index is not None and start in index and end in index:
+            common = index.lca(start, end)
+        else:
+            common = start._lca(end)
+        if common is None:
             msg = "%r and %r are not part of the same tree." % (start, end)
             raise WalkError(msg)
-        # common
-        c = Walker.__calc_common(s, e)
-        assert c[0] is start.root
-        len_c = len(c)
-        # up
-        if start is c[-1]:
-            up = tuple()
-        else:
-            up = tuple(reversed(s[len_c:]))
-        # down
-        if end is c[-1]:
-            down = tuple()
-        else:
-            down = e[len_c:]
-        return up, c[-1], down
+        return _upto(start, common), common, tuple(reversed(_upto(end, common)))
+
 
-    @staticmethod
-    def __calc_common(s, e):
-        return tuple([si for si, ei in zip(s, e) if si is ei])
+def _upto(node, ancestor):
+    """Return `node` and its ancestors below `ancestor`, starting with `node`."""
+    nodes = []
+    while node is not ancestor:
+        nodes.append(node)
+        node = node.parent
+    return tuple(nodes)
 
 
 class WalkError(RuntimeError):
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Wildcard matcher cache benchmark.
+
+Match hundreds of distinct wildcard patterns against a set of names and compare
+:any:`MatcherCache` with the former pattern cache, which compiled every pattern to
+a regular expression and was cleared completely once it held 20 patterns.
+
+Run from the repository root::
+
+    python benchmarks/bench_match_cache.py
+    python benchmarks/bench_match_cache.py --patterns 100 --maxsize 256
+"""
+from __future__ import print_function
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from anytreePyt.resolver import MatcherCache  # noqa
+from anytreePyt.resolver import _translate  # noqa
+
+_MAXCACHE = 20
+
+
+class LegacyCache(object):
+
+    def __init__(self):
+        """Former pattern cache: regular expressions only, cleared at `_MAXCACHE` patterns."""
+        self.patterns = {}
+
+    def get(self, pat):
+        """Return function returning `True` for names matching wildcard pattern `pat`."""
+        try:
+            re_pat = self.patterns[pat]
+        except KeyError:
+            if len(self.patterns) >= _MAXCACHE:
+                self.patterns.clear()
+            self.patterns[pat] = re_pat = re.compile(_translate(pat))
+        return lambda name: re_pat.match(name) is not None
+
+
+def patterns(count):
+    """Return `count` distinct patterns, equally split into prefix-star, suffix-star and `?` patterns."""
+    third = range(max(1, count // 3))
+    return [fmt % idx for fmt in ("sub%d*", "*%d", "s?b%d") for idx in third]
+
+
+def measure(cache, pats, names, rounds, repeat):
+    """Return the best time per round in milliseconds."""
+    def run():
+        for pat in pats:
+            match = cache.get(pat)
+            for name in names:
+                match(name)
+    return min(timeit.repeat(run, number=rounds, repeat=repeat)) * 1000 / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--patterns", type=int, default=900, help="number of distinct patterns")
+    parser.add_argument("--names", type=int, default=50, help="number of names matched per pattern")
+    parser.add_argument("--maxsize", type=int, default=1024, help="MatcherCache maxsize")
+    parser.add_argument("--rounds", type=int, default=10, help="rounds per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements, the best one is reported")
+    args = parser.parse_args()
+    pats = patterns(args.patterns)
+    names = ["sub%d" % idx for idx in range(args.names)]
+    print("%d patterns, %d names, %d rounds" % (len(pats), len(names), args.rounds))
+    legacy = measure(LegacyCache(), pats, names, args.rounds, args.repeat)
+    print("legacy cache:          %6.1f ms per round" % legacy)
+    current = measure(MatcherCache(maxsize=args.maxsize), pats, names, args.rounds, args.repeat)
+    print("MatcherCache(%5d):   %6.1f ms per round" % (args.maxsize, current))
+
+
+if __name__ == "__main__":
+    main()
@@ -37,7 +37,7 @@ config['classifiers'] = [
     'Programming Language :: Python :: 3.6',
 ]
 config['keywords'] = 'tree, tree data, treelib, tree walk, tree structure'
-config['packages'] = ['anytreePyt', 'anytreePyt.node', 'anytreePyt.iterators', 'anytreePyt.importer', 'anytreePyt.exporter', 'anytreePyt.util']
+config['packages'] = ['anytreePyt', 'anytreePyt.node', 'anytreePyt.iterators', 'anytreePyt.importer', 'anytreePyt.exporter', 'anytreePyt.util', 'anytreePyt.index']
 config['install_requires'] = ['six>=1.9.0']
 config['extras_require'] = {
     'dev': ['check-manifest'],
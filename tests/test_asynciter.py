@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import sys
+
+from nose.plugins.skip import SkipTest
+from nose.tools import eq_
+
+from anytreePyt import LevelOrderIter
+from anytreePyt import Node
+from anytreePyt import PreOrderIter
+
+
+class _Children(object):
+
+    """Children provider with delay, tracking the number of concurrent calls."""
+
+    def __init__(self):
+        self.active = 0
+        self.maxactive = 0
+        self.maxtasks = 0
+        self.calls = 0
+
+    def __call__(self, node):
+        import asyncio
+        self.calls += 1
+        self.active += 1
+        self.maxactive = max(self.maxactive, self.active)
+        tasks = asyncio.all_tasks() if hasattr(asyncio, "all_tasks") else asyncio.Task.all_tasks()
+        self.maxtasks = max(self.maxtasks, len([task for task in tasks if not task.done()]))
+        future = asyncio.ensure_future(asyncio.sleep(0.001, result=node.children))
+        future.add_done_callback(self.__done)
+        return future
+
+    def __done(self, future):
+        self.active -= 1
+
+
+def _collect(iter_, count=None):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        aiter = iter_.__aiter__()
+        result = []
+        while count is None or len(result) < count:
+            try:
+                result.append(loop.run_until_complete(aiter.__anext__()))
+            except StopAsyncIteration:
+                break
+        loop.run_until_complete(aiter.aclose())
+        # let cancelled fetches settle
+        loop.run_until_complete(asyncio.sleep(0.01))
+        return result
+    finally:
+        loop.close()
+
+
+def _check_async():
+    if sys.version_info < (3, 6):
+        raise SkipTest("asynchronous iterators require python 3.6")
+
+
+def test_asyncpreorder():
+    """AsyncPreOrderIter."""
+    _check_async()
+    from anytreePyt import AsyncPreOrderIter
+    f = Node("f")
+    b = Node("b", parent=f)
+    Node("a", parent=b)
+    d = Node("d", parent=b)
+    Node("c", parent=d)
+    Node("e", parent=d)
+    g = Node("g", parent=f)
+    i = Node("i", parent=g)
+    Node("h", parent=i)
+    for idx in range(20):
+        Node("x%d" % idx, parent=g)
+    for kwargs in ({}, dict(maxlevel=0), dict(maxlevel=3), dict(filter_=lambda n: n.name not in ('e', 'g')),
+                   dict(stop=lambda n: n.name == 'd')):
+        children = _Children()
+        eq_(_collect(AsyncPreOrderIter(f, children, concurrency=3, **kwargs)), list(PreOrderIter(f, **kwargs)))
+        assert children.maxactive <= 3
+    children = _Children()
+    eq_(_collect(AsyncPreOrderIter(f, children, concurrency=4)), list(PreOrderIter(f)))
+    eq_(children.maxactive, 4)
+    eq_(_collect(AsyncPreOrderIter(f)), list(PreOrderIter(f)))
+    children = _Children()
+    eq_(_collect(AsyncPreOrderIter(f, children), count=3), list(PreOrderIter(f))[:3])
+    eq_(children.active, 0)
+
+
+def test_asynclevelorder():
+    """AsyncLevelOrderIter."""
+    _check_async()
+    from anytreePyt import AsyncLevelOrderIter
+    f = Node("f")
+    b = Node("b", parent=f)
+    Node("a", parent=b)
+    d = Node("d", parent=b)
+    Node("c", parent=d)
+    Node("e", parent=d)
+    g = Node("g", parent=f)
+    i = Node("i", parent=g)
+    Node("h", parent=i)
+    for idx in range(20):
+        Node("x%d" % idx, parent=g)
+    for kwargs in ({}, dict(maxlevel=0), dict(maxlevel=3), dict(filter_=lambda n: n.name not in ('e', 'g')),
+                   dict(stop=lambda n: n.name == 'd')):
+        children = _Children()
+        eq_(_collect(AsyncLevelOrderIter(f, children, concurrency=3, **kwargs)), list(LevelOrderIter(f, **kwargs)))
+        assert children.maxactive <= 3
+    children = _Children()
+    eq_(_collect(AsyncLevelOrderIter(f, children, concurrency=5)), list(LevelOrderIter(f)))
+    eq_(children.maxactive, 5)
+    eq_(_collect(AsyncLevelOrderIter(f)), list(LevelOrderIter(f)))
+
+
+def test_bounded():
+    """Asynchronous iterators keep the number of scheduled fetches bounded."""
+    _check_async()
+    from anytreePyt import AsyncLevelOrderIter
+    from anytreePyt import AsyncPreOrderIter
+    f = Node("f")
+    for idx in range(100):
+        Node("y", parent=Node("x%d" % idx, parent=f))
+    for cls, expected in ((AsyncPreOrderIter, PreOrderIter(f)), (AsyncLevelOrderIter, LevelOrderIter(f))):
+        children = _Children()
+        eq_(_collect(cls(f, children, concurrency=3)), list(expected))
+        eq_(children.calls, 201)
+        eq_(children.maxactive, 3)
+        # fetches, children calls and the iteration itself
+        assert children.maxtasks <= 7, children.maxtasks
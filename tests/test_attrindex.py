@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+from nose.tools import eq_
+
+from anytreePyt import AttrEq
+from anytreePyt import Node
+from anytreePyt import NodeMixin
+from anytreePyt import find
+from anytreePyt import find_by_attr
+from anytreePyt import findall
+from anytreePyt import findall_by_attr
+from anytreePyt.index import AttrIndex
+
+
+def test_lookup():
+    """AttrIndex lookup."""
+    f = Node("f", uid=0)
+    b = Node("b", parent=f, uid=1)
+    a = Node("a", parent=b, uid=2, kind="x")
+    d = Node("d", parent=b, uid=3, kind="y")
+    c = Node("c", parent=d, uid=4, kind="x")
+    e = Node("e", parent=d, uid=5)
+    g = Node("g", parent=f, uid=6, kind="x")
+    index = AttrIndex(f, "kind")
+    eq_(index.lookup("x"), (a, c, g))
+    eq_(index.lookup("y"), (d,))
+    eq_(index.lookup("z"), tuple())
+    eq_(AttrIndex(f).lookup("e"), (e,))
+    eq_(AttrIndex(d, "kind").lookup("x"), (c,))
+    eq_(repr(AttrIndex(f, "kind")), "AttrIndex(%r, 'kind')" % f)
+
+
+def test_unregistered():
+    """Unregistered AttrIndex is rebuilt on changes."""
+    f = Node("f", uid=0)
+    b = Node("b", parent=f, uid=1)
+    a = Node("a", parent=b, uid=2, kind="x")
+    d = Node("d", parent=b, uid=3, kind="y")
+    c = Node("c", parent=d, uid=4, kind="x")
+    Node("e", parent=d, uid=5)
+    g = Node("g", parent=f, uid=6, kind="x")
+    index = AttrIndex(f, "kind")
+    eq_(index.lookup("x"), (a, c, g))
+    c.kind = "y"
+    eq_(index.lookup("x"), (a, g))
+    eq_(index.lookup("y"), (d, c))
+    d.parent = None
+    eq_(index.lookup("y"), tuple())
+    del a.kind
+    eq_(index.lookup("x"), (g,))
+
+
+def test_registered():
+    """Registered AttrIndex is maintained and used by search."""
+    f = Node("f", uid=0)
+    b = Node("b", parent=f, uid=1)
+    a = Node("a", parent=b, uid=2, kind="x")
+    d = Node("d", parent=b, uid=3, kind="y")
+    c = Node("c", parent=d, uid=4, kind="x")
+    Node("e", parent=d, uid=5)
+    g = Node("g", parent=f, uid=6, kind="x")
+    index = AttrIndex(f, "kind").register()
+    eq_(findall_by_attr(f, "x", name="kind"), (a, c, g))
+    eq_(findall_by_attr(b, "x", name="kind"), (a, c))
+    eq_(findall_by_attr(f, "x", name="kind", maxlevel=2), (g,))
+    eq_(findall_by_attr(f, "x", name="kind", maxlevel=3), (a, g))
+    eq_(findall(f, AttrEq("kind", "x"), maxlevel=3), (a, g))
+    eq_(find_by_attr(d, "x", name="kind"), c)
+    eq_(find(f, AttrEq("kind", "y")), d)
+    # structure
+    d.parent = g
+    eq_(index._maintained, True)
+    eq_(findall_by_attr(f, "x", name="kind"), (a, g, c))
+    eq_(findall_by_attr(b, "x", name="kind"), (a,))
+    d.parent = None
+    eq_(findall_by_attr(f, "x", name="kind"), (a, g))
+    eq_(findall_by_attr(f, "y", name="kind"), tuple())
+    n = Node("n", kind="y", parent=b)
+    eq_(findall_by_attr(f, "y", name="kind"), (n,))
+    # attributes
+    a.kind = "y"
+    eq_(findall_by_attr(f, "y", name="kind"), (a, n))
+    del n.kind
+    eq_(findall_by_attr(f, "y", name="kind"), (a,))
+    n.kind = "x"
+    eq_(findall_by_attr(f, "x", name="kind"), (n, g))
+    eq_(index._maintained, True)
+    # changes while unregistered
+    index.unregister()
+    g.kind = "z"
+    index.register()
+    eq_(index.lookup("z"), (g,))
+
+
+def test_watch():
+    """Attributes are watched while indexes are registered."""
+    f = Node("f", uid=0)
+    b = Node("b", parent=f, uid=1)
+    a = Node("a", parent=b, uid=2, kind="x")
+    d = Node("d", parent=b, uid=3, kind="y")
+    Node("c", parent=d, uid=4, kind="x")
+    Node("e", parent=d, uid=5)
+    Node("g", parent=f, uid=6, kind="x")
+    index = AttrIndex(f, "watched").register()
+    other = AttrIndex(b, "watched").register()
+    a.watched = 1
+    eq_(index.lookup(1), (a,))
+    eq_(other.lookup(1), (a,))
+    index.unregister()
+    index.unregister()
+    # the other index still follows assignments
+    d.watched = 1
+    eq_(other.lookup(1), (a, d))
+    a.watched = 2
+    eq_(other.lookup(1), (d,))
+    other.unregister()
+    # unregistered indexes are rebuilt on every lookup
+    a.watched = 1
+    eq_(index.lookup(1), (a, d))
+    eq_(other.lookup(2), ())
+
+
+def test_unhashable():
+    """Unhashable values are searched by traversal."""
+    f = Node("f", uid=0)
+    b = Node("b", parent=f, uid=1)
+    a = Node("a", parent=b, uid=2, kind="x")
+    d = Node("d", parent=b, uid=3, kind="y")
+    c = Node("c", parent=d, uid=4, kind="x")
+    Node("e", parent=d, uid=5)
+    g = Node("g", parent=f, uid=6, kind="x")
+    AttrIndex(f, "kind").register()
+    eq_(findall_by_attr(f, ["x"], name="kind"), tuple())
+    c.kind = set([1])
+    eq_(findall_by_attr(f, frozenset([1]), name="kind"), (c,))
+    c.kind = "x"
+    eq_(findall_by_attr(f, "x", name="kind"), (a, c, g))
+
+
+class _CountingNode(NodeMixin):
+
+    count = 0
+
+    def __init__(self, uid, parent=None):
+        self._uid = uid
+        self.parent = parent
+
+    @property
+    def uid(self):
+        _CountingNode.count += 1
+        return self._uid
+
+
+def test_no_traversal():
+    """Registered index avoids attribute access."""
+    root = _CountingNode(0)
+    nodes = [_CountingNode(idx, parent=root) for idx in range(1, 100)]
+    AttrIndex(root, "uid").register()
+    eq_(find_by_attr(root, 50, name="uid"), nodes[49])
+    _CountingNode.count = 0
+    eq_(find_by_attr(root, 51, name="uid"), nodes[50])
+    eq_(findall_by_attr(nodes[3], 4, name="uid"), (nodes[3],))
+    eq_(_CountingNode.count, 0)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import copy
+import gc
+import pickle
+
+from nose.tools import eq_
+
+from anytreePyt import Node
+from anytreePyt import Resolver
+from anytreePyt.index import ChildIndex
+
+
+def test_lookup():
+    """ChildIndex lookup."""
+    root = Node("root")
+    subs = [Node("sub%d" % idx, parent=root) for idx in range(20)]
+    leaf = Node("leaf", parent=subs[3])
+    index = ChildIndex(root)
+    eq_(index.lookup(root, "sub5"), (subs[5],))
+    eq_(index.lookup(subs[3], "leaf"), (leaf,))
+    index.register()
+    eq_(index.lookup(root, "sub5"), (subs[5],))
+    eq_(index.lookup(root, "leaf"), ())
+    subs[5].name = "renamed"
+    eq_(index.lookup(root, "sub5"), ())
+    eq_(index.lookup(root, "renamed"), (subs[5],))
+    subs[5].parent = None
+    eq_(index.lookup(root, "renamed"), ())
+    subs[5].parent = root
+    eq_(index.lookup(root, "renamed"), (subs[5],))
+    eq_(repr(index), "ChildIndex(%r, 'name')" % root)
+    index.unregister()
+
+
+def test_unregistered():
+    """Assignments while unregistered."""
+    root = Node("root")
+    subs = [Node("sub%d" % idx, parent=root) for idx in range(20)]
+    index = ChildIndex(root).register()
+    eq_(index.lookup(root, "sub6"), (subs[6],))
+    index.unregister()
+    subs[6].name = "renamed"
+    eq_(index.lookup(root, "renamed"), (subs[6],))
+    index.register()
+    eq_(index.lookup(root, "renamed"), (subs[6],))
+    eq_(index.lookup(root, "sub6"), ())
+    # assignment bypassing the node class
+    object.__setattr__(subs[7], "name", "bypass")
+    eq_(index.lookup(root, "sub7"), ())
+    eq_(index.lookup(root, "bypass"), (subs[7],))
+    index.unregister()
+
+
+def test_copy():
+    """Copies of an indexed tree do not affect the index."""
+    root = Node("root")
+    subs = [Node("sub%d" % idx, parent=root) for idx in range(20)]
+    index = ChildIndex(root).register()
+    r = Resolver()
+    eq_(r.get(root, "sub5"), subs[5])
+    for duplicate in (copy.deepcopy(root), pickle.loads(pickle.dumps(root))):
+        eq_(r.get(duplicate, "sub5").name, "sub5")
+        eq_(duplicate.children[5].parent, duplicate)
+    del duplicate
+    gc.collect()
+    subs[5].name = "renamed"
+    eq_(r.get(root, "renamed"), subs[5])
+    eq_(r.try_get(root, "sub5"), None)
+    index.unregister()
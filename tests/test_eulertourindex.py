@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+from nose.tools import eq_
+
+from anytreePyt import Node
+from anytreePyt import PreOrderIter
+from anytreePyt import TreeError
+from anytreePyt import findall
+from anytreePyt.index import EulerTourIndex
+
+from helper import assert_raises
+
+
+def test_eulertourindex():
+    """EulerTourIndex."""
+    f = Node("f")
+    b = Node("b", parent=f)
+    a = Node("a", parent=b)
+    d = Node("d", parent=b)
+    c = Node("c", parent=d)
+    e = Node("e", parent=d)
+    g = Node("g", parent=f)
+    i = Node("i", parent=g)
+    h = Node("h", parent=i)
+    index = EulerTourIndex(f)
+
+    eq_(len(index), 9)
+    eq_([index.interval(node) for node in PreOrderIter(f)],
+        [(0, 9), (1, 6), (2, 3), (3, 6), (4, 5), (5, 6), (6, 9), (7, 9), (8, 9)])
+    eq_(index.is_ancestor(f, h), True)
+    eq_(index.is_ancestor(b, c), True)
+    eq_(index.is_ancestor(c, b), False)
+    eq_(index.is_ancestor(b, b), False)
+    eq_(index.is_ancestor(b, g), False)
+    eq_(index.is_ancestor(b, Node("z")), False)
+    eq_(index.subtree_size(f), 9)
+    eq_(index.subtree_size(d), 3)
+    eq_(index.subtree_size(h), 1)
+    eq_(index.subtree_slice(b), (b, a, d, c, e))
+    eq_(index.subtree_slice(f), tuple(PreOrderIter(f)))
+    eq_(index.depth(e), 3)
+    eq_(e in index, True)
+
+    # modifications
+    i.parent = None
+    eq_(len(index), 7)
+    eq_(i in index, False)
+    eq_(index.subtree_slice(g), (g,))
+    with assert_raises(TreeError, "%r is not part of the index." % h):
+        index.subtree_size(h)
+    i.parent = a
+    eq_(index.is_ancestor(b, h), True)
+    eq_(index.subtree_slice(b), (b, a, i, h, d, c, e))
+
+    # subtree index
+    index = EulerTourIndex(d)
+    eq_(index.subtree_slice(d), (d, c, e))
+    eq_(index.depth(e), 1)
+    c.parent = None
+    eq_(index.subtree_slice(d), (d, e))
+
+
+def test_version():
+    """Tree structure version."""
+    f = Node("f")
+    b = Node("b", parent=f)
+    a = Node("a", parent=b)
+    version = f._version
+    eq_(a._version, version)
+    a.name = "A"
+    eq_(f._version, version)
+    a.parent = None
+    assert f._version != version
+    assert a._version != f._version
+    version = f._version
+    a.parent = f
+    assert f._version != version
+    eq_(a._version, f._version)
+
+
+def test_search():
+    """Registered index is used by search."""
+    f = Node("f")
+    b = Node("b", parent=f)
+    a = Node("a", parent=b)
+    d = Node("d", parent=b)
+    c = Node("c", parent=d)
+    g = Node("g", parent=f)
+    index = EulerTourIndex(f).register()
+    eq_(f._indexes, (index,))
+    eq_(EulerTourIndex._lookup(c), index)
+    eq_(findall(b, lambda node: node.name in "acg"), (a, c))
+    eq_(findall(f, lambda node: node.name in "acg", maxlevel=3), (a, g))
+    eq_(findall(f, maxlevel=0), tuple())
+    eq_(findall(f, lambda node: node.name in "acg", stop=lambda node: node.name == "d"), (a, g))
+    c.parent = g
+    eq_(findall(b, lambda node: node.name in "acg"), (a,))
+    index.unregister()
+    eq_(f._indexes, tuple())
+    eq_(EulerTourIndex._lookup(c), None)
@@ -1,3 +1,9 @@
+import pickle
+import random
+
+from anytreePyt import BestFirstIter
+from anytreePyt import Cursor
+from anytreePyt import CursorError
 from anytreePyt import LevelGroupOrderIter
 from anytreePyt import LevelOrderGroupIter
 from anytreePyt import LevelOrderIter
@@ -7,6 +13,8 @@ from anytreePyt import PreOrderIter
 from anytreePyt import ZigZagGroupIter
 from nose.tools import eq_
 
+from helper import assert_raises
+
 
 def test_preorder():
     """PreOrderIter."""
@@ -159,3 +167,129 @@ def test_zigzaggroup():
     it = ZigZagGroupIter(f)
     eq_(next(it), (f, ))
     eq_(next(it), (g, b))
+
+
+def _checkpoint(iter_, resume, count):
+    """Iterate via cursor checkpoints of `count` nodes each."""
+    result = []
+    it = iter_
+    while True:
+        chunk = [node for _, node in zip(range(count), it)]
+        result += chunk
+        cursor = pickle.loads(pickle.dumps(it.cursor))
+        if not chunk:
+            eq_(cursor.done, True)
+            return result
+        it = resume(cursor)
+
+
+def test_cursor():
+    """Cursor."""
+    f = Node("f")
+    b = Node("b", parent=f)
+    a = Node("a", parent=b)
+    d = Node("d", parent=b)
+    c = Node("c", parent=d)
+    e = Node("e", parent=d)
+    g = Node("g", parent=f)
+    i = Node("i", parent=g)
+    h = Node("h", parent=i)
+
+    for cls in (PreOrderIter, PostOrderIter):
+        for kwargs in ({}, dict(maxlevel=3), dict(filter_=lambda n: n.name not in ('e', 'g')),
+                       dict(stop=lambda n: n.name == 'd')):
+            expected = list(cls(f, **kwargs))
+            for count in range(1, 10):
+                eq_(_checkpoint(cls(f, **kwargs), lambda cursor: cls.resume(f, cursor, **kwargs), count), expected)
+
+    it = PreOrderIter(f)
+    eq_(it.cursor, Cursor("PreOrderIter"))
+    eq_(next(it), f)
+    eq_(it.cursor, Cursor("PreOrderIter", ()))
+    eq_(next(it), b)
+    eq_(next(it), a)
+    eq_(it.cursor, Cursor("PreOrderIter", (0, 0)))
+    eq_(list(PreOrderIter.resume(b, Cursor("PreOrderIter", (1,)))), [c, e])
+    eq_(list(PreOrderIter.resume(f, Cursor("PreOrderIter", done=True))), [])
+    eq_(list(PostOrderIter.resume(f, Cursor("PostOrderIter", (1, 0)))), [g, f])
+    eq_(list(PostOrderIter.resume(f, Cursor("PostOrderIter", (1, 0, 0)))), [i, g, f])
+    eq_(list(PreOrderIter.resume(f, Cursor("PreOrderIter", (1, 0)))), [h])
+    eq_(PreOrderIter.resume(f, it.cursor).cursor, it.cursor)
+
+    msg = "Cannot resume PostOrderIter from Cursor('PreOrderIter', path=(0, 0), done=False)."
+    with assert_raises(CursorError, msg):
+        PostOrderIter.resume(f, it.cursor)
+    with assert_raises(CursorError, "LevelOrderIter does not support cursors."):
+        LevelOrderIter(f).cursor
+    with assert_raises(CursorError, "Cursor path (0, 5) does not fit to tree at %r." % b):
+        list(PreOrderIter.resume(f, Cursor("PreOrderIter", (0, 5))))
+
+
+def test_iter_chunks():
+    """Chunked iteration."""
+    f = Node("f")
+    b = Node("b", parent=f)
+    a = Node("a", parent=b)
+    d = Node("d", parent=b)
+    c = Node("c", parent=d)
+    e = Node("e", parent=d)
+    g = Node("g", parent=f)
+    i = Node("i", parent=g)
+    h = Node("h", parent=i)
+
+    eq_(list(PreOrderIter(f).iter_chunks(4)), [[f, b, a, d], [c, e, g, i], [h]])
+    eq_(list(PreOrderIter(f).iter_chunks(9)), [[f, b, a, d, c, e, g, i, h]])
+    eq_(list(PreOrderIter(f).iter_chunks(100)), [[f, b, a, d, c, e, g, i, h]])
+    eq_(list(PreOrderIter(f, maxlevel=0).iter_chunks(2)), [])
+    eq_(list(PostOrderIter(f, stop=lambda n: n.name == 'd').iter_chunks(2)), [[a, b], [h, i], [g, f]])
+    eq_(list(LevelOrderIter(f, filter_=lambda n: n.name not in ('e', 'g')).iter_chunks(5)),
+        [[f, b, a, d, i], [c, h]])
+    eq_(list(LevelOrderGroupIter(f).iter_chunks(3)), [[(f,), (b, g), (a, d, i)], [(c, e, h)]])
+
+    it = PreOrderIter(f)
+    chunks = it.iter_chunks(3)
+    eq_(next(chunks), [f, b, a])
+    eq_(list(PreOrderIter.resume(f, it.cursor)), [d, c, e, g, i, h])
+
+    with assert_raises(ValueError, "Chunk size must be at least 1, not 0."):
+        PreOrderIter(f).iter_chunks(0)
+
+
+def test_bestfirst():
+    """BestFirstIter."""
+    rand = random.Random(3)
+    root = Node("0", score=rand.random())
+    nodes = [root]
+    for idx in range(1, 500):
+        nodes.append(Node(str(idx), parent=rand.choice(nodes[-20:]), score=rand.random()))
+    for node in PostOrderIter(root):
+        node.best = max([node.score] + [child.best for child in node.children])
+    scored = []
+
+    def score(node):
+        scored.append(node)
+        return node.score
+
+    expected = sorted(nodes, key=lambda node: -node.score)
+    eq_(list(BestFirstIter(root, score)), expected)
+    eq_(len(scored), 500)
+    del scored[:]
+    eq_(list(BestFirstIter(root, score, bound=lambda node: node.best, k=10)), expected[:10])
+    assert len(scored) < 250, len(scored)
+    eq_(list(BestFirstIter(root, score, k=0)), [])
+    eq_(list(BestFirstIter(root, score, k=1000)), expected)
+
+    # filter_, stop, maxlevel
+    eq_(list(BestFirstIter(root, score, maxlevel=3, filter_=lambda node: node.score > 0.5)),
+        sorted([node for node in PreOrderIter(root, maxlevel=3) if node.score > 0.5], key=lambda node: -node.score))
+    stop = lambda node: node.name == "3"  # noqa
+    eq_(list(BestFirstIter(root, score, bound=lambda node: node.best, stop=stop)),
+        sorted(PreOrderIter(root, stop=stop), key=lambda node: -node.score))
+    eq_(list(BestFirstIter(root, lambda node: None)), [])
+
+    # equal scores are returned in visit order
+    f = Node("f", score=1)
+    b = Node("b", parent=f, score=1)
+    a = Node("a", parent=b, score=2)
+    g = Node("g", parent=f, score=1)
+    eq_(list(BestFirstIter(f, lambda node: node.score)), [a, f, b, g])
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import random
+
+from nose.tools import eq_
+
+from anytreePyt import Node
+from anytreePyt import PreOrderIter
+from anytreePyt import TreeError
+from anytreePyt import WalkError
+from anytreePyt import Walker
+from anytreePyt.index import LCAIndex
+from anytreePyt.util import batch_distance
+from anytreePyt.util import batch_lca
+from anytreePyt.util import commonancestors
+
+from helper import assert_raises
+
+
+def _lca(first, second):
+    ancestors = set(id(node) for node in first.path)
+    for node in reversed(second.path):
+        if id(node) in ancestors:
+            return node
+
+
+def test_lca():
+    """LCAIndex."""
+    for size in (1, 2, 3, 17, 64):
+        rnd = random.Random(size)
+        nodes = [Node("0")]
+        for idx in range(1, size):
+            nodes.append(Node(str(idx), parent=rnd.choice(nodes)))
+        index = LCAIndex(nodes[0])
+        for first in nodes:
+            for second in nodes:
+                eq_(index.lca(first, second), _lca(first, second))
+    eq_(index.lca(nodes[5]), nodes[5])
+    eq_(index.lca(*nodes), nodes[0])
+    with assert_raises(TreeError, "%r is not part of the index." % Node("x")):
+        index.lca(nodes[1], Node("x"))
+
+
+def test_lca_update():
+    """LCAIndex follows tree modifications."""
+    rnd = random.Random(0)
+    nodes = [Node("0")]
+    for idx in range(1, 40):
+        nodes.append(Node(str(idx), parent=rnd.choice(nodes)))
+    index = LCAIndex(nodes[0])
+    eq_(index.lca(nodes[10], nodes[30]), _lca(nodes[10], nodes[30]))
+    nodes[30].parent = nodes[10]
+    eq_(index.lca(nodes[10], nodes[30]), nodes[10])
+    leaf = Node("leaf", parent=nodes[20])
+    eq_(index.lca(leaf, nodes[30]), _lca(leaf, nodes[30]))
+
+
+def test_walker():
+    """Walker and commonancestors with registered LCAIndex."""
+    rnd = random.Random(0)
+    nodes = [Node("0")]
+    for idx in range(1, 50):
+        nodes.append(Node(str(idx), parent=rnd.choice(nodes)))
+    walker = Walker()
+    pairs = [(first, second) for first in nodes[::3] for second in nodes[::4]]
+    walks = [walker.walk(first, second) for first, second in pairs]
+    common = [commonancestors(first, second) for first, second in pairs]
+    common += [commonancestors(*nodes[idx:idx + 3]) for idx in range(48)]
+    index = LCAIndex(nodes[0]).register()
+    eq_([walker.walk(first, second) for first, second in pairs], walks)
+    indexed = [commonancestors(first, second) for first, second in pairs]
+    indexed += [commonancestors(*nodes[idx:idx + 3]) for idx in range(48)]
+    eq_(indexed, common)
+    eq_(commonancestors(nodes[7]), nodes[7].ancestors)
+    with assert_raises(WalkError, "%r and %r are not part of the same tree." % (nodes[3], Node("x"))):
+        walker.walk(nodes[3], Node("x"))
+    eq_(commonancestors(nodes[3], Node("x")), ())
+    # index at subtree
+    index.unregister()
+    sub = nodes[1]
+    LCAIndex(sub).register()
+    subnodes = list(PreOrderIter(sub))
+    for first in subnodes:
+        for second in subnodes:
+            eq_(commonancestors(first, second), commonancestors(*(first, second)[::-1]))
+            eq_(walker.walk(first, second)[1], _lca(first, second))
+
+
+def test_batch():
+    """batch_lca and batch_distance."""
+    rnd = random.Random(3)
+    nodes = [Node("0")]
+    for idx in range(1, 60):
+        nodes.append(Node(str(idx), parent=rnd.choice(nodes)))
+    other = [Node("x0")]
+    for idx in range(1, 10):
+        other.append(Node("x%d" % idx, parent=rnd.choice(other)))
+    pairs = [(rnd.choice(nodes), rnd.choice(nodes)) for _ in range(300)]
+    pairs += [(node, node) for node in nodes[::7]]
+    pairs += [(nodes[4], other[3]), (other[0], other[9]), (other[9], other[0])]
+    lcas = [_lca(first, second) if first.root is second.root else None for first, second in pairs]
+    eq_(batch_lca(pairs), tuple(lcas))
+    eq_(batch_distance(iter(pairs)), tuple([
+        None if lca is None else first.depth + second.depth - 2 * lca.depth
+        for (first, second), lca in zip(pairs, lcas)]))
+    eq_(batch_lca([]), ())
+    eq_(batch_distance([(nodes[0], nodes[0])]), (0,))
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import copy
+import pickle
+
 from nose.tools import eq_
 
 from helper import assert_raises
@@ -9,6 +12,8 @@ from anytreePyt import NodeMixin
 from anytreePyt import PostOrderIter
 from anytreePyt import PreOrderIter
 from anytreePyt import TreeError
+from anytreePyt import Walker
+from anytreePyt import WalkError
 
 
 def test_node_parent_error():
@@ -551,3 +556,92 @@ def test_node_slots():
     n = MyNode('foo')
     with assert_raises(AttributeError, "'MyNode' object has no attribute 'bar'"):
         n.bar = 4
+
+
+def test_copy():
+    """Copies keep attributes and tree relation."""
+    class MyNode(NodeMixin):
+        __slots__ = ('name', 'size')
+
+        def __init__(self, name, parent=None):
+            self.name = name
+            self.parent = parent
+
+    root = MyNode("root")
+    sub = MyNode("sub", parent=root)
+    sub.size = 3
+    duplicate = copy.deepcopy(root)
+    eq_(duplicate.name, "root")
+    eq_([(child.name, child.size, child.parent is duplicate) for child in duplicate.children], [("sub", 3, True)])
+    sub.parent = None
+    eq_(len(duplicate.children), 1)
+    root = Node("root", size=1)
+    Node("sub", parent=root)
+    duplicate = pickle.loads(pickle.dumps(root))
+    eq_((duplicate.name, duplicate.size, duplicate.children[0].name), ("root", 1, "sub"))
+    eq_(duplicate.children[0].parent, duplicate)
+
+
+def test_path_string():
+    """Path string."""
+    root = Node("root")
+    s0 = Node("sub0", parent=root)
+    s0a = Node("sub0A", parent=s0)
+    s1 = Node(1, parent=root)
+    eq_(s0a.path_string, "/root/sub0/sub0A")
+    eq_(s0a.path_string, "/root/sub0/sub0A")
+    eq_(s1.path_string, "/root/1")
+    s0.name = "renamed"
+    eq_(s0a.path_string, "/root/renamed/sub0A")
+    root.name = "top"
+    eq_(s0a.path_string, "/top/renamed/sub0A")
+    eq_(s0.path_string, "/top/renamed")
+    s0.parent = s1
+    eq_(s0a.path_string, "/top/1/renamed/sub0A")
+    s0.parent = None
+    eq_(s0a.path_string, "/renamed/sub0A")
+    eq_(repr(s0a).startswith("Node('/renamed/sub0A'"), True)
+    s0.parent = root
+    eq_(s0a.path_string, "/top/renamed/sub0A")
+
+
+def test_ancestor():
+    """Level ancestors via jump pointers."""
+    nodes = [Node("0")]
+    for idx in range(1, 300):
+        nodes.append(Node(str(idx), parent=nodes[(idx - 1) if idx % 5 else idx // 2]))
+    for node in nodes[::7]:
+        path = node.path
+        for depth in range(len(path)):
+            eq_(node.ancestor_at(depth), path[depth])
+            eq_(node.ancestor(depth), path[-1 - depth])
+        eq_(node.ancestor_at(len(path)), None)
+        eq_(node.ancestor(len(path)), None)
+    # common nodes with and without jump pointers
+    walker = Walker()
+    for first, second in zip(nodes[::3], nodes[::-5]):
+        common = [node for node, other in zip(first.path, second.path) if node is other][-1]
+        eq_(walker.walk(first, second)[1], common)
+        first.ancestor(1)
+        second.ancestor(1)
+        eq_(walker.walk(first, second)[1], common)
+    other = Node("x")
+    with assert_raises(WalkError, "%r and %r are not part of the same tree." % (nodes[4], other)):
+        walker.walk(nodes[4], other)
+    leaf = nodes[-1]
+    path = leaf.path
+    # attaching nodes
+    eq_(leaf.ancestor(3), path[-4])
+    Node("other", parent=Node("tree"))
+    Node("new", parent=path[2])
+    eq_(leaf.ancestor(3), path[-4])
+    # move a subtree
+    path[5].parent = nodes[3]
+    eq_([leaf.ancestor_at(depth) for depth in range(leaf.depth + 1)], list(leaf.path))
+    path[5].parent = None
+    eq_(leaf.ancestor_at(0), path[5])
+    eq_(leaf.ancestor(leaf.depth), path[5])
+    with assert_raises(ValueError, "Level -1 must not be negative."):
+        leaf.ancestor(-1)
+    with assert_raises(ValueError, "Depth -2 must not be negative."):
+        leaf.ancestor_at(-2)
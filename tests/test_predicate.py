@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+from nose.tools import eq_
+
+from anytreePyt import And
+from anytreePyt import AttrEq
+from anytreePyt import AttrIn
+from anytreePyt import AttrRange
+from anytreePyt import Node
+from anytreePyt import Not
+from anytreePyt import Or
+from anytreePyt import PreOrderIter
+from anytreePyt import findall
+
+
+def test_attreq():
+    """AttrEq."""
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=1)
+    a = Node("a", parent=b, size=7)
+    d = Node("d", parent=b, size="big")
+    Node("c", parent=d, size=5)
+    Node("e", parent=d)
+    Node("g", parent=f, size=9)
+    eq_(findall(f, filter_=AttrEq("name", "d")), (d,))
+    eq_(findall(f, filter_=AttrEq("size", 7)), (a,))
+    eq_(findall(f, filter_=AttrEq("foo", None)), tuple())
+    eq_(repr(AttrEq("name", "d")), "AttrEq('name', 'd')")
+
+
+def test_attrrange():
+    """AttrRange."""
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=1)
+    a = Node("a", parent=b, size=7)
+    d = Node("d", parent=b, size="big")
+    c = Node("c", parent=d, size=5)
+    Node("e", parent=d)
+    g = Node("g", parent=f, size=9)
+    eq_(findall(f, filter_=AttrRange("size", 3, 7)), (f, a, c))
+    eq_(findall(f, filter_=AttrRange("size", lower=6)), (a, g))
+    eq_(findall(f, filter_=AttrRange("size", upper=1)), (b,))
+    eq_(findall(f, filter_=AttrRange("size")), (f, b, a, d, c, g))
+    eq_(repr(AttrRange("size", 3)), "AttrRange('size', 3, None)")
+
+
+def test_attrin():
+    """AttrIn."""
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=1)
+    a = Node("a", parent=b, size=7)
+    d = Node("d", parent=b, size="big")
+    Node("c", parent=d, size=5)
+    e = Node("e", parent=d)
+    g = Node("g", parent=f, size=9)
+    eq_(findall(f, filter_=AttrIn("name", ["a", "e", "z"])), (a, e))
+    eq_(findall(f, filter_=AttrIn("size", [[1], 9])), (g,))
+    eq_(findall(f, filter_=AttrIn("size", [])), tuple())
+    eq_(repr(AttrIn("name", ["a"])), "AttrIn('name', ('a',))")
+
+
+def test_combinators():
+    """And, Or, Not."""
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=1)
+    a = Node("a", parent=b, size=7)
+    d = Node("d", parent=b, size="big")
+    c = Node("c", parent=d, size=5)
+    e = Node("e", parent=d)
+    Node("g", parent=f, size=9)
+    eq_(findall(f, filter_=And(AttrRange("size", 3), Not(AttrEq("name", "g")))), (f, a, c))
+    eq_(findall(f, filter_=AttrRange("size", 3) & ~AttrEq("name", "g")), (f, a, c))
+    eq_(findall(f, filter_=Or(AttrEq("name", "b"), AttrEq("size", 5))), (b, c))
+    eq_(findall(f, filter_=AttrEq("name", "b") | AttrEq("size", 5)), (b, c))
+    eq_(findall(f, filter_=AttrEq("name", "b") | (lambda node: node.name == "e")), (b, e))
+    eq_(repr(AttrEq("name", "b") & ~AttrEq("size", 5)), "And(AttrEq('name', 'b'), Not(AttrEq('size', 5)))")
+    eq_(repr(AttrEq("name", "b") | AttrEq("size", 5)), "Or(AttrEq('name', 'b'), AttrEq('size', 5))")
+
+
+def test_stop():
+    """Predicate as stop."""
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=1)
+    a = Node("a", parent=b, size=7)
+    d = Node("d", parent=b, size="big")
+    Node("c", parent=d, size=5)
+    Node("e", parent=d)
+    g = Node("g", parent=f, size=9)
+    eq_(list(PreOrderIter(f, stop=AttrEq("name", "d"))), [f, b, a, g])
+    eq_(list(PreOrderIter(f, filter_=AttrIn("name", "abc"), stop=AttrEq("name", "d"))), [b, a])
+
+
+def test_call():
+    """Predicates are callable."""
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=1)
+    Node("a", parent=b, size=7)
+    d = Node("d", parent=b, size="big")
+    Node("c", parent=d, size=5)
+    Node("e", parent=d)
+    Node("g", parent=f, size=9)
+    eq_(AttrEq("name", "f")(f), True)
+    eq_(AttrRange("size", 4)(f), False)
+    eq_(Not(AttrRange("size", 4))(f), True)
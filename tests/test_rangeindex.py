@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import random
+from decimal import Decimal
+
+from nose.tools import eq_
+
+from anytreePyt import AttrRange
+from anytreePyt import Node
+from anytreePyt import PreOrderIter
+from anytreePyt import findall
+from anytreePyt.index import RangeIndex
+
+
+def test_range():
+    """RangeIndex.range and count."""
+    f = Node("f", score=5)
+    b = Node("b", parent=f, score=2)
+    a = Node("a", parent=b, score=9)
+    d = Node("d", parent=b, score=4.5)
+    Node("c", parent=d, score="high")
+    e = Node("e", parent=d, score=4.5)
+    g = Node("g", parent=f, score=7)
+    i = Node("i", parent=g)
+    Node("h", parent=i, score=float("nan"))
+    index = RangeIndex(f, "score")
+    eq_(index.range(), (b, d, e, f, g, a))
+    eq_(index.range(4.5, 7), (d, e, f, g))
+    eq_(index.range(lower=5), (f, g, a))
+    eq_(index.range(upper=4.5), (b, d, e))
+    eq_(index.range(8, 3), ())
+    eq_(index.range(4.5, 7, node=b), (d, e))
+    eq_(index.range(node=d), (d, e))
+    eq_(index.range(node=i), ())
+    eq_(index.count(), 6)
+    eq_(index.count(4, 6), 3)
+    eq_(index.count(4, 6, node=b), 2)
+    eq_(index.count(node=g), 1)
+    eq_(repr(index), "RangeIndex(%r, 'score')" % f)
+
+
+def test_top():
+    """RangeIndex.top and bottom."""
+    f = Node("f", score=5)
+    b = Node("b", parent=f, score=2)
+    a = Node("a", parent=b, score=9)
+    d = Node("d", parent=b, score=4.5)
+    Node("c", parent=d, score="high")
+    e = Node("e", parent=d, score=4.5)
+    g = Node("g", parent=f, score=7)
+    i = Node("i", parent=g)
+    Node("h", parent=i, score=float("nan"))
+    index = RangeIndex(f, "score")
+    eq_(index.top(3), (a, g, f))
+    eq_(index.top(4, node=b), (a, d, e, b))
+    eq_(index.top(1, node=d), (d,))
+    eq_(index.top(10), (a, g, f, d, e, b))
+    eq_(index.bottom(2), (b, d))
+    eq_(index.bottom(2, node=d), (d, e))
+    eq_(index.bottom(0), ())
+
+
+def test_update():
+    """RangeIndex follows modifications."""
+    f = Node("f", score=5)
+    b = Node("b", parent=f, score=2)
+    Node("a", parent=b, score=9)
+    d = Node("d", parent=b, score=4.5)
+    c = Node("c", parent=d, score="high")
+    e = Node("e", parent=d, score=4.5)
+    g = Node("g", parent=f, score=7)
+    i = Node("i", parent=g)
+    Node("h", parent=i, score=float("nan"))
+    index = RangeIndex(f, "score")
+    eq_(index.range(4, 6), (d, e, f))
+    c.score = 6
+    eq_(index.range(4, 6), (d, e, f, c))
+    d.parent = g
+    eq_(index.range(4, 6, node=b), ())
+    eq_(index.range(4, 6, node=g), (d, e, c))
+
+
+def test_search():
+    """Registered RangeIndex is used by findall."""
+    f = Node("f", score=5)
+    b = Node("b", parent=f, score=2)
+    a = Node("a", parent=b, score=9)
+    d = Node("d", parent=b, score=4.5)
+    c = Node("c", parent=d, score="high")
+    e = Node("e", parent=d, score=4.5)
+    g = Node("g", parent=f, score=7)
+    i = Node("i", parent=g)
+    h = Node("h", parent=i, score=float("nan"))
+    RangeIndex(f, "score").register()
+    eq_(findall(f, AttrRange("score", 4, 7)), (f, d, e, g))
+    eq_(findall(b, AttrRange("score", 4, 7)), (d, e))
+    eq_(findall(f, AttrRange("score", 4, 7), maxlevel=3), (f, d, g))
+    eq_(findall(f, AttrRange("score")), (f, b, a, d, c, e, g, h))
+    eq_(findall(f, AttrRange("score", "a", "z")), (c,))
+    # values comparable to numbers, but not indexed
+    c.score = Decimal(6)
+    eq_(findall(f, AttrRange("score", 4, 7)), (f, d, c, e, g))
+    eq_(findall(b, AttrRange("score", lower=6)), (a, c))
+
+
+def test_random():
+    """RangeIndex against traversal."""
+    rand = random.Random(42)
+    nodes = [Node("0", score=0)]
+    for idx in range(1, 300):
+        score = rand.choice([rand.randint(0, 20), rand.random() * 20, None])
+        nodes.append(Node(str(idx), parent=rand.choice(nodes), score=score))
+    root = nodes[0]
+    index = RangeIndex(root, "score")
+    for _ in range(50):
+        node = rand.choice(nodes)
+        lower, upper = sorted([rand.randint(0, 20), rand.randint(0, 20)])
+        expected = findall(node, AttrRange("score", lower, upper))
+        eq_(index.range(lower, upper, node=node), tuple(sorted(expected, key=lambda n: n.score)))
+        eq_(index.count(lower, upper, node=node), len(expected))
+        k = rand.randint(1, 10)
+        scored = [n for n in PreOrderIter(node) if n.score is not None]
+        eq_([n.score for n in index.top(k, node=node)], sorted([n.score for n in scored], reverse=True)[:k])
+        eq_([n.score for n in index.bottom(k, node=node)], sorted([n.score for n in scored])[:k])
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+import copy
+import gc
+
 from nose.tools import eq_
 
 import anytreePyt as at
+from anytreePyt.index import ChildIndex
 
 from helper import assert_raises
 
@@ -58,16 +62,58 @@ def test_glob_cache():
     sub0 = at.Node("sub0", parent=root)
     sub1 = at.Node("sub1", parent=root)
     r = at.Resolver()
+    cache = at.Resolver.match_cache
+    maxsize = cache.maxsize
     # strip down cache size
-    at.resolver._MAXCACHE = 2
-    at.Resolver._match_cache.clear()
-    eq_(len(at.Resolver._match_cache), 0)
+    cache.maxsize = 2
+    cache.cache_clear()
+    eq_(cache.cache_info(), (0, 0, 2, 0))
     eq_(r.glob(root, "sub0"), [sub0])
-    eq_(len(at.Resolver._match_cache), 1)
-    eq_(r.glob(root, "sub1"), [sub1])
-    eq_(len(at.Resolver._match_cache), 2)
-    eq_(r.glob(root, "sub*"), [sub0, sub1])
-    eq_(len(at.Resolver._match_cache), 1)
+    eq_(cache.cache_info(), (0, 0, 2, 0))
+    eq_(r.glob(root, "sub0*"), [sub0])
+    eq_(r.glob(root, "sub1*"), [sub1])
+    eq_(r.glob(root, "sub0*"), [sub0])
+    eq_(cache.cache_info(), (1, 2, 2, 2))
+    # least recently used pattern is dropped
+    eq_(r.glob(root, "*"), [sub0, sub1])
+    eq_(r.glob(root, "sub0*"), [sub0])
+    eq_(r.glob(root, "sub1*"), [sub1])
+    eq_(cache.cache_info(), (2, 4, 2, 2))
+    cache.maxsize = maxsize
+
+
+def test_glob_many_patterns():
+    """Wildcard Cache with many patterns does not recompile."""
+    root = at.Node("root")
+    subs = [at.Node("sub%d" % idx, parent=root) for idx in range(100)]
+    r = at.Resolver()
+    cache = at.Resolver.match_cache
+    cache.cache_clear()
+    patterns = ["sub%d*" % idx for idx in range(100)] + ["s?b%d" % idx for idx in range(100)]
+    for _ in range(3):
+        for idx, pattern in enumerate(patterns):
+            eq_(subs[idx % 100] in r.glob(root, pattern), True)
+    eq_(cache.cache_info(), (400, 200, 256, 200))
+
+
+def test_matcher():
+    """Wildcard Matcher."""
+    for pat, name, match in [
+        ("sub0", "sub0", True),
+        ("sub0", "sub1", False),
+        ("sub*", "sub1", True),
+        ("sub*", "su", False),
+        ("*b1", "sub1", True),
+        ("*b1", "sub2", False),
+        ("*", "", True),
+        ("*", None, False),
+        ("*", 4, False),
+        ("s*b?", "sub0", True),
+        ("s*b?", "sub", False),
+        ("*u*", "sub\n", True),
+        ("s?b*", "s\nb", True),
+    ]:
+        eq_(at.Resolver.match_cache.get(pat)(name), match)
 
 
 def test_same_name():
@@ -78,3 +124,266 @@ def test_same_name():
     r = at.Resolver()
     eq_(r.get(root, "sub"), sub0)
     eq_(r.glob(root, "sub"), [sub0, sub1])
+
+
+def test_many_children():
+    """Many Children."""
+    root = at.Node("root")
+    subs = [at.Node("sub%d" % idx, parent=root) for idx in range(100)]
+    leaf = at.Node("leaf", parent=subs[50])
+    r = at.Resolver()
+    eq_(r.get(root, "sub50/leaf"), leaf)
+    index = ChildIndex(root).register()
+    eq_(r.get(root, "sub50/leaf"), leaf)
+    eq_(r.glob(root, "sub50/leaf"), [leaf])
+    subs[50].name = "renamed"
+    eq_(r.get(root, "renamed/leaf"), leaf)
+    with assert_raises(at.ChildResolverError, "%r has no child sub50. Children are: %s, ... (100 in total)." %
+                       (root, ", ".join(repr(sub.name) for sub in subs[:10]))):
+        r.get(root, "sub50")
+    # same name: first one in children order
+    subs[70].name = "sub60"
+    subs[20].name = "sub60"
+    eq_(r.get(root, "sub60"), subs[20])
+    eq_(r.glob(root, "sub60"), [subs[20], subs[60], subs[70]])
+    subs[20].parent = None
+    eq_(r.glob(root, "sub60"), [subs[60], subs[70]])
+    subs[20].parent = root
+    eq_(r.glob(root, "sub60"), [subs[60], subs[70], subs[20]])
+    del subs[60].name
+    eq_(r.get(root, "sub60"), subs[70])
+    eq_(r.get_many(root, ["sub60", "renamed/leaf"]), [subs[70], leaf])
+    eq_(r.longest_match(root, "sub60/x"), (subs[70], "x"))
+    root.children = [subs[20], subs[70]]
+    eq_(r.glob(root, "sub60"), [subs[20], subs[70]])
+    subs[1].parent = root
+    eq_(r.get(root, "sub1"), subs[1])
+    index.unregister()
+    subs[1].name = "sub2"
+    eq_(r.get(root, "sub2"), subs[1])
+
+
+def test_get_cache():
+    """Path Cache."""
+    top = at.Node("top")
+    sub0 = at.Node("sub0", parent=top)
+    sub0sub0 = at.Node("sub0sub0", parent=sub0)
+    sub1 = at.Node("sub1", parent=top)
+    r = at.Resolver(cachesize=2)
+    eq_(r.get(top, "/top/sub0/sub0sub0"), sub0sub0)
+    eq_(r.get(top, "/top/sub0/sub0sub0"), sub0sub0)
+    eq_(r.get(sub0sub0, "/top/sub0/sub0sub0"), sub0sub0)
+    eq_(r.cache_info(), (1, 2, 2, 2))
+    # least recently used entry is dropped
+    eq_(r.get(top, "sub1"), sub1)
+    eq_(r.get(sub0sub0, "/top/sub0/sub0sub0"), sub0sub0)
+    eq_(r.get(top, "/top/sub0/sub0sub0"), sub0sub0)
+    eq_(r.cache_info(), (2, 4, 2, 2))
+    # structural changes
+    sub0sub0.parent = sub1
+    with assert_raises(at.ChildResolverError, "%r has no child sub0sub0. Children are: ." % sub0):
+        r.get(top, "/top/sub0/sub0sub0")
+    eq_(r.get(top, "/top/sub1/sub0sub0"), sub0sub0)
+    eq_(r.get(top, "/top/sub1/sub0sub0"), sub0sub0)
+    # renames
+    sub1.name = "renamed"
+    eq_(r.get(top, "/top/renamed/sub0sub0"), sub0sub0)
+    with assert_raises(at.ChildResolverError, "%r has no child sub1. Children are: 'sub0', 'renamed'." % top):
+        r.get(top, "/top/sub1/sub0sub0")
+    eq_(r.cache_info(), (3, 8, 2, 1))
+    # renames in other trees
+    other = at.Node("other")
+    eq_(r.get(top, "/top/renamed/sub0sub0"), sub0sub0)
+    other.name = "renamed"
+    eq_(r.get(top, "/top/renamed/sub0sub0"), sub0sub0)
+    eq_(r.cache_info(), (5, 8, 2, 1))
+    r.cache_clear()
+    eq_(r.cache_info(), (0, 0, 2, 0))
+    eq_(at.Resolver().cache_info(), (0, 0, 0, 0))
+    # copies start empty and do not affect the original
+    eq_(r.get(top, "renamed"), sub1)
+    duplicate = copy.copy(r)
+    eq_(duplicate.cache_info(), (0, 0, 2, 0))
+    del duplicate
+    gc.collect()
+    sub1.name = "sub1"
+    eq_(r.try_get(top, "renamed"), None)
+    eq_(r.get(top, "sub1"), sub1)
+    # pathattr changes
+    r.pathattr = "other"
+    sub1.other = "x"
+    eq_(r.get(top, "x"), sub1)
+    eq_(r.cache_info(), (0, 1, 2, 1))
+    sub1.other = "y"
+    eq_(r.try_get(top, "x"), None)
+    r.cache_clear()
+
+
+def test_glob_duplicates():
+    """Wildcards with equally named children."""
+    top = at.Node("top")
+    sub0 = at.Node("sub0", parent=top)
+    at.Node("a", parent=sub0)
+    a1 = at.Node("a", parent=sub0)
+    b = at.Node("b", parent=a1)
+    sub1 = at.Node("sub1", parent=top)
+    r = at.Resolver()
+    eq_(r.glob(top, "*/a/b"), [b])
+    eq_(r.glob(top, "sub?/a/b"), [b])
+    eq_(r.glob(top, "sub0/*/b"), [b])
+    eq_(r.glob(top, "sub1/*"), [])
+    with assert_raises(at.ChildResolverError, "%r has no child a. Children are: ." % sub1):
+        r.glob(top, "sub1/a/*")
+
+
+def test_glob_recursive():
+    """Recursive Wildcard."""
+    top = at.Node("top")
+    sub0 = at.Node("sub0", parent=top)
+    sub0sub0 = at.Node("sub0", parent=sub0)
+    leaf0 = at.Node("leaf0", parent=sub0sub0)
+    sub0sub1 = at.Node("sub1", parent=sub0)
+    leaf1 = at.Node("leaf1", parent=sub0sub1)
+    other = at.Node("other", parent=sub0sub1)
+    sub1 = at.Node("sub1", parent=top)
+    leaf2 = at.Node("leaf2", parent=sub1)
+    r = at.Resolver()
+    eq_(r.glob(top, "/top/**/sub?/leaf*"), [leaf0, leaf1, leaf2])
+    eq_(r.glob(top, "**/sub1"), [sub0sub1, sub1])
+    eq_(r.glob(top, "**"), [top, sub0, sub0sub0, leaf0, sub0sub1, leaf1, other, sub1, leaf2])
+    eq_(r.glob(top, "sub0/**/leaf1"), [leaf1])
+    eq_(r.glob(top, "**/**/leaf0"), [leaf0])
+    eq_(r.glob(top, "**/missing"), [])
+    eq_(r.glob(top, "*/missing"), [])
+    eq_(r.glob(leaf2, "../../**/other"), [other])
+    eq_(r.glob(top, "**/sub1/.."), [sub0, top])
+    eq_(r.glob(top, "sub0/**/sub1/*"), [leaf1, other])
+
+    # lazy evaluation
+    found = r.iglob(top, "**/leaf*")
+    eq_(next(found), leaf0)
+    leaf1.parent = None
+    eq_(list(found), [leaf2])
+    with assert_raises(at.ChildResolverError, "%r has no child missing. Children are: 'sub0', 'sub1'." % top):
+        list(r.iglob(top, "missing/**"))
+
+
+def test_get_many():
+    """Get Many."""
+    top = at.Node("top")
+    sub0 = at.Node("sub0", parent=top)
+    sub0sub0 = at.Node("sub0sub0", parent=sub0)
+    sub0sub1 = at.Node("sub0sub1", parent=sub0)
+    sub1 = at.Node("sub1", parent=top)
+    r = at.Resolver()
+    paths = ["/top/sub0/sub0sub1", "sub0/sub0sub0", "/top/sub0", "/top/sub0/sub2/x", "../sub1", "",
+             "/bar", "/top/sub0/./sub0sub0", "/top/sub0/sub2", "/top/sub0/sub0sub1"]
+    results = r.get_many(sub0, paths)
+    eq_([results[idx] for idx in (0, 2, 4, 5, 7, 9)], [sub0sub1, sub0, sub1, sub0, sub0sub0, sub0sub1])
+    for idx in (1, 3, 6, 8):
+        try:
+            r.get(sub0, paths[idx])
+        except at.ResolverError as exc:
+            eq_((type(results[idx]), str(results[idx])), (type(exc), str(exc)))
+    eq_(results[3] is results[8], True)
+    eq_(r.get_many(top, iter(["sub0/sub0sub0", "sub1"])), [sub0sub0, sub1])
+    eq_(r.get_many(top, []), [])
+    # above the root node
+    results = r.get_many(top, ["../sub0", "..", "sub1", "../../x"])
+    eq_(results[1:3], [None, sub1])
+    for result in (results[0], results[3]):
+        eq_((type(result), str(result)), (at.ResolverError, "%r has no parent." % top))
+
+
+def test_try_get():
+    """Get without Errors."""
+    top = at.Node("top")
+    sub0 = at.Node("sub0", parent=top)
+    sub0sub0 = at.Node("sub0sub0", parent=sub0)
+    r = at.Resolver()
+    missing = object()
+    eq_(r.try_get(top, "sub0/sub0sub0"), sub0sub0)
+    eq_(r.try_get(sub0sub0, "/top/sub0"), sub0)
+    eq_(r.try_get(sub0sub0, ".."), sub0)
+    eq_(r.try_get(top, ".."), None)
+    for path in ("sub1", "sub0/sub1", "/", "/bar", "/top/sub1", "../sub0", "..", "../.."):
+        eq_(r.try_get(top, path, missing), missing)
+    r = at.Resolver(cachesize=4)
+    eq_(r.try_get(top, "sub0"), sub0)
+    eq_(r.try_get(top, "sub0"), sub0)
+    eq_(r.try_get(top, "sub1"), None)
+    eq_(r.get(top, "sub0"), sub0)
+    eq_(r.cache_info(), (2, 2, 4, 1))
+
+
+def test_child_error():
+    """Child error message."""
+    top = at.Node("top")
+    sub0 = at.Node("sub0", parent=top)
+    r = at.Resolver()
+    msg = "%r has no child sub1. Children are: 'sub0'." % top
+    try:
+        r.get(top, "sub1")
+    except at.ChildResolverError as exc:
+        sub0.name = "renamed"
+        eq_(str(exc), msg)
+        eq_(exc.args, (msg,))
+        eq_(exc.node, top)
+        eq_(exc.child, "sub1")
+        exc.args = ("other",)
+        eq_(str(exc), "other")
+
+
+def test_treepath():
+    """Parsed Paths."""
+    top = at.Node("top")
+    sub0 = at.Node("sub0", parent=top)
+    sub0sub0 = at.Node("sub0sub0", parent=sub0)
+    sub1 = at.Node("sub1", parent=top)
+    r = at.Resolver()
+    path = at.TreePath("/top/sub0//./sub0sub0")
+    eq_((path.absolute, path.root, path.parts), (True, "top", ("sub0", "sub0sub0")))
+    eq_((path.wildcards, path.is_wildcard), ((False, False), False))
+    eq_(str(path), "/top/sub0//./sub0sub0")
+    eq_(r.get(sub1, path), sub0sub0)
+    eq_(r.try_get(sub1, path), sub0sub0)
+    eq_(r.glob(sub1, path), [sub0sub0])
+    eq_(r.get_many(sub1, [path, "/top/sub1"]), [sub0sub0, sub1])
+    path = at.TreePath("../sub?")
+    eq_((path.absolute, path.root, path.parts, path.wildcards), (False, None, ("..", "sub?"), (False, True)))
+    eq_(r.glob(sub1, path), [sub0, sub1])
+    eq_(list(r.iglob(sub1, path)), [sub0, sub1])
+    eq_(r.get(sub0, at.TreePath(".")), sub0)
+    with assert_raises(at.ResolverError, "root node missing. root is '/top'."):
+        r.get(sub0, at.TreePath("/"))
+    with assert_raises(at.ResolverError, "unknown root node '/bar'. root is '/top'."):
+        r.get(sub0, at.TreePath("/bar/sub0"))
+    eq_(r.try_get(sub0, at.TreePath("/bar/sub0")), None)
+    # other separator
+    path = at.TreePath("|top|sub0", separator="|")
+    eq_(repr(path), "TreePath('|top|sub0', separator='|')")
+    eq_(r.get(top, at.TreePath("/top/sub0", separator="|")), sub0)
+    eq_(r.try_get(top, path), None)
+    cached = at.Resolver(cachesize=2)
+    path = at.TreePath("/top/sub1")
+    eq_(cached.get(top, path), sub1)
+    eq_(cached.get(top, path), sub1)
+    eq_(cached.cache_info().hits, 1)
+
+
+def test_longest_match():
+    """Longest Match."""
+    top = at.Node("top")
+    api = at.Node("api", parent=top)
+    users = at.Node("users", parent=api)
+    user = at.Node("42", parent=users)
+    r = at.Resolver()
+    eq_(r.longest_match(top, "/top/api/users/42"), (user, ""))
+    eq_(r.longest_match(top, "/top/api/users/43/avatar"), (users, "43/avatar"))
+    eq_(r.longest_match(top, "/top/api/./groups//1"), (api, "groups/1"))
+    eq_(r.longest_match(user, "../../x/.."), (api, "x/.."))
+    eq_(r.longest_match(api, "../.."), (top, ".."))
+    eq_(r.longest_match(api, ""), (api, ""))
+    eq_(r.longest_match(api, "/"), (None, ""))
+    eq_(r.longest_match(api, "/bar/api"), (None, "api"))
+    eq_(r.longest_match(top, at.TreePath("/top/api/v1")), (api, "v1"))
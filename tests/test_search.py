@@ -1,13 +1,27 @@
+import copy
+import gc
+import pickle
+import time
+import weakref
+
 from nose.tools import eq_
 
 from anytreePyt import AsciiStyle
 from anytreePyt import Node
+from anytreePyt import NodeMixin
 from anytreePyt import PreOrderIter
 from anytreePyt import RenderTree
 from anytreePyt import find
 from anytreePyt import find_by_attr
 from anytreePyt import findall, CountError
 from anytreePyt import findall_by_attr
+from anytreePyt import iterfind
+from anytreePyt import find_many_by_attr
+from anytreePyt import findall_multi
+from anytreePyt import AttrEq
+from anytreePyt import AttrRange
+from anytreePyt import MemoSearch
+from anytreePyt.index import AttrIndex
 from helper import assert_raises
 
 
@@ -26,7 +40,7 @@ def test_findall():
             "(Node('/f/b/d'), Node('/f/b/d/c'), Node('/f/b/d/e'))")):
         findall(f, filter_=lambda node: d in node.path, mincount=4)
     with assert_raises(CountError, (
-            "Expecting 2 elements at maximum, but found 3. "
+            "Expecting 2 elements at maximum, but found at least 3. "
             "(Node('/f/b/d'), Node('/f/b/d/c'), Node('/f/b/d/e'))")):
         findall(f, filter_=lambda node: d in node.path, maxcount=2)
 
@@ -57,8 +71,8 @@ def test_find():
     eq_(find(f, lambda n: n.name == "d"), d)
     eq_(find(f, lambda n: n.name == "z"), None)
     with assert_raises(CountError, (
-        "Expecting 1 elements at maximum, but found 5. "
-        "(Node('/f/b'), Node('/f/b/a'), Node('/f/b/d'), Node('/f/b/d/c'), Node('/f/b/d/e'))")):
+        "Expecting 1 elements at maximum, but found at least 2. "
+        "(Node('/f/b'), Node('/f/b/a'))")):
         find(f, lambda n: b in n.path)
 
 def test_find_by_attr():
@@ -75,3 +89,268 @@ def test_find_by_attr():
     eq_(find_by_attr(f, "d"), d)
     eq_(find_by_attr(f, name="foo", value=4), c)
     eq_(find_by_attr(f, name="foo", value=8), None)
+
+
+def test_iterfind():
+    f = Node("f")
+    b = Node("b", parent=f)
+    a = Node("a", parent=b)
+    d = Node("d", parent=b)
+    c = Node("c", parent=d)
+    visited = []
+
+    def filter_(node):
+        visited.append(node)
+        return node.name in ("b", "c")
+
+    matches = iterfind(f, filter_)
+    eq_(next(matches), b)
+    eq_(visited, [f, b])
+    eq_(list(matches), [c])
+    eq_(list(iterfind(f, maxlevel=2)), [f, b])
+    eq_(list(iterfind(f, stop=lambda node: node is d)), [f, b, a])
+
+
+def test_early_termination():
+    f = Node("f")
+    nodes = [Node(str(idx), parent=f) for idx in range(100)]
+    visited = []
+
+    def filter_(node):
+        visited.append(node)
+        return True
+
+    with assert_raises(CountError, "Expecting 1 elements at maximum, but found at least 2. (%r, %r)" % (f, nodes[0])):
+        find(f, filter_)
+    eq_(visited, [f, nodes[0]])
+    del visited[:]
+    eq_(findall(f, filter_, maxlevel=1, maxcount=1), (f,))
+    eq_(len(findall(f, filter_, maxcount=101)), 101)
+
+    with assert_raises(CountError, "Expecting at least 200 elements, but found 101. (%s, ...)" %
+                       ", ".join(repr(node) for node in [f] + nodes[:9])):
+        findall(f, mincount=200)
+    try:
+        findall(f, maxcount=50)
+    except CountError as exc:
+        eq_(exc.preview, tuple([f] + nodes[:9]))
+
+
+def test_find_many_by_attr():
+    f = Node("f")
+    b = Node("b", parent=f, uid=1)
+    a = Node("a", parent=b, uid=2)
+    d = Node("d", parent=b, uid=3)
+    c = Node("c", parent=d, uid=[4])
+    e = Node("e", parent=d, uid=5)
+
+    eq_(find_many_by_attr(f, ["b", "e", "z"]), {"b": b, "e": e, "z": None})
+    eq_(find_many_by_attr(f, []), {})
+    eq_(find_many_by_attr(f, [2, 5, 3], name="uid"), {2: a, 3: d, 5: e})
+    eq_(find_many_by_attr(f, [2, 5, 3], name="uid", maxlevel=3), {2: a, 3: d, 5: None})
+    eq_(find_many_by_attr(d, [1, 5], name="uid"), {1: None, 5: e})
+    e.uid = 2
+    with assert_raises(CountError, "Expecting 1 elements at maximum for 2, but found 2. (%r, %r)" % (a, e)):
+        find_many_by_attr(f, [2], name="uid")
+    c.uid = 7
+    index = AttrIndex(f, "uid").register()
+    eq_(find_many_by_attr(f, [1, 7, 3, 9], name="uid"), {1: b, 3: d, 7: c, 9: None})
+    eq_(find_many_by_attr(b, [1, 7, 3, 9], name="uid", maxlevel=2), {1: b, 3: d, 7: None, 9: None})
+    index.unregister()
+
+
+def test_findall_multi():
+    f = Node("f")
+    b = Node("b", parent=f)
+    a = Node("a", parent=b)
+    d = Node("d", parent=b)
+    c = Node("c", parent=d)
+    e = Node("e", parent=d)
+    visited = []
+
+    def leaf(node):
+        visited.append(node)
+        return node.is_leaf
+
+    eq_(findall_multi(f, {"leaf": leaf, "d": AttrEq("name", "d"), "none": lambda node: False}),
+        {"leaf": (a, c, e), "d": (d,), "none": ()})
+    eq_(visited, [f, b, a, d, c, e])
+    eq_(findall_multi(f, {"leaf": leaf}, maxlevel=3), {"leaf": (a,)})
+    eq_(findall_multi(f, {"leaf": leaf}, stop=AttrEq("name", "d")), {"leaf": (a,)})
+    eq_(findall_multi(f, {}), {})
+
+
+def _slow_filter(node):
+    time.sleep(0.001)
+    return node.name.endswith("7")
+
+
+def test_findall_parallel():
+    f = Node("f")
+    nodes = [f]
+    for idx in range(200):
+        nodes.append(Node(str(idx), parent=nodes[idx // 3]))
+    expected = findall(f, _slow_filter)
+    eq_(len(expected), 20)
+    eq_(findall(f, _slow_filter, workers=4), expected)
+    eq_(findall(f, _slow_filter, workers=4, executor="process"), expected)
+    eq_(findall(f, AttrEq("name", "17"), workers=2, executor="process"), (nodes[18],))
+    eq_(findall(f, _slow_filter, maxlevel=4, stop=AttrEq("name", "7"), workers=3),
+        findall(f, _slow_filter, maxlevel=4, stop=AttrEq("name", "7")))
+    eq_(findall(nodes[1], _slow_filter, workers=300), findall(nodes[1], _slow_filter))
+    with assert_raises(CountError, "Expecting 2 elements at maximum, but found at least 20. (%s, ...)" %
+                       ", ".join(repr(node) for node in expected[:10])):
+        findall(f, _slow_filter, workers=4, maxcount=2)
+    with assert_raises(ValueError, "Unknown executor 'fiber'. Use 'thread' or 'process'."):
+        findall(f, _slow_filter, workers=4, executor="fiber")
+
+
+def _is_root(node):
+    return node.is_root
+
+
+def _is_leaf(node):
+    return node.is_leaf
+
+
+class SlotNode(NodeMixin):
+
+    __slots__ = ("name", "size")
+
+    def __init__(self, name, size, parent=None):
+        self.name = name
+        self.size = size
+        self.parent = parent
+
+
+def _below_odd(node):
+    return node.parent is not None and node.parent.size % 2 == 1
+
+
+def test_findall_process():
+    """Process workers evaluate on a copy of the whole tree."""
+    chain = [Node("0", size=0)]
+    for idx in range(1, 600):
+        chain.append(Node(str(idx), parent=chain[-1], size=idx % 7))
+    expected = findall(chain[0], AttrEq("size", 3))
+    eq_(len(expected), 86)
+    eq_(findall(chain[0], AttrEq("size", 3), workers=2, executor="process"), expected)
+    eq_(findall(chain[0], _slow_filter, workers=2, executor="process"), findall(chain[0], _slow_filter))
+    eq_(findall(chain[0], _is_root, workers=2, executor="process"), (chain[0],))
+    eq_(findall(chain[5], _is_root, workers=2, executor="process"), ())
+    eq_(findall(chain[5], _below_odd, workers=2, executor="process"), findall(chain[5], _below_odd))
+    # nodes without __dict__
+    slotted = [SlotNode("0", 0)]
+    for idx in range(1, 100):
+        slotted.append(SlotNode(str(idx), idx % 5, parent=slotted[idx // 4]))
+    eq_(findall(slotted[0], _below_odd, workers=2, executor="process"), findall(slotted[0], _below_odd))
+
+
+def test_memosearch():
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=12)
+    a = Node("a", parent=b, size=7)
+    d = Node("d", parent=b, size=1)
+    c = Node("c", parent=d, size=9)
+    g = Node("g", parent=f)
+    calls = []
+
+    def leaf(node):
+        calls.append(node)
+        return node.is_leaf
+
+    memo = MemoSearch()
+    memo.add("leafs", leaf)
+    memo.add("big", AttrRange("size", lower=5) & ~AttrEq("name", "c"))
+    eq_(memo.findall(f, "leafs"), (a, c, g))
+    eq_(calls, [g, c, d, a, b, f])
+    del calls[:]
+    eq_(memo.findall(f, "leafs"), (a, c, g))
+    eq_(memo.findall(b, "leafs"), (a, c))
+    eq_(calls, [])
+
+    # only the changed path is evaluated again
+    e = Node("e", parent=d)
+    eq_(memo.findall(f, "leafs"), (a, c, e, g))
+    eq_(calls, [e, d, b, f])
+    del calls[:]
+    # results of detached nodes are dropped
+    d.parent = g
+    eq_(memo.findall(f, "leafs"), (a, c, e))
+    eq_(calls, [e, c, d, g, b, f])
+    del calls[:]
+    eq_(memo.findall(d, "leafs"), (c, e))
+    eq_(calls, [])
+
+    # watched attributes
+    eq_(memo.findall(f, "big"), (b, a))
+    a.size = 2
+    c.name = "x"
+    eq_(memo.findall(f, "big"), (b, c))
+    eq_(memo.findall(f, "leafs"), (a, c, e))
+    del calls[:]
+    a.size = 8
+    eq_(memo.findall(f, "leafs"), (a, c, e))
+    eq_(calls, [a, b, f])
+
+    eq_(memo.findall(f, "big", maxcount=3), (b, a, c))
+    with assert_raises(CountError, "Expecting at least 4 elements, but found 3. (%r, %r, %r)" % (b, a, c)):
+        memo.findall(f, "big", mincount=4)
+    memo.clear()
+    eq_(memo.findall(f, "big"), (b, a, c))
+    memo.remove("big")
+    with assert_raises(KeyError, "'big'"):
+        memo.findall(f, "big")
+
+
+def test_memosearch_detached():
+    """Detached nodes are not kept by memoized results."""
+    f = Node("f")
+    b = Node("b", parent=f)
+    leaf = Node("leaf", parent=b)
+    memo = MemoSearch()
+    memo.add("leafs", _is_leaf)
+    eq_(memo.findall(f, "leafs"), (leaf,))
+    ref = weakref.ref(leaf)
+    leaf.parent = None
+    del leaf
+    gc.collect()
+    eq_(ref(), None)
+    eq_(memo.findall(f, "leafs"), (b,))
+    # searched before attached
+    other = Node("other")
+    sub = Node("sub", parent=other)
+    eq_(memo.findall(other, "leafs"), (sub,))
+    other.parent = f
+    eq_(memo.findall(f, "leafs"), (b, sub))
+    ref = weakref.ref(sub)
+    sub.parent = None
+    del sub
+    gc.collect()
+    eq_(ref(), None)
+    eq_(memo.findall(f, "leafs"), (b, other))
+
+
+def test_memosearch_copy():
+    """Copies of memoized searches."""
+    f = Node("f", size=3)
+    b = Node("b", parent=f, size=12)
+    memo = MemoSearch()
+    memo.add("leafs", _is_leaf)
+    memo.add("big", AttrRange("size", lower=5))
+    eq_(memo.findall(f, "big"), (b,))
+    for duplicate in (copy.copy(memo), copy.deepcopy(memo), pickle.loads(pickle.dumps(memo))):
+        eq_(duplicate.findall(f, "big"), (b,))
+        eq_(duplicate.findall(f, "leafs"), (b,))
+    del duplicate
+    gc.collect()
+    # the original still follows assignments and attaches
+    f.size = 8
+    eq_(memo.findall(f, "big"), (f, b))
+    eq_(memo.findall(f, "leafs"), (b,))
+    c = Node("c", parent=b, size=6)
+    eq_(memo.findall(f, "big"), (f, b, c))
+    eq_(memo.findall(f, "leafs"), (c,))
+    memo.remove("big")
+    f.size = 1
+    eq_(memo.findall(f, "leafs"), (c,))
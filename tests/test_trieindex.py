@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+from nose.tools import eq_
+
+from anytreePyt import Node
+from anytreePyt.index import TrieIndex
+
+
+def test_prefix():
+    """TrieIndex prefix lookup."""
+    root = Node("root")
+    sub = Node("sub", parent=root)
+    subway = Node("subway", parent=root)
+    submarine = Node("submarine", parent=sub)
+    bus = Node("bus", parent=sub)
+    sub2 = Node("sub", parent=bus, size=3)
+    Node(4, parent=root)
+    index = TrieIndex(root)
+    eq_(index.prefix("sub"), (sub, sub2, submarine, subway))
+    eq_(index.prefix("sub", limit=3), (sub, sub2, submarine))
+    eq_(index.prefix("subw"), (subway,))
+    eq_(index.prefix("x"), tuple())
+    eq_(index.prefix(""), (bus, root, sub, sub2, submarine, subway))
+    eq_(TrieIndex(bus).prefix("s"), (sub2,))
+    eq_(repr(TrieIndex(root, "size")), "TrieIndex(%r, 'size')" % root)
+
+
+def test_longest_prefix():
+    """TrieIndex longest-prefix lookup."""
+    root = Node("root")
+    sub = Node("sub", parent=root)
+    subway = Node("subway", parent=root)
+    Node("submarine", parent=sub)
+    bus = Node("bus", parent=sub)
+    sub2 = Node("sub", parent=bus, size=3)
+    Node(4, parent=root)
+    index = TrieIndex(root)
+    eq_(index.longest_prefix("subway/line"), (subway,))
+    eq_(index.longest_prefix("subwa"), (sub, sub2))
+    eq_(index.longest_prefix("su"), tuple())
+    eq_(index.longest_prefix(""), tuple())
+
+
+def test_fuzzy():
+    """TrieIndex edit-distance lookup."""
+    root = Node("root")
+    sub = Node("sub", parent=root)
+    subway = Node("subway", parent=root)
+    submarine = Node("submarine", parent=sub)
+    bus = Node("bus", parent=sub)
+    sub2 = Node("sub", parent=bus, size=3)
+    Node(4, parent=root)
+    index = TrieIndex(root)
+    eq_(index.fuzzy("sub", 0), (sub, sub2))
+    eq_(index.fuzzy("sbu", 1), tuple())
+    eq_(index.fuzzy("sbu", 2), (bus, sub, sub2))
+    eq_(index.fuzzy("subwy", 1), (subway,))
+    eq_(index.fuzzy("submarines", 1), (submarine,))
+    eq_(index.fuzzy("", 3), (bus, sub, sub2))
+
+
+def test_unregistered():
+    """Unregistered TrieIndex is rebuilt on changes."""
+    root = Node("root")
+    sub = Node("sub", parent=root)
+    subway = Node("subway", parent=root)
+    submarine = Node("submarine", parent=sub)
+    bus = Node("bus", parent=sub)
+    sub2 = Node("sub", parent=bus, size=3)
+    Node(4, parent=root)
+    index = TrieIndex(root)
+    eq_(index.prefix("sub"), (sub, sub2, submarine, subway))
+    bus.parent = None
+    eq_(index.prefix("sub"), (sub, submarine, subway))
+    subway.name = "metro"
+    eq_(index.prefix("sub"), (sub, submarine))
+    eq_(index.prefix("m"), (subway,))
+
+
+def test_registered():
+    """Registered TrieIndex is maintained on attach, detach and rename."""
+    root = Node("root")
+    sub = Node("sub", parent=root)
+    subway = Node("subway", parent=root)
+    submarine = Node("submarine", parent=sub)
+    bus = Node("bus", parent=sub)
+    sub2 = Node("sub", parent=bus, size=3)
+    Node(4, parent=root)
+    index = TrieIndex(root).register()
+    eq_(index.prefix("sub"), (sub, sub2, submarine, subway))
+    bus.parent = None
+    eq_(index.prefix("sub"), (sub, submarine, subway))
+    eq_(index.prefix("b"), tuple())
+    bus.parent = subway
+    eq_(index.prefix("sub"), (sub, sub2, submarine, subway))
+    submarine.name = "boat"
+    eq_(index.prefix("sub"), (sub, sub2, subway))
+    eq_(index.prefix("b"), (submarine, bus))
+    del submarine.name
+    eq_(index.prefix("b"), (bus,))
+    eq_(index.fuzzy("boat", 1), tuple())
+    Node("subway", parent=bus)
+    eq_(len(index.longest_prefix("subway")), 2)
+    index.unregister()
+    submarine.name = "sub"
+    eq_(index.prefix("sub"), (sub, submarine, sub2, subway, subway.children[0].children[1]))